@@ -1,5 +1,6 @@
 # advanced_quest.py
 import pygame
+from resources import get_font, render_text
 
 class Quest:
     def __init__(self, quest_id, description, objectives=None, rewards=None, prerequisites=None):
@@ -75,18 +76,18 @@ class AdvancedQuestLog:
             print(f"Quest {quest_id} marked as completed!")
 
     def draw(self, screen):
-        font = pygame.font.Font(None, 20)
+        font = get_font(None, 20)
         y = 10
         panel = pygame.Surface((280,200), pygame.SRCALPHA)
         panel.fill((0,0,0,180))
         pygame.draw.rect(panel, (255,255,255), panel.get_rect(), 2)
         screen.blit(panel, (500,10))
         for quest in self.quests.values():
-            quest_text = font.render(f"{quest.quest_id}: {quest.description} [{quest.status}]", True, (255,255,255))
+            quest_text = render_text(font, f"{quest.quest_id}: {quest.description} [{quest.status}]", True, (255,255,255))
             screen.blit(quest_text, (510, y))
             y += 20
             for obj in quest.objectives:
-                obj_text = font.render(f"   {obj['desc']}: {obj['progress']}/{obj['goal']}", True, (200,200,200))
+                obj_text = render_text(font, f"   {obj['desc']}: {obj['progress']}/{obj['goal']}", True, (200,200,200))
                 screen.blit(obj_text, (530, y))
                 y += 18
             y += 5
@@ -0,0 +1,305 @@
+# asset_build.py
+"""
+Incremental, parallel build of generated assets.
+
+generate_assets.py declares its outputs as AssetTargets: a name, an output file and the
+function (plus arguments) that draws it. Every target gets a content hash covering the source
+of its generator and of every project function that generator calls, its arguments, the hashes
+of the targets it depends on and the build environment (seed, NumPy availability, ...).
+build() compares those hashes with the manifest written by the previous build, skips targets
+that are unchanged and still on disk, and renders the rest in a process pool, starting each
+target as soon as its dependencies are done. The manifest (assets/data/asset_manifest.json):
+
+    {"version": 1, "environment": {...},
+     "targets": {name: {"path", "hash", "size", "sha256"}}}
+
+is rewritten after every build and read back by resources.generated_asset().
+"""
+import hashlib
+import inspect
+import io
+import json
+import logging
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_PATH = os.path.join("assets", "data", "asset_manifest.json")
+_CONSTANT_TYPES = (bool, int, float, str, bytes, tuple, frozenset) # Globals hashed by value
+
+
+class AssetTarget:
+    """
+    One generated asset file.
+
+    Attributes:
+        name:      Unique target name (e.g., "tree").
+        output:    Path of the file to write, relative to the repository root.
+        generator: Module-level function returning the pygame.Surface to save.
+        args:      Positional arguments for the generator; part of the target hash.
+        deps:      Names of targets that must be built before this one.
+    """
+    def __init__(self, name: str, output: str, generator, args: tuple = (), deps: tuple = ()):
+        self.name = name
+        self.output = output
+        self.generator = generator
+        self.args = tuple(args)
+        self.deps = tuple(deps)
+
+    def __repr__(self):
+        return f"AssetTarget({self.name!r}, {self.output!r})"
+
+
+def _referenced_names(code):
+    """
+    Yields the global and attribute names used by a code object and the code objects nested in it.
+    """
+    yield from code.co_names
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            yield from _referenced_names(const)
+
+
+def source_closure(func, root: str = ".") -> dict[str, str]:
+    """
+    Collects the source of a function and of every function it calls that is defined under root,
+    plus the values of the module-level constants (numbers, strings, tuples, ...) they read.
+
+    Calls are found by name through the function's globals, so library functions (pygame, the
+    standard library) are not followed; their behaviour belongs in the build environment.
+
+    Returns:
+        {qualified name: source code or repr of the constant}
+    """
+    root = os.path.abspath(root)
+    sources = {}
+    stack = [func]
+    while stack:
+        func = inspect.unwrap(stack.pop()) # Look through functools wrappers such as lru_cache
+        key = f"{func.__module__}.{func.__qualname__}"
+        if key in sources:
+            continue
+        sources[key] = inspect.getsource(func)
+        for name in _referenced_names(func.__code__):
+            value = func.__globals__.get(name)
+            if isinstance(value, _CONSTANT_TYPES):
+                sources[f"{func.__module__}.{name}"] = repr(value)
+                continue
+            if value is None or not inspect.isfunction(inspect.unwrap(value)):
+                continue
+            source_file = inspect.getsourcefile(inspect.unwrap(value))
+            if source_file and os.path.abspath(source_file).startswith(root + os.sep):
+                stack.append(value)
+    return sources
+
+
+def target_hashes(targets: list[AssetTarget], environment: dict, root: str = ".") -> dict[str, str]:
+    """
+    Computes the content hash of every target, in dependency order.
+
+    Raises:
+        ValueError: On unknown or cyclic dependencies.
+    """
+    hashes = {}
+    for target in _topological_order(targets):
+        digest = hashlib.sha256()
+        digest.update(json.dumps({
+            "name": target.name,
+            "output": target.output,
+            "args": repr(target.args),
+            "environment": environment,
+            "deps": {dep: hashes[dep] for dep in target.deps},
+        }, sort_keys=True).encode("utf-8"))
+        for name, source in sorted(source_closure(target.generator, root).items()):
+            digest.update(name.encode("utf-8"))
+            digest.update(source.encode("utf-8"))
+        hashes[target.name] = digest.hexdigest()
+    return hashes
+
+
+def _topological_order(targets: list[AssetTarget]) -> list[AssetTarget]:
+    """
+    Returns the targets ordered so that every target comes after its dependencies.
+    """
+    by_name = {target.name: target for target in targets}
+    order, state = [], {} # state: name -> "visiting" | "done"
+
+    def visit(target, chain):
+        if state.get(target.name) == "done":
+            return
+        if state.get(target.name) == "visiting":
+            raise ValueError(f"Dependency cycle: {' -> '.join(chain + [target.name])}")
+        state[target.name] = "visiting"
+        for dep in target.deps:
+            if dep not in by_name:
+                raise ValueError(f"Target {target.name!r} depends on unknown target {dep!r}")
+            visit(by_name[dep], chain + [target.name])
+        state[target.name] = "done"
+        order.append(target)
+
+    for target in targets:
+        visit(target, [])
+    return order
+
+
+def load_manifest(path: str = DEFAULT_MANIFEST_PATH) -> dict:
+    """
+    Reads a build manifest, returning an empty one if it is missing, unreadable or outdated.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "environment": {}, "targets": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "environment": {}, "targets": {}}
+    return manifest
+
+
+def _file_sha256(path: str) -> str | None:
+    """
+    Returns the hex SHA-256 of a file, or None if it cannot be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _is_up_to_date(target: AssetTarget, target_hash: str, entry: dict | None, root: str) -> bool:
+    """
+    Returns True if the manifest entry matches the target hash and the output is unmodified on disk.
+    """
+    if entry is None or entry.get("hash") != target_hash:
+        return False
+    return _file_sha256(os.path.join(root, target.output)) == entry.get("sha256")
+
+
+def _init_worker():
+    """
+    Process pool initializer: generators need pygame's font module, not a display.
+    """
+    pygame.init()
+
+
+def render_target(target: AssetTarget, seed: str, root: str = ".") -> dict:
+    """
+    Draws one target and writes its output file. Runs in a worker process.
+
+    The global random module is reseeded per target, so the image does not depend on which
+    other targets were built before it in the same process.
+
+    Returns:
+        The target's manifest entry without its hash: {"path", "size", "sha256"}.
+    """
+    random.seed(seed)
+    surface = target.generator(*target.args)
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, os.path.basename(target.output)) # Name hints the format
+    data = buffer.getvalue()
+
+    path = os.path.join(root, target.output)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path) # An interrupted build never leaves a truncated image behind
+    return {"path": target.output.replace(os.sep, "/"), "size": list(surface.get_size()), "sha256": hashlib.sha256(data).hexdigest()}
+
+
+def build(targets: list[AssetTarget], environment: dict, only: list[str] | None = None, force: bool = False,
+          jobs: int | None = None, root: str = ".", manifest_path: str = DEFAULT_MANIFEST_PATH) -> dict:
+    """
+    Builds the targets that changed since the last build and rewrites the manifest.
+
+    Args:
+        targets:       Every target of the project.
+        environment:   JSON-serializable build settings that affect every output (seed, library versions, ...).
+        only:          Names of the targets to build (with their dependencies); all if None.
+        force:         Rebuild even if a target is up to date.
+        jobs:          Number of worker processes; 1 builds in this process, None uses every CPU.
+        root:          Repository root the outputs are relative to.
+        manifest_path: Manifest file, relative to root.
+
+    Returns:
+        {"built": [names], "skipped": [names]}
+    """
+    by_name = {target.name: target for target in targets}
+    hashes = target_hashes(targets, environment, root)
+    manifest = load_manifest(os.path.join(root, manifest_path))
+    old_entries = manifest["targets"]
+
+    wanted = set(by_name) if only is None else set()
+    pending = list(only or [])
+    while pending: # Requested targets pull in their dependencies
+        name = pending.pop()
+        if name not in by_name:
+            raise ValueError(f"Unknown asset target {name!r}")
+        if name not in wanted:
+            wanted.add(name)
+            pending.extend(by_name[name].deps)
+
+    entries = {name: entry for name, entry in old_entries.items() if name in by_name} # Drop removed targets
+    stale = set()
+    for target in _topological_order([by_name[name] for name in wanted]):
+        dep_rebuilt = any(dep in stale for dep in target.deps)
+        if force or dep_rebuilt or not _is_up_to_date(target, hashes[target.name], old_entries.get(target.name), root):
+            stale.add(target.name)
+    skipped = sorted(wanted - stale)
+    logger.info(f"{len(stale)} of {len(wanted)} asset targets out of date")
+
+    def finish(name, entry):
+        entries[name] = {**entry, "hash": hashes[name]}
+        logger.info(f"Built {name} -> {entry['path']}")
+
+    built = []
+    try:
+        _render(stale, by_name, environment, jobs, root, finish, built)
+    finally: # Record whatever was built, even if a generator failed
+        _write_manifest(os.path.join(root, manifest_path), environment, entries)
+    return {"built": built, "skipped": skipped}
+
+
+def _render(stale: set, by_name: dict, environment: dict, jobs: int | None, root: str, finish, built: list):
+    """
+    Renders the stale targets, in this process or a process pool, calling finish(name, entry) for each.
+    """
+    if jobs == 1 or len(stale) <= 1:
+        _init_worker()
+        for target in _topological_order([by_name[name] for name in stale]):
+            finish(target.name, render_target(target, f"{environment.get('seed')}:{target.name}", root))
+            built.append(target.name)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+            waiting = set(stale)
+            running = {}
+            while waiting or running:
+                for name in sorted(waiting):
+                    if not any(dep in waiting or dep in running.values() for dep in by_name[name].deps):
+                        target = by_name[name]
+                        running[executor.submit(render_target, target, f"{environment.get('seed')}:{name}", root)] = name
+                        waiting.discard(name)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    finish(name, future.result()) # Re-raises a generator's exception
+                    built.append(name)
+
+
+def _write_manifest(path: str, environment: dict, entries: dict):
+    """
+    Writes the build manifest atomically.
+    """
+    manifest = {"version": MANIFEST_VERSION, "environment": environment, "targets": dict(sorted(entries.items()))}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
@@ -0,0 +1,211 @@
+# asset_effects.py
+"""
+Texture effects used by generate_assets.py: pixel noise, radial and vertical gradients.
+
+Each effect has a vectorized implementation working on whole pixel arrays through
+pygame.surfarray and NumPy, and a per-pixel fallback used when NumPy is not installed
+(and, for the radial gradient, by default, since its drawing loop is already cheap).
+All randomness comes from an explicit seed, so the same seed always gives the same image
+(the two implementations draw different random sequences, so their noise differs).
+"""
+import random
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; the per-pixel fallbacks are used without it
+    np = None
+
+NOISE_OFFSET = 10 # Noise shifts a pixel's RGB channels by up to this much in either direction
+
+
+def has_numpy() -> bool:
+    """
+    Returns True if the vectorized implementations are available.
+    """
+    return np is not None
+
+
+def _new_seed() -> int:
+    """
+    Draws a seed from the global random module, so effects are reproducible after random.seed().
+    """
+    return random.getrandbits(32)
+
+
+def add_pixel_noise(surf: pygame.Surface, intensity: int = 20, seed: int | None = None, vectorized: bool | None = None) -> pygame.Surface:
+    """
+    Adds subtle pixel noise to a Surface for texture, in place.
+
+    width * height // intensity random pixels (picked with replacement) get their RGB channels
+    shifted by a random offset in [-NOISE_OFFSET, NOISE_OFFSET]; alpha is left alone.
+
+    Args:
+        surf:       Surface to modify.
+        intensity:  Higher values touch fewer pixels.
+        seed:       Seed of the noise; drawn from the global random module if None.
+        vectorized: Force (True) or avoid (False) the NumPy path; by default it is used when available.
+
+    Returns:
+        The same Surface, for chaining.
+    """
+    seed = _new_seed() if seed is None else seed
+    if vectorized is None:
+        vectorized = has_numpy()
+    if vectorized:
+        return _add_pixel_noise_numpy(surf, intensity, seed)
+    return _add_pixel_noise_loop(surf, intensity, seed)
+
+
+def _add_pixel_noise_loop(surf: pygame.Surface, intensity: int, seed: int) -> pygame.Surface:
+    """
+    Per-pixel noise with get_at()/set_at(), the original implementation.
+    """
+    rng = random.Random(seed)
+    width, height = surf.get_size()
+    for _ in range(width * height // intensity):
+        x = rng.randint(0, width-1)
+        y = rng.randint(0, height-1)
+        color = surf.get_at((x,y))
+        offset = rng.randint(-NOISE_OFFSET, NOISE_OFFSET)
+        noisy_color = (
+            max(0, min(255, color[0] + offset)),
+            max(0, min(255, color[1] + offset)),
+            max(0, min(255, color[2] + offset)),
+            color[3]
+        )
+        surf.set_at((x,y), noisy_color)
+    return surf
+
+
+def _add_pixel_noise_numpy(surf: pygame.Surface, intensity: int, seed: int) -> pygame.Surface:
+    """
+    The same noise computed on the whole pixel array at once.
+
+    Offsets of pixels picked more than once are summed before clamping, where the loop clamps
+    after every pick; the difference only shows on channels pushed past 0 or 255.
+    """
+    rng = np.random.default_rng(seed)
+    width, height = surf.get_size()
+    count = width * height // intensity
+    xs = rng.integers(0, width, count)
+    ys = rng.integers(0, height, count)
+    offsets = rng.integers(-NOISE_OFFSET, NOISE_OFFSET + 1, count)
+
+    total = np.zeros((width, height), dtype=np.int32)
+    np.add.at(total, (xs, ys), offsets) # Accumulates repeated picks, unlike total[xs, ys] += offsets
+    touched = np.zeros((width, height), dtype=bool)
+    touched[xs, ys] = True
+
+    pixels = pygame.surfarray.pixels3d(surf) # Locks the surface; writes go straight to its pixels
+    rgb = pixels[touched].astype(np.int32) + total[touched][:, None]
+    pixels[touched] = np.clip(rgb, 0, 255).astype(np.uint8)
+    del pixels # Unlock
+    return surf
+
+
+def generate_gradient_circle(radius: int, color_center, color_edge, vectorized: bool | None = None) -> pygame.Surface:
+    """
+    Generate a circular Surface with a radial gradient.
+
+    Args:
+        radius:       Circle radius in pixels; the Surface is 2 * radius square.
+        color_center: RGB color at the center.
+        color_edge:   RGB color at the rim.
+        vectorized:   Use the NumPy path. By default the circle loop is used: it makes only
+                      `radius` pygame.draw.circle calls, which beats the array version at sprite sizes.
+
+    Returns:
+        An SRCALPHA Surface, transparent outside the circle.
+    """
+    if vectorized and has_numpy():
+        return _gradient_circle_numpy(radius, color_center, color_edge)
+    return _gradient_circle_loop(radius, color_center, color_edge)
+
+
+def _gradient_circle_loop(radius: int, color_center, color_edge) -> pygame.Surface:
+    """
+    Draws one filled circle per radius step, from the rim inwards. The original implementation.
+    """
+    size = radius * 2
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    for r in range(radius, 0, -1):
+        t = r / radius  # 1 at center, 0 at edge
+        color = (
+            int(color_center[0]*t + color_edge[0]*(1-t)),
+            int(color_center[1]*t + color_edge[1]*(1-t)),
+            int(color_center[2]*t + color_edge[2]*(1-t)),
+            255
+        )
+        pygame.draw.circle(surf, color, (radius, radius), r)
+    return surf
+
+
+def _gradient_circle_numpy(radius: int, color_center, color_edge) -> pygame.Surface:
+    """
+    Computes the gradient from every pixel's distance to the center in one pass.
+
+    Each pixel takes the color of the innermost one-pixel ring it falls in, matching the
+    stacked circles of the loop up to pygame's circle rasterization at the ring borders.
+    """
+    size = radius * 2
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    centers = np.arange(size) + 0.5 - radius # Pixel centers relative to the circle center
+    distance = np.hypot(centers[:, None], centers[None, :])
+    ring = np.maximum(np.ceil(distance), 1) # Radius of the smallest circle covering the pixel
+    t = (ring / radius)[..., None] # As in the loop: 1 at the outermost ring, towards 0 inwards
+    rgb = (np.asarray(color_center, dtype=np.float64)[:3] * t + np.asarray(color_edge, dtype=np.float64)[:3] * (1 - t)).astype(np.uint8)
+    inside = ring <= radius
+    rgb[~inside] = 0 # Outside pixels stay transparent black
+
+    pygame.surfarray.blit_array(surf, rgb) # Whole-array copies instead of masked writes
+    alpha = pygame.surfarray.pixels_alpha(surf)
+    alpha[:] = inside * np.uint8(255)
+    del alpha
+    return surf
+
+
+def vertical_gradient(size: tuple[int, int], top_color, bottom_color, stripe_colors=None, flags: int = 0, vectorized: bool | None = None) -> pygame.Surface:
+    """
+    Creates a Surface filled with a top-to-bottom linear gradient.
+
+    Row y gets int(top * (1 - t) + bottom * t) with t = y / height. With stripe_colors
+    (a (top, bottom) pair), odd rows use that second gradient instead, giving fine bands.
+
+    Args:
+        size:          (width, height) of the Surface.
+        top_color:     RGB color of the first row.
+        bottom_color:  RGB color the gradient runs towards at the bottom.
+        stripe_colors: Optional (top, bottom) colors of a second gradient used on odd rows.
+        flags:         Surface flags, e.g. pygame.SRCALPHA (alpha is set to opaque).
+        vectorized:    Force (True) or avoid (False) the NumPy path; by default it is used when available.
+
+    Returns:
+        The new Surface.
+    """
+    if vectorized is None:
+        vectorized = has_numpy()
+    width, height = size
+    surf = pygame.Surface(size, flags)
+    if flags & pygame.SRCALPHA:
+        surf.fill((0, 0, 0, 255))
+
+    if not vectorized:
+        for y in range(height):
+            t = y / height
+            top, bottom = (top_color, bottom_color) if stripe_colors is None or y % 2 == 0 else stripe_colors
+            color = tuple(int(top[i]*(1-t) + bottom[i]*t) for i in range(3))
+            pygame.draw.line(surf, color, (0, y), (width, y), 1)
+        return surf
+
+    t = (np.arange(height) / height)[:, None]
+    rows = (np.asarray(top_color[:3], dtype=np.float64) * (1 - t) + np.asarray(bottom_color[:3], dtype=np.float64) * t).astype(np.uint8)
+    if stripe_colors is not None:
+        stripe_top, stripe_bottom = stripe_colors
+        stripes = (np.asarray(stripe_top[:3], dtype=np.float64) * (1 - t) + np.asarray(stripe_bottom[:3], dtype=np.float64) * t).astype(np.uint8)
+        rows[1::2] = stripes[1::2]
+    pixels = pygame.surfarray.pixels3d(surf) # Indexed [x, y]
+    pixels[:] = rows[None, :, :]
+    del pixels
+    return surf
@@ -0,0 +1,320 @@
+# asset_pack.py
+"""
+Packed asset archive.
+
+build_pack() collects the images, sounds and JSON data files into one archive (assets.pak):
+
+    magic     8 bytes   b"CLAYPAK1"
+    length    4 bytes   little-endian size of the index
+    index     JSON      {"version": 1, "entries": {name: {"offset", "size", "sha256", "mtime_ns"}}}
+    data      ...       the files' bytes, back to back; offsets are from the start of the archive
+
+Entry names are repository-relative paths with forward slashes ("assets/drone.png").
+At runtime the archive is memory-mapped once with mount(); resources and data_loader then read
+files from it as memoryview slices of the mapping instead of opening loose files, and fall back
+to loose files for anything not in the archive. Entries whose loose file was modified since the
+build (by modification time or size) are stale: mount() logs them and they are read from disk too.
+
+Usage:
+    python asset_pack.py build [--output assets.pak]
+    python asset_pack.py verify [--pack assets.pak]
+"""
+import argparse
+import glob
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import struct
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CLAYPAK1"
+VERSION = 1
+DEFAULT_PACK_PATH = "assets.pak"
+SOURCE_PATTERNS = ( # Relative to the repository root
+    "assets/*.png",
+    "assets/*.wav",
+    "assets/*.mp3",
+    "assets/data/*.json",
+    "assets/data/*.lvl", # Compiled levels (python level_compiler.py)
+    "*.wav", # Large music files live in the repository root
+)
+_HEADER = struct.Struct("<8sI")
+
+_mounted = None # AssetPack used by resources/data_loader, see mount()
+
+
+def pack_name(path: str) -> str:
+    """
+    Returns the archive entry name of a repository-relative file path.
+    """
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def collect_sources(root: str = ".") -> list[str]:
+    """
+    Returns the sorted repository-relative paths of every file that goes into the archive.
+    """
+    paths = set()
+    for pattern in SOURCE_PATTERNS:
+        for path in glob.glob(os.path.join(root, pattern)):
+            paths.add(os.path.relpath(path, root))
+    return sorted(paths)
+
+
+def build_pack(output: str = DEFAULT_PACK_PATH, root: str = ".", sources: list[str] | None = None) -> dict:
+    """
+    Writes an archive containing the given files (by default everything collect_sources() finds).
+
+    Args:
+        output:  Path of the archive to write.
+        root:    Repository root the source paths are relative to.
+        sources: Repository-relative file paths to pack.
+
+    Returns:
+        The index entries {name: {"offset", "size", "sha256", "mtime_ns"}}.
+    """
+    sources = collect_sources(root) if sources is None else sources
+    blobs = []
+    mtimes = {}
+    for path in sources:
+        with open(os.path.join(root, path), "rb") as f:
+            mtimes[pack_name(path)] = os.fstat(f.fileno()).st_mtime_ns # For the staleness check in mount()
+            blobs.append((pack_name(path), f.read()))
+
+    # Offsets depend on the index length, which depends on the offsets' digits: lay out the
+    # data assuming a generous fixed-width index, then pad the index to exactly that width.
+    entries = {name: {"offset": 0, "size": len(data), "sha256": hashlib.sha256(data).hexdigest(), "mtime_ns": mtimes[name]}
+               for name, data in blobs}
+    index_size = len(json.dumps({"version": VERSION, "entries": entries}).encode("utf-8")) + 16 * len(entries) + 64
+    offset = _HEADER.size + index_size
+    for name, data in blobs:
+        entries[name]["offset"] = offset
+        offset += len(data)
+    index = json.dumps({"version": VERSION, "entries": entries}).encode("utf-8")
+    if len(index) > index_size:
+        raise RuntimeError("Archive index grew beyond its reserved size") # Cannot happen with 16 bytes per offset
+    index = index.ljust(index_size) # JSON tolerates trailing whitespace
+
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, index_size))
+        f.write(index)
+        for _, data in blobs:
+            f.write(data)
+    os.replace(tmp_path, output) # Never leave a half-written archive behind
+    logger.info(f"Packed {len(entries)} files ({offset} bytes) into {output}")
+    return entries
+
+
+class AssetPack:
+    """
+    A memory-mapped, read-only view of an archive written by build_pack().
+
+    Attributes:
+        path:    Path of the archive file.
+        entries: Index entries {name: {"offset", "size", "sha256", "mtime_ns"}}.
+    """
+    def __init__(self, path: str = DEFAULT_PACK_PATH):
+        """
+        Opens and maps an archive and reads its index.
+
+        Raises:
+            ValueError: If the file is not an archive of a supported version.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        magic, index_size = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an asset archive")
+        index = json.loads(bytes(self._view[_HEADER.size:_HEADER.size + index_size]))
+        if index.get("version") != VERSION:
+            self.close()
+            raise ValueError(f"{path} has unsupported archive version {index.get('version')}")
+        self.entries = index["entries"]
+
+    def __contains__(self, path: str) -> bool:
+        return pack_name(path) in self.entries
+
+    def get(self, path: str) -> memoryview:
+        """
+        Returns a file's bytes as a zero-copy memoryview slice of the mapping.
+
+        Raises:
+            KeyError: If the file is not in the archive.
+        """
+        entry = self.entries[pack_name(path)]
+        return self._view[entry["offset"]:entry["offset"] + entry["size"]]
+
+    def open(self, path: str) -> io.RawIOBase:
+        """
+        Returns a seekable binary file object reading a file from the mapping, e.g. for pygame loaders.
+        """
+        return MemoryViewReader(self.get(path))
+
+    def stale_entries(self, root: str = ".") -> list[str]:
+        """
+        Returns the entries whose loose file has a different modification time or size than when
+        the archive was built. Only stats the files; verify() compares their contents.
+
+        Entries without a loose file are not stale (the archive may be all there is), entries
+        written without a modification time are.
+        """
+        stale = []
+        for name, entry in self.entries.items():
+            try:
+                st = os.stat(os.path.join(root, name))
+            except OSError:
+                continue
+            if st.st_size != entry["size"] or st.st_mtime_ns != entry.get("mtime_ns"):
+                stale.append(name)
+        return stale
+
+    def verify(self, root: str | None = None) -> list[str]:
+        """
+        Checks every entry against its stored hash and, if root is given, against the loose file.
+
+        Returns:
+            A list of problems, empty if the archive is intact and up to date.
+        """
+        problems = []
+        for name, entry in self.entries.items():
+            if hashlib.sha256(self.get(name)).hexdigest() != entry["sha256"]:
+                problems.append(f"{name}: corrupt (hash mismatch)")
+            if root is not None:
+                loose_path = os.path.join(root, name)
+                if not os.path.exists(loose_path):
+                    problems.append(f"{name}: no longer exists as a loose file")
+                else:
+                    with open(loose_path, "rb") as f:
+                        if hashlib.sha256(f.read()).hexdigest() != entry["sha256"]:
+                            problems.append(f"{name}: stale (loose file changed)")
+        if root is not None:
+            for path in collect_sources(root):
+                if pack_name(path) not in self.entries:
+                    problems.append(f"{pack_name(path)}: missing from archive")
+        return problems
+
+    def close(self):
+        """
+        Releases the mapping. Views handed out earlier must not be used afterwards.
+        """
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError: # Slices are still referenced somewhere; the mapping goes away with them
+            logger.warning(f"Asset archive {self.path} closed while file views are still in use")
+        self._file.close()
+
+
+class MemoryViewReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a memoryview; reads copy straight into the caller's buffer.
+    """
+    def __init__(self, view: memoryview):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._view[self._pos:self._pos + len(buffer)]
+        size = len(data)
+        buffer[:size] = data
+        self._pos += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def mount(path: str = DEFAULT_PACK_PATH, root: str = ".") -> AssetPack | None:
+    """
+    Maps an archive and makes resources and data_loader read from it. Does nothing if it is missing.
+
+    Stale entries (see AssetPack.stale_entries()) are dropped from the mounted index with a
+    warning, so edited loose files are read from disk exactly as without an archive.
+
+    Returns:
+        The mounted AssetPack, or None if the file does not exist.
+    """
+    global _mounted
+    if not os.path.exists(path):
+        logger.debug(f"No asset archive at {path}, using loose files")
+        return None
+    unmount()
+    _mounted = AssetPack(path)
+    stale = _mounted.stale_entries(root)
+    if stale:
+        logger.warning(f"{len(stale)} file(s) changed since {path} was built and are read from disk instead: "
+                       f"{', '.join(stale)}. Rebuild it with: python asset_pack.py build")
+        for name in stale:
+            del _mounted.entries[name]
+    logger.info(f"Mounted asset archive {path} ({len(_mounted.entries)} files)")
+    return _mounted
+
+
+def unmount():
+    """
+    Stops reading from the mounted archive and closes it.
+    """
+    global _mounted
+    if _mounted is not None:
+        _mounted.close()
+        _mounted = None
+
+
+def mounted_file(path: str) -> memoryview | None:
+    """
+    Returns the bytes of a repository-relative file from the mounted archive, or None if it is not packed.
+    """
+    if _mounted is None or path not in _mounted:
+        return None
+    return _mounted.get(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="pack the loose assets into an archive")
+    build_parser.add_argument("--output", default=DEFAULT_PACK_PATH)
+    verify_parser = commands.add_parser("verify", help="check an archive's hashes against itself and the loose files")
+    verify_parser.add_argument("--pack", default=DEFAULT_PACK_PATH)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == "build":
+        entries = build_pack(args.output)
+        print(f"Wrote {args.output}: {len(entries)} files")
+        return 0
+
+    pack = AssetPack(args.pack)
+    problems = pack.verify(root=".")
+    pack.close()
+    for problem in problems:
+        print(problem)
+    print(f"{args.pack}: {'OK' if not problems else f'{len(problems)} problem(s)'}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+# atlas.py
+"""
+Texture atlas packing.
+
+Packs many small images into a few large pages using MaxRects bin packing (best short side
+fit). Each packed image is then handed out as a subsurface of its page: the pixels of all
+images live in one contiguous Surface, and blitting them reads from the same source Surface.
+resources.build_texture_atlas() uses this at load time for the images listed in
+assets/data/atlas.json.
+"""
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PAGE_SIZE = 1024 # Largest atlas page edge in pixels
+MIN_PAGE_SIZE = 64
+PAGE_SIZE_STEP = 32 # Page widths tried when looking for the tightest page
+
+
+def pack_rects(sizes: list[tuple[int, int]], width: int, height: int, padding: int = 0) -> list[tuple[int, int]] | None:
+    """
+    Places rectangles into a width x height bin without overlap (MaxRects, best short side fit).
+
+    Args:
+        sizes:   (width, height) of every rectangle.
+        width:   Bin width.
+        height:  Bin height.
+        padding: Empty pixels kept to the right of and below every rectangle.
+
+    Returns:
+        The (x, y) position of every rectangle, in the order of sizes, or None if they do not all fit.
+    """
+    free = [pygame.Rect(0, 0, width, height)] # Maximal free rectangles, may overlap each other
+    positions = [None] * len(sizes)
+    # Placing large rectangles first leaves the small ones to fill the gaps
+    order = sorted(range(len(sizes)), key=lambda i: (max(sizes[i]), min(sizes[i])), reverse=True)
+    for i in order:
+        w, h = sizes[i][0] + padding, sizes[i][1] + padding
+        best = None
+        for rect in free:
+            if w <= rect.width and h <= rect.height:
+                leftover = (min(rect.width - w, rect.height - h), max(rect.width - w, rect.height - h))
+                if best is None or leftover < best[0]:
+                    best = (leftover, rect.x, rect.y)
+        if best is None:
+            return None
+        placed = pygame.Rect(best[1], best[2], w, h)
+        positions[i] = (placed.x, placed.y)
+
+        split = []
+        for rect in free: # Cut the placed rectangle out of every free rectangle it overlaps
+            if not rect.colliderect(placed):
+                split.append(rect)
+                continue
+            if placed.left > rect.left:
+                split.append(pygame.Rect(rect.left, rect.top, placed.left - rect.left, rect.height))
+            if placed.right < rect.right:
+                split.append(pygame.Rect(placed.right, rect.top, rect.right - placed.right, rect.height))
+            if placed.top > rect.top:
+                split.append(pygame.Rect(rect.left, rect.top, rect.width, placed.top - rect.top))
+            if placed.bottom < rect.bottom:
+                split.append(pygame.Rect(rect.left, placed.bottom, rect.width, rect.bottom - placed.bottom))
+        free = [rect for k, rect in enumerate(split) # Drop free rectangles inside others (keeping one of equal pairs)
+                if not any(j != k and other.contains(rect) and (other != rect or j < k) for j, other in enumerate(split))]
+    return positions
+
+
+def _pack_page(sizes: list[tuple[int, int]], max_size: int, padding: int):
+    """
+    Finds the smallest page holding every rectangle: packs into max_size-tall bins of every
+    width from MIN_PAGE_SIZE to max_size (in PAGE_SIZE_STEP steps) and trims each result to
+    its bounding box. Pages need not be powers of two; pygame blits do not care.
+
+    Returns:
+        ((width, height), positions), or None if the rectangles do not fit on one page.
+    """
+    best = None
+    for width in range(MIN_PAGE_SIZE, max_size + 1, PAGE_SIZE_STEP):
+        if any(w + padding > width for w, _ in sizes):
+            continue
+        positions = pack_rects(sizes, width, max_size, padding)
+        if positions is None:
+            continue
+        used = (max(x + w for (x, _), (w, _) in zip(positions, sizes)),
+                max(y + h for (_, y), (_, h) in zip(positions, sizes)))
+        if best is None or used[0] * used[1] < best[0][0] * best[0][1]:
+            best = (used, positions)
+    return best
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """
+    Returns the size of a Surface's pixel buffer, including row padding.
+    """
+    return surface.get_pitch() * surface.get_height()
+
+
+class TextureAtlas:
+    """
+    One atlas page: a single Surface holding many images.
+
+    Attributes:
+        surface: The page Surface. Must not be drawn on after packing.
+        regions: Dict mapping image keys to their pygame.Rect on the page.
+    """
+    def __init__(self, size: tuple[int, int]):
+        """
+        Creates an empty, fully transparent page.
+
+        Args:
+            size: (width, height) of the page.
+        """
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha() # Same pixel format as the images it replaces
+        self.surface.fill((0, 0, 0, 0))
+        self.regions = {}
+
+    def add(self, key, image: pygame.Surface, pos: tuple[int, int]) -> pygame.Surface:
+        """
+        Copies an image onto the page and returns the subsurface now standing in for it.
+        """
+        rect = pygame.Rect(pos, image.get_size())
+        self.surface.blit(image, rect, special_flags=pygame.BLEND_RGBA_ADD) # Adding to transparent black copies pixels and alpha exactly
+        self.regions[key] = rect
+        return self.surface.subsurface(rect)
+
+    def subsurface(self, key) -> pygame.Surface:
+        """
+        Returns a new subsurface of the page for a packed image.
+
+        Raises:
+            KeyError: If the key was not packed into this page.
+        """
+        return self.surface.subsurface(self.regions[key])
+
+
+def build_atlas(images: dict, max_size: int = DEFAULT_MAX_PAGE_SIZE, padding: int = 0) -> tuple[list[TextureAtlas], dict, dict]:
+    """
+    Packs images into as few pages as possible.
+
+    Every page is trimmed to the smallest size its images were found to fit in. Images larger than
+    max_size in either dimension are left out (returned as None) and should stay separate.
+
+    Args:
+        images:   Dict mapping keys to pygame.Surfaces.
+        max_size: Largest page edge in pixels.
+        padding:  Empty pixels between images.
+
+    Returns:
+        (pages, subsurfaces, stats): the TextureAtlas pages, a dict mapping every key to its
+        subsurface (or None if it was too large), and a dict with the packing statistics
+        "pages", "images", "efficiency" (packed pixels / page pixels), "separate_bytes",
+        "atlas_bytes" and "saved_bytes" (negative if the pages are larger than the images).
+    """
+    subsurfaces = {key: None for key in images}
+    remaining = [key for key, image in images.items()
+                 if image.get_width() + padding <= max_size and image.get_height() + padding <= max_size]
+    pages = []
+    while remaining:
+        sizes = [images[key].get_size() for key in remaining]
+        packed_page = _pack_page(sizes, max_size, padding)
+        if packed_page is not None:
+            page_size, positions = packed_page
+            keys = remaining
+        else: # Not everything fits on one page: fill a full-size page and continue
+            page_size, keys, positions = _fill_page(remaining, sizes, max_size, padding)
+        page = TextureAtlas(page_size)
+        for key, pos in zip(keys, positions):
+            subsurfaces[key] = page.add(key, images[key], pos)
+        pages.append(page)
+        remaining = [key for key in remaining if key not in page.regions]
+
+    packed = [key for key, sub in subsurfaces.items() if sub is not None]
+    used_pixels = sum(images[key].get_width() * images[key].get_height() for key in packed)
+    page_pixels = sum(page.surface.get_width() * page.surface.get_height() for page in pages)
+    separate_bytes = sum(_surface_bytes(images[key]) for key in packed)
+    atlas_bytes = sum(_surface_bytes(page.surface) for page in pages)
+    stats = {
+        "pages": len(pages),
+        "images": len(packed),
+        "efficiency": used_pixels / page_pixels if page_pixels else 0.0,
+        "separate_bytes": separate_bytes,
+        "atlas_bytes": atlas_bytes,
+        "saved_bytes": separate_bytes - atlas_bytes,
+    }
+    return pages, subsurfaces, stats
+
+
+def _fill_page(keys: list, sizes: list, max_size: int, padding: int):
+    """
+    Packs as many of the images as fit (largest first) onto one max_size page.
+    """
+    chosen_keys, chosen_sizes, positions = [], [], []
+    for key, size in sorted(zip(keys, sizes), key=lambda item: item[1][0] * item[1][1], reverse=True):
+        attempt = pack_rects(chosen_sizes + [size], max_size, max_size, padding)
+        if attempt is not None:
+            chosen_keys.append(key)
+            chosen_sizes.append(size)
+            positions = attempt
+    return (max_size, max_size), chosen_keys, positions
@@ -0,0 +1,11 @@
+# benchmarks/__init__.py
+"""
+Standalone performance benchmarks. Run each module from the repository root, e.g.
+
+    python -m benchmarks.bench_collisions
+
+benchmarks.suite runs a fixed set of hot-path benchmarks, writes the results as JSON and
+compares them against a stored baseline:
+
+    python -m benchmarks.suite run --baseline benchmarks/baseline.json
+"""
@@ -0,0 +1,80 @@
+# benchmarks/bench_atlas.py
+"""
+Packs the images of assets/data/atlas.json into a texture atlas and compares drawing from it
+with drawing from separate surfaces.
+
+Prints the packing efficiency and memory of the atlas versus the separate surfaces, the time
+it takes to build the atlas, and the time per frame of blitting a mixed scene (every packed
+image and sheet frame, repeated) from separate surfaces and from atlas subsurfaces.
+
+Usage:
+    python -m benchmarks.bench_atlas [--sprites 400] [--frames 500]
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # convert_alpha() needs a display mode
+
+import argparse
+import random
+import time
+
+import pygame
+
+import resources
+
+
+def _scene_images() -> list[pygame.Surface]:
+    """
+    Loads every image and sheet frame listed in the atlas manifest through the resource loaders.
+    """
+    manifest = resources.load_json(resources.ATLAS_MANIFEST)
+    images = [resources.load_image_with_scale(entry["path"], tuple(entry["size"])) for entry in manifest.get("images", [])]
+    for entry in manifest.get("sheets", []):
+        images.extend(resources.load_sprite_sheet(entry["path"], entry["frame_width"], entry["frame_height"], entry["frames"]))
+    return images
+
+
+def _time_blits(screen: pygame.Surface, images: list[pygame.Surface], sprites: int, frames: int, seed: int) -> float:
+    """
+    Blits `sprites` randomly chosen images at random positions per frame; returns ms per frame.
+    """
+    rng = random.Random(seed)
+    scene = [(rng.choice(images), (rng.randrange(0, 760), rng.randrange(0, 560))) for _ in range(sprites)]
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        screen.blits(scene, doreturn=False)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sprites", type=int, default=400)
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    screen = pygame.display.set_mode((800, 600))
+
+    separate = _scene_images()
+    separate_ms = _time_blits(screen, separate, args.sprites, args.frames, args.seed)
+
+    resources.clear_cache()
+    start = time.perf_counter()
+    stats = resources.build_texture_atlas()
+    build_ms = (time.perf_counter() - start) * 1000
+    packed = _scene_images()
+    atlas_ms = _time_blits(screen, packed, args.sprites, args.frames, args.seed)
+
+    print(f"atlas: {stats['images']} images on {stats['pages']} page(s), {stats['efficiency']:.1%} packed, built in {build_ms:.1f} ms")
+    print(f"memory: {stats['separate_bytes'] / 1024:.0f} KiB separate, {stats['atlas_bytes'] / 1024:.0f} KiB atlas "
+          f"({stats['saved_bytes'] / 1024:+.0f} KiB saved)")
+    print(f"source surfaces: {len({id(image) for image in separate})} separate, "
+          f"{len({id(image.get_abs_parent()) for image in packed})} with the atlas")
+    print(f"blit {args.sprites} sprites: {separate_ms:.3f} ms/frame separate, {atlas_ms:.3f} ms/frame atlas")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/bench_collisions.py
+"""
+Compares pygame's pairwise sprite collision functions with the SpatialHash broadphase.
+
+For each entity count the benchmark builds a random field of enemies, player projectiles,
+boss projectiles and power-ups, checks that both approaches report identical hit sets and
+prints the average time per frame of the four PlayingState collision queries.
+
+Usage:
+    python -m benchmarks.bench_collisions [--counts 50 200 800] [--frames 50] [--seed 1]
+"""
+import argparse
+import random
+import time
+
+import pygame
+
+from spatial_hash import SpatialHash
+
+
+def _make_group(rng: random.Random, count: int, size: tuple[int, int], area: tuple[int, int]) -> pygame.sprite.Group:
+    """
+    Creates a group of bare sprites with random rects inside the given area.
+    """
+    group = pygame.sprite.Group()
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(rng.randint(0, area[0]), rng.randint(0, area[1]), *size)
+        group.add(sprite)
+    return group
+
+
+def _pairwise_frame(soldier, projectiles, enemies, boss_projectiles, powerups):
+    """
+    Runs the collision queries of one PlayingState frame with pygame's pairwise functions.
+    """
+    return (
+        pygame.sprite.groupcollide(projectiles, enemies, False, False),
+        pygame.sprite.spritecollideany(soldier, boss_projectiles),
+        pygame.sprite.spritecollide(soldier, powerups, False),
+        pygame.sprite.spritecollideany(soldier, enemies),
+    )
+
+
+def _grid_frame(grid, soldier, projectiles, enemies, boss_projectiles, powerups):
+    """
+    Runs the same queries through the spatial hash, including the per-frame rebuild.
+    """
+    grid.rebuild(enemies, boss_projectiles, powerups)
+    return (
+        grid.groupcollide(projectiles, enemies, False, False),
+        grid.spritecollideany(soldier, boss_projectiles),
+        grid.spritecollide(soldier, powerups, False),
+        grid.spritecollideany(soldier, enemies),
+    )
+
+
+def _time_frames(func, frames: int) -> tuple[float, object]:
+    """
+    Calls func `frames` times and returns the average time in milliseconds and the last result.
+    """
+    result = None
+    start = time.perf_counter()
+    for _ in range(frames):
+        result = func()
+    return (time.perf_counter() - start) * 1000 / frames, result
+
+
+def run(count: int, frames: int, seed: int) -> dict:
+    """
+    Benchmarks one entity count. `count` is the number of enemies; projectiles scale with it.
+
+    Returns:
+        A dict with the entity count, both timings in ms per frame and the speedup.
+    """
+    rng = random.Random(seed)
+    area = (800, 600)
+    enemies = _make_group(rng, count, (50, 50), area)
+    projectiles = _make_group(rng, count, (32, 32), area)
+    boss_projectiles = _make_group(rng, count // 4, (15, 15), area)
+    powerups = _make_group(rng, count // 4, (30, 30), area)
+    soldier = pygame.sprite.Sprite()
+    soldier.rect = pygame.Rect(375, 275, 50, 50)
+    grid = SpatialHash()
+
+    pairwise_ms, expected = _time_frames(lambda: _pairwise_frame(soldier, projectiles, enemies, boss_projectiles, powerups), frames)
+    grid_ms, actual = _time_frames(lambda: _grid_frame(grid, soldier, projectiles, enemies, boss_projectiles, powerups), frames)
+    if expected != actual:
+        raise AssertionError(f"SpatialHash hit sets differ from pygame's at {count} entities")
+
+    return {"entities": count, "pairwise_ms": pairwise_ms, "grid_ms": grid_ms, "speedup": pairwise_ms / grid_ms}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[25, 50, 100, 200, 400, 800, 1600])
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'entities':>8} {'pairwise ms':>12} {'grid ms':>10} {'speedup':>8}")
+    for count in args.counts:
+        row = run(count, args.frames, args.seed)
+        print(f"{row['entities']:>8} {row['pairwise_ms']:>12.3f} {row['grid_ms']:>10.3f} {row['speedup']:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
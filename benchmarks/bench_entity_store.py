@@ -0,0 +1,80 @@
+# benchmarks/bench_entity_store.py
+"""
+Compares moving sprites one by one (pygame.sprite.Group.update) with the batch motion of an
+entity_store.EntityGroup.
+
+For every entity count, the same mix of bouncing enemies, bobbing drones and projectiles
+(respawned at the bottom when they leave the top) is ticked in a plain Group and in an
+EntityGroup, and the time per tick is reported for each.
+
+Usage:
+    python -m benchmarks.bench_entity_store [--counts 10 50 200 1000] [--ticks 500]
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # convert_alpha() needs a display mode
+
+import argparse
+import random
+import time
+
+import pygame
+
+import entity_store
+from sprite_pool import SpritePool
+from sprites import EnemyUnit, Drone, Projectile
+
+
+def _populate(group, count: int, pool: SpritePool, rng: random.Random):
+    """
+    Adds `count` entities, a third each of enemies, drones and projectiles, at random positions.
+    """
+    for i in range(count):
+        pos = (rng.randrange(50, 750), rng.randrange(50, 550))
+        if i % 3 == 0:
+            group.add(EnemyUnit(pos))
+        elif i % 3 == 1:
+            group.add(Drone(pos))
+        else:
+            pool.acquire(Projectile, pos, rng.randrange(4, 12), groups=(group,))
+
+
+def _time_ticks(group, pool: SpritePool, ticks: int, rng: random.Random) -> float:
+    """
+    Ticks the group, refilling killed projectiles; returns ms per tick (refills included).
+    """
+    target = len(group)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        group.update()
+        while len(group) < target:
+            pool.acquire(Projectile, (rng.randrange(50, 750), 590), rng.randrange(4, 12), groups=(group,))
+    return (time.perf_counter() - start) * 1000 / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 50, 200, 1000])
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    if not entity_store.has_numpy():
+        parser.error("NumPy is not installed")
+
+    pygame.display.init()
+    pygame.display.set_mode((800, 600))
+    print(f"{'entities':>8}  {'Group ms/tick':>13}  {'EntityGroup ms/tick':>19}  {'speed-up':>8}")
+    for count in args.counts:
+        results = []
+        for group_class in (pygame.sprite.Group, entity_store.EntityGroup):
+            rng = random.Random(args.seed)
+            pool = SpritePool(max_free=count)
+            group = group_class()
+            _populate(group, count, pool, rng)
+            results.append(_time_ticks(group, pool, args.ticks, rng))
+        print(f"{count:>8}  {results[0]:>13.3f}  {results[1]:>19.3f}  {results[0] / results[1]:>7.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# benchmarks/bench_level_load.py
+"""
+Compares loading a large level from JSON with loading its compiled binary version.
+
+Writes a synthetic level (--tiles x --tiles tiles, --objects objects) to a temporary directory,
+compiles it with level_compiler and measures for both formats:
+    load:     opening/parsing the file (the JSON path parses the whole layout)
+    chunk:    reading one 16x16 chunk of tiles afterwards, what the first frame needs
+    scan:     reading every tile once
+    memory:   Python heap retained by the loaded level (tracemalloc); the compiled level's
+              tile grid lives in the page cache through its memory map and is not counted
+
+Usage:
+    python -m benchmarks.bench_level_load [--tiles 1000] [--objects 2000] [--repeat 3]
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import level_compiler
+from level_manager import CHUNK_TILES, CompiledChunkSource, LayoutChunkSource
+
+
+def _write_level(path: str, tiles: int, objects: int, seed: int):
+    """
+    Writes a random JSON level of tiles x tiles tiles.
+    """
+    rng = random.Random(seed)
+    level = {
+        "background": "assets/level1_bg.png",
+        "tile_size": 32,
+        "tileset": "assets/tileset.png",
+        "layout": [[rng.randint(0, 10) for _ in range(tiles)] for _ in range(tiles)],
+        "objects": [{"type": rng.choice(("tree", "rock")), "position": [rng.randrange(tiles * 32), rng.randrange(tiles * 32)]} for _ in range(objects)],
+        "npcs": [],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(level, f)
+
+
+def _load_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        level = json.load(f)
+    return level, LayoutChunkSource(level["layout"])
+
+
+def _load_compiled(path: str):
+    compiled = level_compiler.load_compiled(path)
+    return compiled, CompiledChunkSource(compiled)
+
+
+def _measure(load, path: str, repeat: int) -> dict:
+    """
+    Times load(path) and tile access on the result, then measures the heap it retains.
+    """
+    load_ms, chunk_ms, scan_ms = [], [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        level, source = load(path)
+        load_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        source.load_chunk((0, 0))
+        chunk_ms.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        chunks = (source.width + CHUNK_TILES - 1) // CHUNK_TILES
+        for chunk_y in range(chunks):
+            for chunk_x in range(chunks):
+                source.load_chunk((chunk_x, chunk_y))
+        scan_ms.append((time.perf_counter() - start) * 1000)
+        if hasattr(level, "close"):
+            level.close()
+        del level, source
+
+    gc.collect()
+    tracemalloc.start()
+    level, source = load(path)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if hasattr(level, "close"):
+        level.close()
+    return {"load_ms": statistics.median(load_ms), "chunk_ms": statistics.median(chunk_ms),
+            "scan_ms": statistics.median(scan_ms), "retained_bytes": retained}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tiles", type=int, default=1000)
+    parser.add_argument("--objects", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "level_big.json")
+        _write_level(json_path, args.tiles, args.objects, args.seed)
+        compiled_path = level_compiler.compile_level(json_path)
+        problems = level_compiler.check(json_path)
+        if problems:
+            raise SystemExit(f"Compiled level differs from JSON: {problems}")
+
+        print(f"{args.tiles}x{args.tiles} tiles, {args.objects} objects; "
+              f"JSON {os.path.getsize(json_path) / 1024:.0f} KiB, compiled {os.path.getsize(compiled_path) / 1024:.0f} KiB")
+        print(f"{'format':>9} {'load ms':>9} {'chunk ms':>9} {'scan ms':>9} {'heap KiB':>9}")
+        for name, load, path in (("json", _load_json, json_path), ("compiled", _load_compiled, compiled_path)):
+            row = _measure(load, path, args.repeat)
+            print(f"{name:>9} {row['load_ms']:>9.2f} {row['chunk_ms']:>9.3f} {row['scan_ms']:>9.1f} {row['retained_bytes'] / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
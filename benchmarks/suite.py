@@ -0,0 +1,459 @@
+# benchmarks/suite.py
+"""
+Benchmark suite for the hot paths of the game, with JSON results and regression checks.
+
+Runs headless on the SDL dummy video and audio drivers. Every benchmark times a function
+`repeat` times over `number` calls (garbage collection off, as timeit does) and records the
+median, mean, minimum and standard deviation of the time per call:
+
+    playing_state.update[N]          one simulation tick with N enemies, drones and projectiles
+    collisions.*                     each PlayingState collision handler on a crowded field
+    level_manager.draw.cold/warm     drawing level1 with the chunks freshly baked / already baked
+    resources.load_image_with_scale.cold/warm, resources.load_sprite_sheet.cold/warm
+    data_loader.load_json.cold/warm  level1.json parsed from disk / from the data cache
+    save_load.save_game/load_game    pickling a save-game sized dict to a temporary file
+    ui_helpers.draw_vertical_gradient(.cold)  a full-screen gradient panel from the gradient cache / built anew
+    generate_assets.build            a forced build of every generated asset into a temporary directory
+
+compare flags the benchmarks that got slower than the baseline by more than the threshold and
+exits with status 1 if there are any, so it can gate CI. It compares the minimum time per call
+by default, the statistic least disturbed by other load on the machine (--stat median to
+compare medians instead).
+
+Usage:
+    python -m benchmarks.suite list
+    python -m benchmarks.suite run [--out benchmark_results.json] [--filter collisions update]
+    python -m benchmarks.suite run --out benchmarks/baseline.json       (store a baseline)
+    python -m benchmarks.suite run --baseline benchmarks/baseline.json  (run and compare)
+    python -m benchmarks.suite compare benchmarks/baseline.json benchmark_results.json [--threshold 10]
+"""
+import os
+
+# The SDL dummy drivers must be selected before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+import pygame
+
+import data_loader
+import resources
+import save_load
+from config import STATE_PLAYING
+import ui_helpers
+from ui_helpers import draw_vertical_gradient
+
+SCREEN_SIZE = (800, 600)
+DEFAULT_OUT = "benchmark_results.json"
+DEFAULT_THRESHOLD = 10.0 # Percent a benchmark may slow down before compare reports a regression
+DEFAULT_STAT = "min_ms" # Statistic compared; the minimum is the most repeatable on a busy machine
+MIN_DELTA_MS = 0.005 # Smaller differences are timer noise, whatever the percentage
+RESULTS_VERSION = 1
+ENTITY_COUNTS = (10, 100, 1000)
+
+Benchmark = namedtuple("Benchmark", "name factory number repeat")
+BENCHMARKS = [] # Registered in the order they run
+_TEMPDIR = None # Scratch directory of the current run
+
+
+def benchmark(name: str, number: int = 1, repeat: int = 5):
+    """
+    Registers a benchmark factory under a name.
+
+    The factory is called once and returns (func, setup): setup() (or None) runs untimed before
+    every repeat and its result is passed to func, which is then timed `number` times.
+    """
+    def register(factory):
+        BENCHMARKS.append(Benchmark(name, factory, number, repeat))
+        return factory
+    return register
+
+
+def measure(func, setup=None, number: int = 1, repeat: int = 5) -> dict:
+    """
+    Times func and returns statistics of the time per call in milliseconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                func(arg)
+            samples.append((time.perf_counter() - start) * 1000 / number)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return {
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "min_ms": min(samples),
+        "stdev_ms": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def _tempdir() -> str:
+    """
+    Returns a scratch directory that is removed at the end of the run.
+    """
+    global _TEMPDIR
+    if _TEMPDIR is None:
+        _TEMPDIR = tempfile.mkdtemp(prefix="clay_bench_")
+    return _TEMPDIR
+
+
+# ---------------------------------------------------------------------------------------------
+# Gameplay
+
+def _playing_state(seed: int = 1):
+    """
+    Returns a silent PlayingState that cannot run out of lives.
+    """
+    from states import PlayingState # Imported late so the dummy drivers are set up first
+    state = PlayingState(pygame.display.get_surface(), headless=True, seed=seed)
+    state.lives = 10 ** 9
+    return state
+
+
+def _crowded_state(count: int, seed: int = 1):
+    """
+    Returns a PlayingState with `count` entities: half enemies, a quarter drones, a quarter projectiles.
+    """
+    from sprites import EnemyUnit, AnimatedEnemy, Drone, Projectile
+    rng = random.Random(seed)
+    state = _playing_state(seed)
+    state.enemy_group.empty()
+    for i in range(count):
+        pos = (rng.randint(50, 750), rng.randint(50, 550))
+        if i % 4 < 2:
+            state.enemy_group.add((EnemyUnit if i % 4 == 0 else AnimatedEnemy)(pos))
+        elif i % 4 == 2:
+            state.sprite_pool.acquire(Drone, pos, groups=(state.drone_group,))
+        else:
+            state.sprite_pool.acquire(Projectile, pos, state.projectile_speed, groups=(state.projectile_group,))
+    return state
+
+
+def _tick(state):
+    state.update()
+    state.next_state = STATE_PLAYING # Level-ups would otherwise wait for the upgrade shop
+
+
+for _count in ENTITY_COUNTS:
+    benchmark(f"playing_state.update[{_count}]", number=20)(
+        lambda count=_count: (_tick, lambda: _crowded_state(count)))
+
+
+def _collision_field(seed: int = 1):
+    """
+    Returns a PlayingState with 200 enemies and 100 projectiles over the whole screen, and boss
+    projectiles and power-ups around the soldier, with the collision grid built.
+    """
+    from sprites import BossProjectile, PowerUp, ShieldPowerUp
+    rng = random.Random(seed)
+    state = _crowded_state(400, seed)
+    state.drone_group.empty()
+    center = state.soldier.rect.center
+    for i in range(40):
+        pos = (center[0] + rng.randint(-60, 60), center[1] + rng.randint(-60, 60))
+        state.sprite_pool.acquire(BossProjectile, pos, groups=(state.boss_projectile_group,))
+        state.sprite_pool.acquire(ShieldPowerUp if i % 2 else PowerUp, pos, groups=(state.powerup_group,))
+    state._prepare_collisions() # Crowded enough for the grid
+    return state
+
+
+@benchmark("collisions.grid_rebuild", number=20, repeat=10)
+def _grid_rebuild():
+    return (lambda state: state.collision_grid.rebuild(state.enemy_group, state.boss_projectile_group, state.powerup_group),
+            _collision_field)
+
+
+COLLISION_HANDLERS = { # Benchmark label -> PlayingState method
+    "projectile_enemy": "_handle_projectile_enemy_collisions",
+    "boss_projectile": "_handle_boss_projectile_collisions",
+    "powerup": "_handle_powerup_collisions",
+    "enemy_soldier": "_handle_enemy_soldier_collision",
+}
+for _label, _method in COLLISION_HANDLERS.items():
+    benchmark(f"collisions.{_label}", repeat=20)( # Handlers kill what they hit: a fresh field per call
+        lambda method=_method: ((lambda state: getattr(state, method)()), _collision_field))
+
+
+# ---------------------------------------------------------------------------------------------
+# Level drawing
+
+def _level_manager():
+    from level_manager import LevelManager
+    return LevelManager("level1.json")
+
+
+@benchmark("level_manager.draw.cold", repeat=10)
+def _level_draw_cold():
+    level = _level_manager()
+    screen = pygame.display.get_surface()
+    def setup():
+        level.invalidate() # Every chunk is re-baked on the next draw
+        return level
+    return (lambda level: level.draw(screen)), setup
+
+
+@benchmark("level_manager.draw.warm", number=100)
+def _level_draw_warm():
+    level = _level_manager()
+    screen = pygame.display.get_surface()
+    level.draw(screen) # Bake the chunks
+    return (lambda _: level.draw(screen)), None
+
+
+# ---------------------------------------------------------------------------------------------
+# Resource loading
+
+def _cold(kind: str):
+    """
+    Returns a setup that drops one kind of resource ("image", "sheet") from the cache, pinned ones too.
+    """
+    return lambda: resources.clear_cache(kind)
+
+
+@benchmark("resources.load_image_with_scale.cold", repeat=20)
+def _image_cold():
+    return (lambda _: resources.load_image_with_scale("fortress.png", (150, 100))), _cold("image")
+
+
+@benchmark("resources.load_image_with_scale.warm", number=10000)
+def _image_warm():
+    resources.load_image_with_scale("fortress.png", (150, 100))
+    return (lambda _: resources.load_image_with_scale("fortress.png", (150, 100))), None
+
+
+@benchmark("resources.load_sprite_sheet.cold", repeat=20)
+def _sheet_cold():
+    return (lambda _: resources.load_sprite_sheet("player_idle.png", 50, 50, 4)), _cold("sheet")
+
+
+@benchmark("resources.load_sprite_sheet.warm", number=10000)
+def _sheet_warm():
+    resources.load_sprite_sheet("player_idle.png", 50, 50, 4)
+    return (lambda _: resources.load_sprite_sheet("player_idle.png", 50, 50, 4)), None
+
+
+@benchmark("data_loader.load_json.cold", number=1, repeat=20)
+def _json_cold():
+    return (lambda _: data_loader.load_json("level1.json")), data_loader.clear_cache
+
+
+@benchmark("data_loader.load_json.warm", number=200)
+def _json_warm():
+    data_loader.load_json("level1.json")
+    return (lambda _: data_loader.load_json("level1.json")), None
+
+
+# ---------------------------------------------------------------------------------------------
+# Saving and loading
+
+def _save_data(seed: int = 1) -> dict:
+    """
+    Returns a dict shaped like a save game: player stats, an inventory and quest flags.
+    """
+    rng = random.Random(seed)
+    return {
+        "player": {"level": 12, "score": 48200, "lives": 3, "position": [412, 300], "skills": ["rifle", "medic"]},
+        "inventory": [{"id": i, "name": f"item {i}", "quantity": rng.randint(1, 20), "durability": rng.random()} for i in range(500)],
+        "quests": {f"quest_{i}": {"stage": rng.randint(0, 5), "flags": [rng.random() < 0.5 for _ in range(8)]} for i in range(200)},
+    }
+
+
+@benchmark("save_load.save_game", number=20)
+def _save_game():
+    path = os.path.join(_tempdir(), "bench_save.dat")
+    data = _save_data()
+    return (lambda _: save_load.save_game(data, path)), None
+
+
+@benchmark("save_load.load_game", number=20)
+def _load_game():
+    path = os.path.join(_tempdir(), "bench_load.dat")
+    save_load.save_game(_save_data(), path)
+    return (lambda _: save_load.load_game(path)), None
+
+
+# ---------------------------------------------------------------------------------------------
+# Drawing helpers and asset generation
+
+@benchmark("ui_helpers.draw_vertical_gradient", number=20)
+def _gradient():
+    surface = pygame.Surface(SCREEN_SIZE)
+    return (lambda _: draw_vertical_gradient(surface, (30, 60, 140), (200, 120, 40))), None
+
+
+@benchmark("ui_helpers.draw_vertical_gradient.cold", repeat=20)
+def _gradient_cold():
+    surface = pygame.Surface(SCREEN_SIZE)
+    return (lambda _: draw_vertical_gradient(surface, (30, 60, 140), (200, 120, 40))), ui_helpers.clear_gradient_cache
+
+
+@benchmark("generate_assets.build", repeat=3)
+def _generate_assets():
+    import asset_build
+    import generate_assets
+    root = os.path.join(_tempdir(), "generated")
+    return (lambda _: asset_build.build(generate_assets.TARGETS, generate_assets.build_environment(),
+                                        force=True, root=root)), None
+
+
+# ---------------------------------------------------------------------------------------------
+
+def run(filters: list[str] | None = None, progress=None) -> dict:
+    """
+    Runs the benchmarks whose name contains any of the filters (all if None).
+
+    Returns:
+        {"version", "environment": {...}, "results": {name: statistics from measure()}}
+    """
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode(SCREEN_SIZE) # convert_alpha() needs a display mode
+    results = {}
+    try:
+        for bench in BENCHMARKS:
+            if filters and not any(f in bench.name for f in filters):
+                continue
+            func, setup = bench.factory()
+            results[bench.name] = measure(func, setup, bench.number, bench.repeat)
+            if progress is not None:
+                progress(bench.name, results[bench.name])
+    finally:
+        global _TEMPDIR
+        if _TEMPDIR is not None:
+            shutil.rmtree(_TEMPDIR, ignore_errors=True)
+            _TEMPDIR = None
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "version": RESULTS_VERSION,
+        "environment": {"python": platform.python_version(), "pygame": pygame.version.ver, "numpy": numpy_version,
+                        "platform": platform.platform(), "machine": platform.machine(),
+                        "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD, stat: str = DEFAULT_STAT) -> list[dict]:
+    """
+    Compares two result sets.
+
+    Args:
+        baseline:  Results from run() to compare against.
+        current:   Newer results.
+        threshold: Percentage by which a time may grow before it counts as a regression.
+        stat:      Statistic to compare: "min_ms", "median_ms" or "mean_ms".
+
+    Returns:
+        One row per benchmark in either set: {"name", "baseline_ms", "current_ms", "change" (fraction,
+        or None if missing from one side), "status": "regression", "improved", "ok" or "missing"}.
+    """
+    rows = []
+    names = list(baseline["results"]) + [name for name in current["results"] if name not in baseline["results"]]
+    for name in names:
+        old = baseline["results"].get(name, {}).get(stat)
+        new = current["results"].get(name, {}).get(stat)
+        if old is None or new is None:
+            rows.append({"name": name, "baseline_ms": old, "current_ms": new, "change": None, "status": "missing"})
+            continue
+        change = (new - old) / old if old > 0 else 0.0
+        if abs(new - old) < MIN_DELTA_MS or abs(change) * 100 <= threshold:
+            status = "ok"
+        else:
+            status = "regression" if change > 0 else "improved"
+        rows.append({"name": name, "baseline_ms": old, "current_ms": new, "change": change, "status": status})
+    return rows
+
+
+def _print_comparison(rows: list[dict], threshold: float) -> int:
+    """
+    Prints a comparison table and returns the number of regressions.
+    """
+    print(f"{'benchmark':<42} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for row in rows:
+        old = f"{row['baseline_ms']:.4f}" if row["baseline_ms"] is not None else "-"
+        new = f"{row['current_ms']:.4f}" if row["current_ms"] is not None else "-"
+        change = f"{row['change']:+.1%}" if row["change"] is not None else ""
+        flag = {"regression": "  REGRESSION", "improved": "  improved", "missing": "  missing"}.get(row["status"], "")
+        print(f"{row['name']:<42} {old:>12} {new:>12} {change:>8}{flag}")
+    regressions = sum(row["status"] == "regression" for row in rows)
+    print(f"{regressions} regression(s) beyond {threshold:g}%")
+    return regressions
+
+
+def _load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"error: {path} is not a version {RESULTS_VERSION} benchmark result file")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the benchmarks")
+    run_parser = commands.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run_parser.add_argument("--out", default=DEFAULT_OUT, help=f"result file (default: {DEFAULT_OUT})")
+    run_parser.add_argument("--filter", nargs="+", help="only run benchmarks whose name contains one of these")
+    run_parser.add_argument("--baseline", help="compare the results against this result file")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="regression threshold in percent")
+    run_parser.add_argument("--stat", choices=["min", "median", "mean"], default=DEFAULT_STAT[:-3], help="statistic to compare")
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="regression threshold in percent")
+    compare_parser.add_argument("--stat", choices=["min", "median", "mean"], default=DEFAULT_STAT[:-3], help="statistic to compare")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == "list":
+        for bench in BENCHMARKS:
+            print(f"{bench.name:<42} {bench.number:>6} calls x {bench.repeat}")
+        return 0
+    if args.command == "compare":
+        rows = compare(_load_results(args.baseline), _load_results(args.current), args.threshold, args.stat + "_ms")
+        regressions = _print_comparison(rows, args.threshold)
+        return 1 if regressions else 0
+
+    baseline = _load_results(args.baseline) if args.baseline else None
+    if baseline is not None and args.filter: # Benchmarks left out on purpose are not "missing"
+        baseline["results"] = {name: stats for name, stats in baseline["results"].items()
+                               if any(f in name for f in args.filter)}
+    def progress(name, stats):
+        print(f"{name:<42} {stats['median_ms']:>10.4f} ms  (min {stats['min_ms']:.4f}, stdev {stats['stdev_ms']:.4f})", flush=True)
+    results = run(args.filter, progress)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"wrote {args.out}")
+    pygame.quit()
+    if baseline is not None:
+        return 1 if _print_comparison(compare(baseline, results, args.threshold, args.stat + "_ms"), args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
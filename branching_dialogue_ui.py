@@ -4,7 +4,8 @@ Enhanced Dialogue UI that scrolls text letter-by-letter and presents selectable
 Includes a gradient background and text shadow for improved readability.
 """
 import pygame, textwrap
-from ui_helpers import draw_vertical_gradient
+from ui_helpers import gradient_surface
+from resources import get_sys_font, render_text
 
 # Global dialogue journal
 dialogue_journal = []
@@ -18,7 +19,7 @@ class BranchingDialogueUI:
         self.choices = dialogue_script.get("choices", {})
         self.choice_keys = list(self.choices.keys())
         self.selected = 0
-        self.font = pygame.font.SysFont("arial", 28)
+        self.font = get_sys_font("arial", 28)
         self.clock = pygame.time.Clock()
         self.scroll_delay = scroll_delay
         self.wrap_width = wrap_width
@@ -86,19 +87,18 @@ class BranchingDialogueUI:
         # Create dialogue panel with gradient.
         panel_width = 700 - (x_offset - 50)
         panel_height = 150
-        panel = pygame.Surface((panel_width, panel_height))
-        draw_vertical_gradient(panel, (20, 20, 40), (0, 0, 0))
-        pygame.draw.rect(panel, (255, 255, 255), panel.get_rect(), 2)
-        self.screen.blit(panel, (x_offset, 400))
+        panel = gradient_surface((panel_width, panel_height), (20, 20, 40), (0, 0, 0)) # Cached per panel size
+        panel_rect = self.screen.blit(panel, (x_offset, 400))
+        pygame.draw.rect(self.screen, (255, 255, 255), panel_rect, 2)
         # Render dialogue text with a shadow.
         wrapped_text = self.wrap_text(self.displayed_text)
         lines = wrapped_text.split("\n")
         y = 410
         for line in lines:
             # Draw shadow.
-            shadow = self.font.render(line, True, (0, 0, 0))
+            shadow = render_text(self.font, line, True, (0, 0, 0))
             self.screen.blit(shadow, (x_offset + 12, y + 2))
-            text_surf = self.font.render(line, True, (255, 255, 255))
+            text_surf = render_text(self.font, line, True, (255, 255, 255))
             self.screen.blit(text_surf, (x_offset + 10, y))
             y += 30
         if self.in_choice_mode and self.choices:
@@ -106,7 +106,7 @@ class BranchingDialogueUI:
             for idx, key in enumerate(self.choice_keys):
                 choice_text = f"{key}: {self.choices[key]}"
                 color = (255, 255, 0) if idx == self.selected else (255, 255, 255)
-                option_surf = self.font.render(choice_text, True, color)
+                option_surf = render_text(self.font, choice_text, True, color)
                 self.screen.blit(option_surf, (x_offset + 20, y))
                 y += 30
         pygame.display.flip()
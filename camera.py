@@ -0,0 +1,70 @@
+# camera.py
+"""
+Camera/viewport for levels larger than the screen.
+
+The camera is a rectangle in level coordinates. LevelManager.draw() renders the part of the
+level under it, and sprites are drawn at camera.to_screen() of their level position.
+"""
+import pygame
+
+
+class Camera:
+    """
+    A viewport into a level, optionally kept inside the level's bounds.
+
+    Attributes:
+        rect:       pygame.Rect of the visible area, in level pixels.
+        level_size: (width, height) of the level the camera is clamped to, or None for no clamping.
+    """
+    def __init__(self, viewport_size: tuple[int, int], level_size: tuple[int, int] | None = None):
+        """
+        Initializes a camera looking at the top-left corner of the level.
+
+        Args:
+            viewport_size: (width, height) of the visible area, usually the screen size.
+            level_size:    (width, height) of the level, or None to allow scrolling anywhere.
+        """
+        self.rect = pygame.Rect((0, 0), viewport_size)
+        self.level_size = level_size
+
+    def _clamp(self):
+        """
+        Keeps the viewport inside the level; a level smaller than the viewport stays at the top-left.
+        """
+        if self.level_size is None:
+            return
+        level_width, level_height = self.level_size
+        self.rect.x = max(0, min(self.rect.x, level_width - self.rect.width))
+        self.rect.y = max(0, min(self.rect.y, level_height - self.rect.height))
+
+    def follow(self, target):
+        """
+        Centers the viewport on a level position or on the center of a rect.
+        """
+        self.rect.center = target.center if isinstance(target, pygame.Rect) else (int(target[0]), int(target[1]))
+        self._clamp()
+
+    def move(self, dx: int, dy: int):
+        """
+        Scrolls the viewport by (dx, dy) pixels.
+        """
+        self.rect.move_ip(dx, dy)
+        self._clamp()
+
+    def to_screen(self, pos) -> tuple[int, int]:
+        """
+        Converts a level position to a screen position.
+        """
+        return pos[0] - self.rect.x, pos[1] - self.rect.y
+
+    def to_level(self, pos) -> tuple[int, int]:
+        """
+        Converts a screen position (e.g., the mouse) to a level position.
+        """
+        return pos[0] + self.rect.x, pos[1] + self.rect.y
+
+    def apply(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Returns a level-space rect moved into screen space.
+        """
+        return rect.move(-self.rect.x, -self.rect.y)
@@ -8,9 +8,23 @@ config = {
     "volume": 0.5,  # Initial music volume (0.0 to 1.0)
     "control_scheme": "arrows",  # Default control scheme: "arrows" or "wasd"
     "art_theme": "default",      # Default art theme: "default" or "dark"
-    "boss_health": 5             # Initial boss health points
+    "boss_health": 5,            # Initial boss health points
+    "dirty_rect_rendering": False,  # Only redraw changed screen regions while playing (freezes the parallax background)
+    "resource_cache_budget_mb": 64,  # Memory budget for cached images, sprite sheets and sounds
+    "use_asset_pack": True,  # Read assets from assets.pak (python asset_pack.py build) when it exists
+    "texture_atlas": False,  # Pack the small images listed in assets/data/atlas.json into shared atlas pages (no saving measured yet, see benchmarks.bench_atlas)
+    "entity_store": False,  # Move enemies, drones and projectiles in batch from NumPy arrays (see entity_store.py)
+    "hot_reload_data": False,  # Re-parse assets/data JSON files edited while the game runs (for content authors)
+    "record_input": None  # File to record every game to for deterministic replay (python replay.py FILE), or None
 }
 
+# Simulation timing - game logic advances in fixed ticks, independent of how fast frames are rendered
+SIMULATION_HZ = 60 # Simulation ticks per second; sprite speeds are tuned in pixels per tick at this rate
+SIMULATION_DT = 1.0 / SIMULATION_HZ # Length of one simulation tick in seconds
+MAX_TICKS_PER_FRAME = 5 # Catch-up limit per rendered frame; time beyond this is dropped instead of spiralling
+MAX_RENDER_FPS = 60 # Upper bound on rendered frames per second
+IDLE_WAIT_MS = 250 # Longest sleep waiting for input on static screens (menus, pause); background work runs in between
+
 def load_high_score():
     """
     Loads the high score from the 'highscore.txt' file.
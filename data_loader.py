@@ -1,22 +1,171 @@
 # data_loader.py
 """
 A simple data loader that reads external JSON files for dialogue, quests, levels, etc.
+
+Files are cached by path. A cached file is checked against the modification time and size of
+the loose file (or the mounted archive it came from) on every load and read again only if it
+changed. load_json(..., frozen=True) returns the shared parsed data as read-only views
+(mappings and tuples) without copying it; otherwise callers get their own mutable copy, parsed
+from the cached text (which is faster than copying the frozen data).
+
+For content authors, set_hot_reload(True) makes poll_changes() (called once per frame by the
+main loop) re-parse the cached files that changed on disk, at most every HOT_RELOAD_INTERVAL seconds.
+In hot-reload mode the loose files take precedence over a mounted archive, which would otherwise
+keep serving the data as it was when the archive was built.
 """
-import json, os, logging
+import json, os, logging, time
+from types import MappingProxyType
+import asset_pack
 
 logger = logging.getLogger(__name__)
 DATA_DIR = os.path.join("assets", "data")
+HOT_RELOAD_INTERVAL = 0.5 # Seconds between checks of the cached files in hot-reload mode
 
-def load_json(filename):
-    filepath = os.path.join(DATA_DIR, filename)
-    if not os.path.exists(filepath):
-        logger.warning(f"Data file {filepath} not found. Returning empty dict.")
-        return {}
+_cache = {} # filepath -> [stamp, text, frozen data or None until first requested]
+_hot_reload = False
+_last_poll = 0.0
+
+
+def freeze(data):
+    """
+    Returns a read-only view of parsed JSON: dicts become MappingProxyTypes and lists tuples, recursively.
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, (list, tuple)):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+def thaw(data):
+    """
+    Returns a mutable copy of frozen (or plain) JSON data, as json.load would have returned it.
+    """
+    if isinstance(data, (dict, MappingProxyType)):
+        return {key: thaw(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [thaw(value) for value in data]
+    return data
+
+
+def _stamp(filepath):
+    """
+    Returns what identifies the current version of a data file: the archive mapping and size of a
+    packed file, the (mtime, size) of a loose file, or None if it does not exist.
+
+    A packed file wins over the loose one, except in hot-reload mode when the loose file exists.
+    """
+    packed = asset_pack.mounted_file(filepath)
+    if packed is not None and not (_hot_reload and os.path.exists(filepath)):
+        return ("archive", id(packed.obj), packed.nbytes) # Changes only when another archive is mounted
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read(filename, filepath, stamp):
+    """
+    Reads and parses a data file and caches it. Returns (entry, parsed data), or None if it is missing or invalid.
+    Reads from wherever _stamp() found the file.
+    """
+    packed = asset_pack.mounted_file(filepath) if stamp is not None and stamp[0] == "archive" else None
+    if packed is not None: # Read from the mounted archive, no file system access
+        try:
+            text = str(packed, "utf-8")
+            data = json.loads(text)
+            logger.info(f"Loaded data from {filename} (archive)")
+        except Exception as e:
+            logger.error(f"Error reading {filename} from archive: {e}")
+            return None
+    elif stamp is None:
+        logger.warning(f"Data file {filepath} not found. Returning empty dict.")
+        return None
+    else:
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                text = f.read()
+            data = json.loads(text)
             logger.info(f"Loaded data from {filename}")
-            return data
-    except Exception as e:
-        logger.error(f"Error reading {filename}: {e}")
-        return {}
+        except Exception as e:
+            logger.error(f"Error reading {filename}: {e}")
+            return None
+    entry = _cache[filepath] = [stamp, text, None]
+    return entry, data
+
+
+def load_json(filename, frozen=False):
+    """
+    Loads a JSON file from assets/data, from the cache if it has not changed since it was parsed.
+
+    Args:
+        filename: File name relative to assets/data.
+        frozen:   Return the shared cached data as read-only views (MappingProxyType/tuple) instead of a
+                  mutable copy. Use thaw() on the parts that need to be modified.
+
+    Returns:
+        The parsed data, or an empty dict if the file is missing or cannot be parsed.
+    """
+    filepath = os.path.join(DATA_DIR, filename)
+    stamp = _stamp(filepath)
+    entry = _cache.get(filepath)
+    if entry is not None and entry[0] == stamp:
+        data = None
+    else:
+        _cache.pop(filepath, None)
+        loaded = _read(filename, filepath, stamp)
+        if loaded is None:
+            return MappingProxyType({}) if frozen else {}
+        entry, data = loaded # Freshly parsed: can be handed out (or frozen) without another parse
+    if not frozen:
+        return data if data is not None else json.loads(entry[1])
+    if entry[2] is None:
+        entry[2] = freeze(data if data is not None else json.loads(entry[1]))
+    return entry[2]
+
+
+def clear_cache():
+    """
+    Drops every cached file.
+    """
+    _cache.clear()
+
+
+def set_hot_reload(enabled):
+    """
+    Turns hot-reload mode (see poll_changes()) on or off. While it is on, loose data files are read
+    instead of their copies in a mounted archive.
+    """
+    global _hot_reload
+    _hot_reload = enabled
+
+
+def poll_changes(force=False):
+    """
+    In hot-reload mode, re-parses the cached files that changed on disk since they were loaded.
+
+    Does nothing outside hot-reload mode or if the files were checked less than HOT_RELOAD_INTERVAL
+    seconds ago, unless forced. Files that are not cached are not checked; they are parsed on first load.
+
+    Returns:
+        The file names (relative to assets/data) that were reloaded or dropped because they disappeared.
+    """
+    global _last_poll
+    now = time.monotonic()
+    if not force and (not _hot_reload or now - _last_poll < HOT_RELOAD_INTERVAL):
+        return []
+    _last_poll = now
+    changed = []
+    for filepath, entry in list(_cache.items()):
+        current = _stamp(filepath)
+        if current == entry[0]:
+            continue
+        filename = os.path.relpath(filepath, DATA_DIR)
+        del _cache[filepath]
+        if current is not None:
+            _read(filename, filepath, current)
+        changed.append(filename)
+    if changed:
+        logger.info(f"Reloaded changed data files: {', '.join(changed)}")
+    return changed
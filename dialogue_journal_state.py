@@ -2,6 +2,7 @@
 import pygame
 import textwrap
 from branching_dialogue_ui import dialogue_journal
+from resources import get_sys_font, render_text
 
 
 class DialogueJournalState:
@@ -12,10 +13,10 @@ class DialogueJournalState:
 
     def __init__(self, screen):
         self.screen = screen
-        self.font = pygame.font.SysFont("arial", 24)
+        self.font = get_sys_font("arial", 24)
         self.clock = pygame.time.Clock()
         self.offset = 0
-        self.instruction = self.font.render("UP/DOWN: Scroll, ESC: Exit Journal", True, (200, 200, 200))
+        self.instruction = render_text(self.font, "UP/DOWN: Scroll, ESC: Exit Journal", True, (200, 200, 200))
         self.journal_text = "\n\n".join(dialogue_journal) if dialogue_journal else "No dialogue recorded."
         self.wrap_width = 80
         self.journal_lines = self.wrap_text(self.journal_text).split("\n")
@@ -48,7 +49,7 @@ class DialogueJournalState:
         self.screen.blit(panel, (20, 20))
         y = 30 - self.offset
         for line in self.journal_lines:
-            text_surf = self.font.render(line, True, (255, 255, 255))
+            text_surf = render_text(self.font, line, True, (255, 255, 255))
             self.screen.blit(text_surf, (40, y))
             y += 30
         self.screen.blit(self.instruction, (40, 500))
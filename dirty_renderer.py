@@ -0,0 +1,128 @@
+# dirty_renderer.py
+"""
+Dirty-rectangle renderer for PlayingState.
+
+Instead of recompositing the whole scene and flipping the full display every frame, the
+static part of the scene (background and structures) is composited once into a cached
+surface. Each frame only the regions that changed are restored from that cache and redrawn,
+and just those rectangles are pushed to the display with pygame.display.update(rects).
+
+The parallax background is frozen while this renderer is in use: a scrolling background
+changes every pixel of the screen on every tick, which would make every frame a full redraw.
+"""
+import logging
+
+import pygame
+
+from sprites import interpolated_position
+
+logger = logging.getLogger(__name__)
+
+
+class DirtyRectRenderer:
+    """
+    Draws a PlayingState frame by frame, tracking which screen regions changed.
+
+    The state provides its drawing layers through _sprite_layers() (sprite groups in draw order),
+    _hud_items() (HUD text that is only redrawn when it changes or something moved beneath it)
+    and _draw_overlays() (opaque shapes drawn last, which return the rects they touched).
+
+    Attributes:
+        full_redraws: Number of frames that had to recomposite the whole screen.
+    """
+    def __init__(self):
+        """
+        Initializes the renderer. The static layer is built on the first render.
+        """
+        self._static = None # Cached background + structures
+        self._previous_rects = [] # Screen regions covered by sprites/overlays last frame
+        self._previous_hud = set() # (key, rect tuple) of every HUD item drawn last frame
+        self.full_redraws = 0
+
+    def invalidate(self):
+        """
+        Forces the next render to rebuild the static layer and redraw the whole screen.
+
+        Call this whenever something else has drawn over the screen (another state, a display
+        mode change) or when the static scene itself changed.
+        """
+        self._static = None
+
+    def _build_static(self, state) -> pygame.Surface:
+        """
+        Composites the parts of the scene that do not change from frame to frame.
+        """
+        screen = state.screen
+        static = pygame.Surface(screen.get_size(), 0, screen) # Same pixel format as the screen for fast restores
+        state.parallax_background.draw(static)
+        state.structure_group.draw(static)
+        logger.debug(f"Static layer built at {screen.get_size()}")
+        return static
+
+    def render(self, state, alpha: float = 1.0) -> list[pygame.Rect]:
+        """
+        Draws the current frame of a PlayingState onto its screen.
+
+        Args:
+            state: The PlayingState to draw.
+            alpha: Interpolation factor between the previous and current simulation tick.
+
+        Returns:
+            The list of screen rectangles that changed and have to be pushed to the display.
+        """
+        screen = state.screen
+        screen_rect = screen.get_rect()
+        full = self._static is None or self._static.get_size() != screen.get_size()
+        if full:
+            self._static = self._build_static(state)
+            screen.blit(self._static, (0, 0))
+            self.full_redraws += 1
+
+        # Work out where every sprite goes this frame before touching the screen.
+        sprite_draws = []
+        for group, interpolate in state._sprite_layers():
+            for sprite in group:
+                position = interpolated_position(sprite, alpha) if interpolate else sprite.rect.topleft
+                sprite_draws.append((sprite.image, sprite.image.get_rect(topleft=position)))
+        sprite_rects = [rect for _, rect in sprite_draws]
+
+        # Everything that moved (where it was and where it is now) has to be restored.
+        dirty = [] if full else list(self._previous_rects)
+        dirty.extend(sprite_rects)
+
+        # HUD items are redrawn when their content or position changed, or when anything
+        # below them is being restored; otherwise their pixels are left alone.
+        hud_items = state._hud_items()
+        current_hud = {(key, tuple(rect)) for key, _, rect in hud_items}
+        for key, rect in self._previous_hud - current_hud:
+            dirty.append(pygame.Rect(rect)) # Old text that changed or disappeared
+        redraw_hud = [full or (key, tuple(rect)) not in self._previous_hud for key, _, rect in hud_items]
+        changed = True
+        while changed: # Restoring one HUD item can expose another
+            changed = False
+            for index, (_, _, rect) in enumerate(hud_items):
+                if not redraw_hud[index] and rect.collidelist(dirty) != -1:
+                    redraw_hud[index] = True
+                    changed = True
+        for index, (_, _, rect) in enumerate(hud_items):
+            if redraw_hud[index]:
+                dirty.append(rect)
+
+        if not full:
+            dirty = [rect.clip(screen_rect) for rect in dirty]
+            dirty = [rect for rect in dirty if rect.width and rect.height]
+            for rect in dirty:
+                screen.blit(self._static, rect, rect) # Restore the static scene underneath
+
+        for image, rect in sprite_draws:
+            screen.blit(image, rect)
+        for index, (_, surface, rect) in enumerate(hud_items):
+            if redraw_hud[index]:
+                screen.blit(surface, rect)
+        overlay_rects = state._draw_overlays() # Opaque, so drawing them again over themselves is harmless
+
+        self._previous_rects = sprite_rects + overlay_rects
+        self._previous_hud = current_hud
+        if full:
+            return [screen_rect]
+        return dirty + [rect.clip(screen_rect) for rect in overlay_rects]
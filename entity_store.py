@@ -0,0 +1,255 @@
+# entity_store.py
+"""
+Structure-of-arrays storage for moving sprites.
+
+An EntityGroup is a pygame.sprite.Group that keeps the positions, speeds, directions, health
+and timers of its sprites in contiguous NumPy arrays and moves all of them in one batch per
+tick, instead of calling a Python update() on every sprite. The sprites become thin views:
+their rect and prev_pos are written by the group for drawing and collisions, and attributes
+declared as StoredAttribute read and write the group's arrays while the sprite is a member.
+
+A sprite class opts in with a `motion` class attribute naming one of the batch motions below.
+Sprites without one are updated by their own update() as in a plain Group. Positions are
+rounded to the rect exactly as pygame rounds them, so a batch tick moves every sprite to the
+same pixel as its update() would.
+
+NumPy is optional: without it has_numpy() is False and PlayingState keeps plain Groups.
+"""
+import logging
+from itertools import chain
+
+import pygame
+
+import config
+
+try:
+    import numpy as np
+except ImportError: # NumPy is optional; sprites then update themselves one by one
+    np = None
+
+logger = logging.getLogger(__name__)
+
+BOUNCE = "bounce" # Horizontal travel reversing at the left/right screen edges (enemies, boss)
+BOB = "bob" # Horizontal travel with a sine bob, wrapping around at the right edge (drones)
+VERTICAL = "vertical" # Vertical travel, killed once fully off the top (direction -1) or bottom (direction 1)
+_MOTION_CODES = {BOUNCE: 0, BOB: 1, VERTICAL: 2}
+
+SCREEN_SIZE = (800, 600) # Bounds the batch motions bounce, wrap and kill at, as in the sprites' update()
+INITIAL_CAPACITY = 64 # Rows allocated up front; the arrays double when full
+COLUMNS = { # Stored attribute name -> array dtype
+    "speed": "f8",
+    "direction": "i8",
+    "health": "i8",
+    "attack_timer_ms": "f8",
+    "counter": "f8", # Elapsed ticks driving the sine bob
+    "start_y": "f8",
+    "amplitude": "f8",
+    "frequency": "f8",
+}
+
+
+def has_numpy() -> bool:
+    """
+    Returns True if EntityGroup can be used.
+    """
+    return np is not None
+
+
+class StoredAttribute:
+    """
+    Descriptor for a sprite attribute that lives in the EntityGroup arrays while the sprite is a member.
+
+    Outside an EntityGroup the value is kept in the instance dict as usual. The attribute name must be
+    one of COLUMNS.
+    """
+    def __set_name__(self, owner, name):
+        if name not in COLUMNS:
+            raise ValueError(f"{owner.__name__}.{name} has no entity store column")
+        self.name = name
+
+    def __get__(self, sprite, owner=None):
+        if sprite is None:
+            return self
+        entity_group = sprite.__dict__.get("entity_group")
+        if entity_group is not None:
+            return entity_group._columns[self.name][sprite.__dict__["entity_slot"]].item()
+        try:
+            return sprite.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(f"'{type(sprite).__name__}' object has no attribute '{self.name}'") from None
+
+    def __set__(self, sprite, value):
+        entity_group = sprite.__dict__.get("entity_group")
+        if entity_group is not None:
+            entity_group._columns[self.name][sprite.__dict__["entity_slot"]] = value
+        else:
+            sprite.__dict__[self.name] = value
+
+
+def _stored_attributes(sprite_class) -> tuple[str, ...]:
+    """
+    Returns the names of the StoredAttributes of a sprite class.
+    """
+    return tuple(name for name in COLUMNS if isinstance(getattr(sprite_class, name, None), StoredAttribute))
+
+
+def _round(values):
+    """
+    Rounds half away from zero, as pygame does when a float is assigned to a Rect.
+    """
+    whole = np.trunc(values)
+    return (whole + np.trunc(2 * (values - whole))).astype(np.int64) # 2 * fraction is exact, and +-1 only from +-0.5 on
+
+
+class EntityGroup(pygame.sprite.Group):
+    """
+    A sprite group that moves its members in batch from structure-of-arrays storage.
+
+    Members must not be in another EntityGroup at the same time. Code outside the group may keep
+    moving a member's rect directly (e.g. a respawn); the next update() picks the new position up.
+
+    Attributes:
+        bounds: (width, height) of the area the motions bounce, wrap and kill at.
+    """
+    def __init__(self, *sprites, bounds: tuple[int, int] = SCREEN_SIZE):
+        """
+        Initializes the group.
+
+        Args:
+            *sprites: Sprites to add.
+            bounds:   (width, height) of the play area.
+
+        Raises:
+            RuntimeError: If NumPy is not installed.
+        """
+        if np is None:
+            raise RuntimeError("EntityGroup requires NumPy")
+        self.bounds = bounds
+        self._slots = [] # Row -> sprite; rows are kept dense
+        self._animated = [] # Members with an update_animation() to call every tick
+        self._unmanaged = [] # Members without a batch motion, updated by their own update()
+        self._allocate(INITIAL_CAPACITY)
+        super().__init__(*sprites)
+
+    def _allocate(self, capacity: int):
+        """
+        (Re)allocates the arrays with room for `capacity` sprites, keeping the current rows.
+        """
+        count = len(getattr(self, "_slots", ()))
+        def grow(old, dtype, columns=None):
+            new = np.zeros((capacity, columns) if columns else capacity, dtype=dtype)
+            if old is not None:
+                new[:count] = old[:count]
+            return new
+        self._x = grow(getattr(self, "_x", None), "f8") # Sub-pixel position
+        self._y = grow(getattr(self, "_y", None), "f8")
+        self._size = grow(getattr(self, "_size", None), "i8", 2)
+        self._motion = grow(getattr(self, "_motion", None), "i8")
+        self._synced = grow(getattr(self, "_synced", None), "i8", 2) # Rect topleft last written by update()
+        old_columns = getattr(self, "_columns", {})
+        self._columns = {name: grow(old_columns.get(name), dtype) for name, dtype in COLUMNS.items()}
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        motion = getattr(sprite, "motion", None)
+        if motion is None or sprite.__dict__.get("entity_group") is not None:
+            self._unmanaged.append(sprite)
+            return
+        row = len(self._slots)
+        if row == len(self._x):
+            self._allocate(2 * row)
+        for name in _stored_attributes(type(sprite)):
+            if name in sprite.__dict__: # Unset attributes stay 0 while stored
+                self._columns[name][row] = sprite.__dict__.pop(name)
+        self._x[row], self._y[row] = sprite.pos
+        self._size[row] = sprite.rect.size
+        self._motion[row] = _MOTION_CODES[motion]
+        self._synced[row] = sprite.rect.topleft
+        sprite.entity_group, sprite.entity_slot = self, row
+        self._slots.append(sprite)
+        if hasattr(sprite, "update_animation"):
+            self._animated.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if sprite.__dict__.get("entity_group") is not self:
+            if sprite in self._unmanaged:
+                self._unmanaged.remove(sprite)
+            return
+        row = sprite.entity_slot
+        for name in _stored_attributes(type(sprite)): # Hand the values back to the sprite
+            sprite.__dict__[name] = self._columns[name][row].item()
+        sprite.pos.update(self._x[row], self._y[row])
+        sprite._synced_topleft = sprite.rect.topleft
+        sprite.entity_group = sprite.entity_slot = None
+        last = len(self._slots) - 1
+        if row != last: # Move the last row into the hole to keep the rows dense
+            moved = self._slots[last]
+            for array in (self._x, self._y, self._size, self._motion, self._synced, *self._columns.values()):
+                array[row] = array[last]
+            self._slots[row] = moved
+            moved.entity_slot = row
+        self._slots.pop()
+        if sprite in self._animated:
+            self._animated.remove(sprite)
+
+    def update(self, dt: float = config.SIMULATION_DT):
+        """
+        Advances every member by one simulation tick.
+
+        Args:
+            dt: Length of the tick in seconds.
+        """
+        count = len(self._slots)
+        if count:
+            self._move(count, dt)
+        for sprite in self._animated:
+            sprite.update_animation(dt)
+        for sprite in list(self._unmanaged):
+            sprite.update(dt)
+
+    def _move(self, count: int, dt: float):
+        """
+        Runs the batch motions on the first `count` rows and writes the results to the sprites.
+        """
+        sprites = self._slots
+        ticks = dt * config.SIMULATION_HZ
+        x, y, motion = self._x[:count], self._y[:count], self._motion[:count]
+        width, height = self._size[:count, 0], self._size[:count, 1]
+        columns = {name: column[:count] for name, column in self._columns.items()}
+        speed, direction = columns["speed"], columns["direction"]
+
+        starts = [sprite.rect.topleft for sprite in sprites] # Also where drawing interpolates from
+        start = np.fromiter(chain.from_iterable(starts), np.int64, 2 * count).reshape(count, 2)
+        moved = (start != self._synced[:count]).any(axis=1) # Rects moved directly since the last tick: snap to them
+        if moved.any():
+            x[moved] = start[moved, 0]
+            y[moved] = start[moved, 1]
+
+        bounce, bob, vertical = motion == 0, motion == 1, motion == 2
+        step = speed * direction * dt * config.SIMULATION_HZ
+        x += np.where(bounce, step, 0.0)
+        y += np.where(vertical, step, 0.0)
+        if bob.any():
+            counter = columns["counter"]
+            x[bob] += speed[bob] * ticks
+            counter[bob] += ticks
+            y[bob] = columns["start_y"][bob] + columns["amplitude"][bob] * np.sin(columns["frequency"][bob] * counter[bob])
+
+        left, top = _round(x), _round(y)
+        bounds_width, bounds_height = self.bounds
+        direction[bounce & ((left + width >= bounds_width) | (left <= 0))] *= -1
+        wrap = bob & (left > bounds_width)
+        if wrap.any(): # Back in at the left edge
+            left[wrap] = -width[wrap]
+            x[wrap], y[wrap] = left[wrap], top[wrap]
+        dead = vertical & np.where(direction < 0, top + height < 0, top > bounds_height)
+
+        self._synced[:count, 0] = left
+        self._synced[:count, 1] = top
+        for sprite, topleft, prev_pos in zip(sprites, zip(left.tolist(), top.tolist()), starts):
+            sprite.rect.topleft = topleft
+            sprite.prev_pos = prev_pos
+        if dead.any():
+            for sprite in [sprites[row] for row in np.flatnonzero(dead)]:
+                sprite.kill()
@@ -1,60 +1,39 @@
 #generate_assets.py
+"""
+Generates the game's pixel-art assets.
 
-import pygame, os, math, random, struct, wave
+Every output file is an AssetTarget in TARGETS below. Running the script builds the targets
+whose generator code or arguments changed since the last run (see asset_build), in parallel,
+and writes assets/data/asset_manifest.json.
 
+Usage:
+    python generate_assets.py [target ...] [--force] [--jobs N] [--list]
+"""
+import argparse
+import functools
+import logging
+import math
+import random
 
-pygame.init()
+import pygame
 
-# Set up the assets folder.
-assets_dir = "assets"
-if not os.path.exists(assets_dir):
-    os.makedirs(assets_dir)
+import asset_build
+from asset_effects import add_pixel_noise, has_numpy, vertical_gradient
+from asset_build import AssetTarget
 
-def save_asset(surface, filename):
-    path = os.path.join(assets_dir, filename)
-    pygame.image.save(surface, path)
-    print(f"Saved {path}")
 
 # ---------------------
-# Utility: Generate Radial Gradient Circle (remains useful)
-def generate_gradient_circle(radius, color_center, color_edge):
-    """Generate a circular Surface with a radial gradient."""
-    size = radius * 2
-    surf = pygame.Surface((size, size), pygame.SRCALPHA)
-    for r in range(radius, 0, -1):
-        t = r / radius  # 1 at center, 0 at edge
-        color = (
-            int(color_center[0]*t + color_edge[0]*(1-t)),
-            int(color_center[1]*t + color_edge[1]*(1-t)),
-            int(color_center[2]*t + color_edge[2]*(1-t)),
-            255
-        )
-        pygame.draw.circle(surf, color, (radius, radius), r)
-    return surf
-
-# ---------------------
-# Utility: Add Pixel Noise (new utility for detailed textures)
-def add_pixel_noise(surf, intensity=20):
-    """Adds subtle pixel noise to a Surface for texture."""
-    width, height = surf.get_size()
-    for _ in range(width * height // intensity):
-        x = random.randint(0, width-1)
-        y = random.randint(0, height-1)
-        color = surf.get_at((x,y))
-        offset = random.randint(-10, 10)
-        noisy_color = (
-            max(0, min(255, color[0] + offset)),
-            max(0, min(255, color[1] + offset)),
-            max(0, min(255, color[2] + offset)),
-            color[3]
-        )
-        surf.set_at((x,y), noisy_color)
-    return surf
+# Utilities: radial gradient circle, pixel noise and vertical gradients live in asset_effects
+# (vectorized with NumPy when available). The build reseeds the global generator per target
+# from ASSET_SEED, so every run produces the same images.
+ASSET_SEED = 1991
 
 
 # ---------------------
 # Common Font for text rendering (smaller, pixel-art style font)
-font = pygame.font.Font(pygame.font.get_default_font(), 10)
+@functools.lru_cache(maxsize=None)
+def default_font(size=10):
+    return pygame.font.Font(pygame.font.get_default_font(), size)
 
 # --------------------- Detailed Hero Assets ---------------------
 def generate_detailed_ukrainian_soldier():
@@ -111,8 +90,6 @@ def generate_detailed_ukrainian_soldier():
 
     return surf
 
-ukrainian_soldier = generate_detailed_ukrainian_soldier()
-save_asset(ukrainian_soldier, "ukrainian_soldier.png")
 
 def generate_detailed_russian_soldier():
     surf = pygame.Surface((32,32), pygame.SRCALPHA) # Soldier sprite, same size
@@ -168,8 +145,6 @@ def generate_detailed_russian_soldier():
 
     return surf
 
-russian_soldier = generate_detailed_russian_soldier()
-save_asset(russian_soldier, "russian_soldier.png")
 
 
 def generate_detailed_character(char_code, base_color): # More detailed characters
@@ -225,7 +200,7 @@ def generate_detailed_character(char_code, base_color): # More detailed characte
 
     # Text label - slightly more stylized
     txt_color = (0,0,0) if sum(base_color) > 300 else (255,255,255) # Contrast color
-    txt = font.render(char_code, True, txt_color)
+    txt = default_font().render(char_code, True, txt_color)
     txt_scaled = pygame.transform.scale(txt, (int(txt.get_width()*1.3), int(txt.get_height()*1.3))) # Slightly larger text
     surf.blit(txt_scaled, txt_scaled.get_rect(center=(16,16+4))) # Shift text down
 
@@ -234,14 +209,6 @@ def generate_detailed_character(char_code, base_color): # More detailed characte
 
     return surf
 
-mage = generate_detailed_character("M", (150,50,200))
-save_asset(mage, "mage.png")
-rogue = generate_detailed_character("R", (50,150,50))
-save_asset(rogue, "rogue.png")
-engineer = generate_detailed_character("E", (100,100,150))
-save_asset(engineer, "engineer.png")
-artist = generate_detailed_character("A", (200,150,200))
-save_asset(artist, "artist.png")
 
 # --------------------- Detailed Equipment Assets ---------------------
 def generate_detailed_weapon(): # More detailed Rifle/Assault Rifle
@@ -275,10 +242,11 @@ def generate_detailed_weapon(): # More detailed Rifle/Assault Rifle
 
     return surf
 
-weapon_asset = generate_detailed_weapon()
-weapon_surface = pygame.Surface((32, 32), pygame.SRCALPHA) # Square surface for weapon
-weapon_surface.blit(weapon_asset, ((32 - weapon_asset.get_width())//2, (32 - weapon_asset.get_height())//2 + 10)) # Center, shift down
-save_asset(weapon_surface, "weapon.png")
+def generate_weapon_icon():
+    weapon_asset = generate_detailed_weapon()
+    weapon_surface = pygame.Surface((32, 32), pygame.SRCALPHA) # Square surface for weapon
+    weapon_surface.blit(weapon_asset, ((32 - weapon_asset.get_width())//2, (32 - weapon_asset.get_height())//2 + 10)) # Center, shift down
+    return weapon_surface
 
 
 def generate_detailed_armor(): # More detailed Flak Jacket/Body Armor
@@ -307,8 +275,6 @@ def generate_detailed_armor(): # More detailed Flak Jacket/Body Armor
 
     return surf
 
-armor_asset = generate_detailed_armor()
-save_asset(armor_asset, "armor.png")
 
 
 def generate_detailed_accessory(): # More detailed Binoculars
@@ -345,8 +311,6 @@ def generate_detailed_accessory(): # More detailed Binoculars
 
     return surf
 
-accessory_asset = generate_detailed_accessory()
-save_asset(accessory_asset, "accessory.png")
 
 
 # --------------------- Detailed NPC Assets ---------------------
@@ -393,7 +357,7 @@ def generate_detailed_npc(char_code, base_color): # More detailed NPCs
 
     # Text label - slightly more stylized
     txt_color = (0,0,0) if sum(base_color) > 300 else (255,255,255) # Contrast color
-    txt = font.render(char_code, True, txt_color)
+    txt = default_font().render(char_code, True, txt_color)
     txt_scaled = pygame.transform.scale(txt, (int(txt.get_width()*1.3), int(txt.get_height()*1.3))) # Slightly larger text
     surf.blit(txt_scaled, txt_scaled.get_rect(center=(16,16+4))) # Shift text down
 
@@ -402,307 +366,296 @@ def generate_detailed_npc(char_code, base_color): # More detailed NPCs
 
     return surf
 
-elder = generate_detailed_npc("E", (120,100,80))
-save_asset(elder, "elder.png")
-quest_master = generate_detailed_npc("Q", (150,80,150))
-save_asset(quest_master, "quest_master.png")
-
 
-elder_portrait = pygame.Surface((64,64), pygame.SRCALPHA) # Portrait, same size
-# Portrait - even more detailed face with outline
-face_color_base = (100, 80, 60)
-face_color_shade = (70, 50, 30)
-outline_color = (20, 20, 20) # Define outline color
 
-pygame.draw.circle(elder_portrait, outline_color, (32, 32), 29) # Face outline
-pygame.draw.circle(elder_portrait, face_color_base, (32, 32), 28) # Face base
-pygame.draw.circle(elder_portrait, face_color_shade, (35, 35), 25) # Face shading
-pygame.draw.circle(elder_portrait, outline_color, (32, 32), 28, 1) # Border
-pygame.draw.circle(elder_portrait, outline_color, (24, 24), 4) # Left eye outline
-pygame.draw.circle(elder_portrait, (0,0,0), (24, 24), 3) # Left eye
-pygame.draw.circle(elder_portrait, outline_color, (40, 24), 4) # Right eye outline
-pygame.draw.circle(elder_portrait, (0,0,0), (40, 24), 3) # Right eye
-pygame.draw.rect(elder_portrait, outline_color, (28-1, 40-1, 8+2, 2+2), 1) # Mouth outline
-pygame.draw.rect(elder_portrait, (0,0,0), (28, 40, 8, 2)) # Mouth
-pygame.draw.line(elder_portrait, outline_color, (32, 42), (32, 48), 2) # Chin detail outline
-pygame.draw.line(elder_portrait, (0,0,0), (32, 42), (32, 48), 1) # Chin detail
+def generate_elder_portrait():
+    elder_portrait = pygame.Surface((64,64), pygame.SRCALPHA) # Portrait, same size
+    # Portrait - even more detailed face with outline
+    face_color_base = (100, 80, 60)
+    face_color_shade = (70, 50, 30)
+    outline_color = (20, 20, 20) # Define outline color
 
-ep_font = pygame.font.Font(pygame.font.get_default_font(), 20) # Font, same size
-ep_txt = ep_font.render("E", True, (255,255,255))
-ep_txt_scaled = pygame.transform.scale(ep_txt, (int(ep_txt.get_width()*1.5), int(ep_txt.get_height()*1.5))) # Scale up text
-elder_portrait.blit(ep_txt_scaled, ep_txt_scaled.get_rect(center=(32, 32 + 10))) # Shift text down
+    pygame.draw.circle(elder_portrait, outline_color, (32, 32), 29) # Face outline
+    pygame.draw.circle(elder_portrait, face_color_base, (32, 32), 28) # Face base
+    pygame.draw.circle(elder_portrait, face_color_shade, (35, 35), 25) # Face shading
+    pygame.draw.circle(elder_portrait, outline_color, (32, 32), 28, 1) # Border
+    pygame.draw.circle(elder_portrait, outline_color, (24, 24), 4) # Left eye outline
+    pygame.draw.circle(elder_portrait, (0,0,0), (24, 24), 3) # Left eye
+    pygame.draw.circle(elder_portrait, outline_color, (40, 24), 4) # Right eye outline
+    pygame.draw.circle(elder_portrait, (0,0,0), (40, 24), 3) # Right eye
+    pygame.draw.rect(elder_portrait, outline_color, (28-1, 40-1, 8+2, 2+2), 1) # Mouth outline
+    pygame.draw.rect(elder_portrait, (0,0,0), (28, 40, 8, 2)) # Mouth
+    pygame.draw.line(elder_portrait, outline_color, (32, 42), (32, 48), 2) # Chin detail outline
+    pygame.draw.line(elder_portrait, (0,0,0), (32, 42), (32, 48), 1) # Chin detail
+
+    ep_font = pygame.font.Font(pygame.font.get_default_font(), 20) # Font, same size
+    ep_txt = ep_font.render("E", True, (255,255,255))
+    ep_txt_scaled = pygame.transform.scale(ep_txt, (int(ep_txt.get_width()*1.5), int(ep_txt.get_height()*1.5))) # Scale up text
+    elder_portrait.blit(ep_txt_scaled, ep_txt_scaled.get_rect(center=(32, 32 + 10))) # Shift text down
 
-# Pixel noise for texture
-elder_portrait = add_pixel_noise(elder_portrait, intensity=20)
+    # Pixel noise for texture
+    elder_portrait = add_pixel_noise(elder_portrait, intensity=20)
 
-save_asset(elder_portrait, "elder_portrait.png")
+    return elder_portrait
 
 
 # --------------------- Detailed Level and Miscellaneous Assets ---------------------
-level1_bg = pygame.Surface((800,600))
-level1_bg.fill((25, 25, 25)) # Even darker background
-grid_color = (40, 40, 40) # More subtle grid
-for x in range(0, 801, 32):
-    pygame.draw.line(level1_bg, grid_color, (x,0), (x,600))
-for y in range(0, 601, 32):
-    pygame.draw.line(level1_bg, grid_color, (0,y), (800,y))
-# Pixel noise for background texture
-level1_bg = add_pixel_noise(level1_bg, intensity=30)
-save_asset(level1_bg, "level1_bg.png")
-
-
-bg_layer1 = pygame.Surface((800,600))
-# More textured background layer - varied tile pattern and shading - with outline
-bg_tile_size = 20
-bg_colors_base = [(35, 35, 65), (40, 40, 70), (45, 45, 75), (40, 40, 70)] # Base blue-grey tones
-bg_colors_shade = [(30, 30, 60), (35, 35, 65), (40, 40, 70), (35, 35, 65)] # Shade tones
-outline_color = (10, 10, 30) # Darker outline for tiles
-for x in range(0, 800, bg_tile_size):
-    for y in range(0, 600, bg_tile_size):
-        color_base = random.choice(bg_colors_base)
-        color_shade = random.choice(bg_colors_shade)
-        pygame.draw.rect(bg_layer1, outline_color, (x, y, bg_tile_size, bg_tile_size), 1) # Tile outline
-        pygame.draw.rect(bg_layer1, color_base, (x, y, bg_tile_size, bg_tile_size))
-        if (x + y) % (bg_tile_size * 2) == 0: # Some tiles shaded
-            pygame.draw.rect(bg_layer1, color_shade, (x, y, bg_tile_size, bg_tile_size))
-# Pixel noise for texture
-bg_layer1 = add_pixel_noise(bg_layer1, intensity=25)
-save_asset(bg_layer1, "bg_layer1.png")
-
-
-bg_layer2 = pygame.Surface((800,600))
-# More detailed color gradient for bg_layer2 - subtle bands - with outline
-outline_color = (10, 10, 30) # Darker outline for bands
-for y in range(0, 600, 2): # Bands of 2 pixels
-    t = y / 600
-    color_base = (
-        int(20*(1-t) + 30*t),
-        int(20*(1-t) + 30*t),
-        int(50*(1-t) + 60*t)
-    )
-    color_shade = (
-        int(18*(1-t) + 28*t),
-        int(18*(1-t) + 28*t),
-        int(48*(1-t) + 58*t)
-    )
-    if (y // 2) % 2 == 0: # Alternate bands with shading
-        pygame.draw.line(bg_layer2, outline_color, (0,y), (800,y), 1) # Band outline
-        pygame.draw.line(bg_layer2, color_base, (0,y), (800,y), 2)
-    else:
-        pygame.draw.line(bg_layer2, outline_color, (0,y), (800,y), 1) # Band outline
-        pygame.draw.line(bg_layer2, color_shade, (0,y), (800,y), 2)
-# Pixel noise for texture
-bg_layer2 = add_pixel_noise(bg_layer2, intensity=30)
-save_asset(bg_layer2, "bg_layer2.png")
-
-
-tileset = pygame.Surface((32*10, 32), pygame.SRCALPHA)
-tile_colors_base = [
-    (190,190,190), (170,170,170), (150,150,150),
-    (130,130,130), (110,110,110), (90,90,90),
-    (70,70,70), (50,50,50), (30,30,30), (10,10,10)
-]
-tile_colors_shade = [
-    (170,170,170), (150,150,150), (130,130,130),
-    (110,110,110), (90,90,90), (70,70,70),
-    (50,50,50), (30,30,30), (10,10,10), (0,0,0)
-]
-outline_color = (20, 20, 20) # Tile outline color
-for i in range(10):
-    tile = pygame.Surface((32,32))
-    tile.fill(tile_colors_base[i])
-    if i % 2 == 0:
-        pygame.draw.rect(tile, tile_colors_shade[i], (2,2,28,28)) # Shaded inner tile
-        pygame.draw.rect(tile, outline_color, (1,1,30,30), 1) # Thinner tile border
-        pygame.draw.line(tile, outline_color, (0,0), (32,32), 1) # Diagonal lines
-        pygame.draw.line(tile, outline_color, (32,0), (0,32), 1)
-    # Pixel noise for tile texture
-    tile = add_pixel_noise(tile, intensity=20)
-    tileset.blit(tile, (i*32, 0))
-save_asset(tileset, "tileset.png")
-
-
-tree = pygame.Surface((32,32), pygame.SRCALPHA)
-# More detailed, pixel-art style tree - layered leaves and trunk texture - with outline
-tree_trunk_color_base = (90, 60, 20)
-tree_trunk_color_shade = (70, 40, 10)
-tree_leaf_color_base = (20, 100, 20)
-tree_leaf_color_shade = (10, 80, 10)
-outline_color = (20, 20, 20) # Tree outline color
-
-# Trunk - textured trunk with shading and outline
-pygame.draw.rect(tree, outline_color, (12-1, 15-1, 8+2, 17+2), 1) # Trunk outline
-pygame.draw.rect(tree, tree_trunk_color_base, (12, 15, 8, 17)) # Trunk base
-pygame.draw.rect(tree, tree_trunk_color_shade, (12, 15, 2, 17)) # Trunk shading
-pygame.draw.rect(tree, tree_trunk_color_shade, (18, 15, 2, 17)) # Trunk shading
-pygame.draw.rect(tree, outline_color, (12, 15, 8, 17), 1) # Trunk border - already there, keep for emphasis
-
-# Leaves - layered leaves with shading and outline
-pygame.draw.circle(tree, outline_color, (16, 8), 17) # Leaf outline
-pygame.draw.circle(tree, tree_leaf_color_base, (16, 8), 16) # Leaf base
-pygame.draw.circle(tree, tree_leaf_color_shade, (18, 6), 14) # Leaf shading
-pygame.draw.polygon(tree, tree_leaf_color_base, [(0, 15), (16, 0), (32, 15)]) # Leaf shape overlay
-pygame.draw.polygon(tree, tree_leaf_color_shade, [(2, 15), (16, 2), (30, 15)]) # Leaf shape shading
-pygame.draw.circle(tree, outline_color, (16, 8), 16, 1) # Leaf border - already there, keep for emphasis
-
-# Pixel noise for texture
-tree = add_pixel_noise(tree, intensity=10)
-
-save_asset(tree, "tree.png")
-
-
-rock = pygame.Surface((32,32), pygame.SRCALPHA)
-# More detailed, pixel-art style rock - multi-layered, jagged edges - with outline
-rock_color_base = (100, 100, 100)
-rock_color_shade = (80, 80, 80)
-rock_detail_color = (120, 120, 120)
-outline_color = (20, 20, 20) # Rock outline color
-
-# Rock shape - more complex polygon with outline
-pygame.draw.polygon(rock, outline_color, [(4-1, 16), (16-1, 2), (28+1, 16), (28+1, 24), (16+1, 30), (4-1, 24)], 1) # Outline
-pygame.draw.polygon(rock, rock_color_base, [(4, 16), (16, 2), (28, 16), (28, 24), (16, 30), (4, 24)]) # Base shape
-pygame.draw.polygon(rock, rock_color_shade, [(4, 16), (16, 8), (28, 16), (28, 24), (16, 30), (4, 24)]) # Shading layer
-pygame.draw.polygon(rock, rock_detail_color, [(8, 16), (16, 6), (24, 16), (24, 22), (16, 28), (8, 22)]) # Detail layer
-
-# Edge details - jagged edges - border already acts as outline
-
-# Pixel noise for texture
-rock = add_pixel_noise(rock, intensity=10)
-
-save_asset(rock, "rock.png")
-
-
-intro_bg = pygame.Surface((800,600), pygame.SRCALPHA)
-# More detailed intro background gradient - with noise and bands - with outline
-outline_color = (10, 10, 30) # Darker outline for bands
-for y in range(0, 600, 1): # Finer bands
-    t = y / 600
-    color_base = (
-        int(10*(1-t) + 20*t),
-        int(10*(1-t) + 20*t),
-        int(30*(1-t) + 40*t)
-    )
-    color_shade = (
-        int(8*(1-t) + 18*t),
-        int(8*(1-t) + 18*t),
-        int(28*(1-t) + 38*t)
-    )
-    if (y // 1) % 2 == 0: # Even finer bands with shading
-        pygame.draw.line(intro_bg, outline_color, (0,y), (800,y), 1) # Band outline
-        pygame.draw.line(intro_bg, color_base, (0,y), (800,y), 1)
-    else:
-        pygame.draw.line(intro_bg, outline_color, (0,y), (800,y), 1) # Band outline
-        pygame.draw.line(intro_bg, color_shade, (0,y), (800,y), 1)
-# Pixel noise for texture
-intro_bg = add_pixel_noise(intro_bg, intensity=20)
-save_asset(intro_bg, "intro_bg.png")
+def generate_level1_bg():
+    level1_bg = pygame.Surface((800,600))
+    level1_bg.fill((25, 25, 25)) # Even darker background
+    grid_color = (40, 40, 40) # More subtle grid
+    for x in range(0, 801, 32):
+        pygame.draw.line(level1_bg, grid_color, (x,0), (x,600))
+    for y in range(0, 601, 32):
+        pygame.draw.line(level1_bg, grid_color, (0,y), (800,y))
+    # Pixel noise for background texture
+    level1_bg = add_pixel_noise(level1_bg, intensity=30)
+    return level1_bg
+
+
+def generate_bg_layer1():
+    bg_layer1 = pygame.Surface((800,600))
+    # More textured background layer - varied tile pattern and shading - with outline
+    bg_tile_size = 20
+    bg_colors_base = [(35, 35, 65), (40, 40, 70), (45, 45, 75), (40, 40, 70)] # Base blue-grey tones
+    bg_colors_shade = [(30, 30, 60), (35, 35, 65), (40, 40, 70), (35, 35, 65)] # Shade tones
+    outline_color = (10, 10, 30) # Darker outline for tiles
+    for x in range(0, 800, bg_tile_size):
+        for y in range(0, 600, bg_tile_size):
+            color_base = random.choice(bg_colors_base)
+            color_shade = random.choice(bg_colors_shade)
+            pygame.draw.rect(bg_layer1, outline_color, (x, y, bg_tile_size, bg_tile_size), 1) # Tile outline
+            pygame.draw.rect(bg_layer1, color_base, (x, y, bg_tile_size, bg_tile_size))
+            if (x + y) % (bg_tile_size * 2) == 0: # Some tiles shaded
+                pygame.draw.rect(bg_layer1, color_shade, (x, y, bg_tile_size, bg_tile_size))
+    # Pixel noise for texture
+    bg_layer1 = add_pixel_noise(bg_layer1, intensity=25)
+    return bg_layer1
+
+
+def generate_bg_layer2():
+    bg_layer2 = pygame.Surface((800,600))
+    # More detailed color gradient for bg_layer2 - subtle bands - with outline
+    outline_color = (10, 10, 30) # Darker outline for bands
+    for y in range(0, 600, 2): # Bands of 2 pixels
+        t = y / 600
+        color_base = (
+            int(20*(1-t) + 30*t),
+            int(20*(1-t) + 30*t),
+            int(50*(1-t) + 60*t)
+        )
+        color_shade = (
+            int(18*(1-t) + 28*t),
+            int(18*(1-t) + 28*t),
+            int(48*(1-t) + 58*t)
+        )
+        if (y // 2) % 2 == 0: # Alternate bands with shading
+            pygame.draw.line(bg_layer2, outline_color, (0,y), (800,y), 1) # Band outline
+            pygame.draw.line(bg_layer2, color_base, (0,y), (800,y), 2)
+        else:
+            pygame.draw.line(bg_layer2, outline_color, (0,y), (800,y), 1) # Band outline
+            pygame.draw.line(bg_layer2, color_shade, (0,y), (800,y), 2)
+    # Pixel noise for texture
+    bg_layer2 = add_pixel_noise(bg_layer2, intensity=30)
+    return bg_layer2
+
+
+def generate_tileset():
+    tileset = pygame.Surface((32*10, 32), pygame.SRCALPHA)
+    tile_colors_base = [
+        (190,190,190), (170,170,170), (150,150,150),
+        (130,130,130), (110,110,110), (90,90,90),
+        (70,70,70), (50,50,50), (30,30,30), (10,10,10)
+    ]
+    tile_colors_shade = [
+        (170,170,170), (150,150,150), (130,130,130),
+        (110,110,110), (90,90,90), (70,70,70),
+        (50,50,50), (30,30,30), (10,10,10), (0,0,0)
+    ]
+    outline_color = (20, 20, 20) # Tile outline color
+    for i in range(10):
+        tile = pygame.Surface((32,32))
+        tile.fill(tile_colors_base[i])
+        if i % 2 == 0:
+            pygame.draw.rect(tile, tile_colors_shade[i], (2,2,28,28)) # Shaded inner tile
+            pygame.draw.rect(tile, outline_color, (1,1,30,30), 1) # Thinner tile border
+            pygame.draw.line(tile, outline_color, (0,0), (32,32), 1) # Diagonal lines
+            pygame.draw.line(tile, outline_color, (32,0), (0,32), 1)
+        # Pixel noise for tile texture
+        tile = add_pixel_noise(tile, intensity=20)
+        tileset.blit(tile, (i*32, 0))
+    return tileset
+
+
+def generate_tree():
+    tree = pygame.Surface((32,32), pygame.SRCALPHA)
+    # More detailed, pixel-art style tree - layered leaves and trunk texture - with outline
+    tree_trunk_color_base = (90, 60, 20)
+    tree_trunk_color_shade = (70, 40, 10)
+    tree_leaf_color_base = (20, 100, 20)
+    tree_leaf_color_shade = (10, 80, 10)
+    outline_color = (20, 20, 20) # Tree outline color
+
+    # Trunk - textured trunk with shading and outline
+    pygame.draw.rect(tree, outline_color, (12-1, 15-1, 8+2, 17+2), 1) # Trunk outline
+    pygame.draw.rect(tree, tree_trunk_color_base, (12, 15, 8, 17)) # Trunk base
+    pygame.draw.rect(tree, tree_trunk_color_shade, (12, 15, 2, 17)) # Trunk shading
+    pygame.draw.rect(tree, tree_trunk_color_shade, (18, 15, 2, 17)) # Trunk shading
+    pygame.draw.rect(tree, outline_color, (12, 15, 8, 17), 1) # Trunk border - already there, keep for emphasis
+
+    # Leaves - layered leaves with shading and outline
+    pygame.draw.circle(tree, outline_color, (16, 8), 17) # Leaf outline
+    pygame.draw.circle(tree, tree_leaf_color_base, (16, 8), 16) # Leaf base
+    pygame.draw.circle(tree, tree_leaf_color_shade, (18, 6), 14) # Leaf shading
+    pygame.draw.polygon(tree, tree_leaf_color_base, [(0, 15), (16, 0), (32, 15)]) # Leaf shape overlay
+    pygame.draw.polygon(tree, tree_leaf_color_shade, [(2, 15), (16, 2), (30, 15)]) # Leaf shape shading
+    pygame.draw.circle(tree, outline_color, (16, 8), 16, 1) # Leaf border - already there, keep for emphasis
+
+    # Pixel noise for texture
+    tree = add_pixel_noise(tree, intensity=10)
+
+    return tree
+
+
+def generate_rock():
+    rock = pygame.Surface((32,32), pygame.SRCALPHA)
+    # More detailed, pixel-art style rock - multi-layered, jagged edges - with outline
+    rock_color_base = (100, 100, 100)
+    rock_color_shade = (80, 80, 80)
+    rock_detail_color = (120, 120, 120)
+    outline_color = (20, 20, 20) # Rock outline color
+
+    # Rock shape - more complex polygon with outline
+    pygame.draw.polygon(rock, outline_color, [(4-1, 16), (16-1, 2), (28+1, 16), (28+1, 24), (16+1, 30), (4-1, 24)], 1) # Outline
+    pygame.draw.polygon(rock, rock_color_base, [(4, 16), (16, 2), (28, 16), (28, 24), (16, 30), (4, 24)]) # Base shape
+    pygame.draw.polygon(rock, rock_color_shade, [(4, 16), (16, 8), (28, 16), (28, 24), (16, 30), (4, 24)]) # Shading layer
+    pygame.draw.polygon(rock, rock_detail_color, [(8, 16), (16, 6), (24, 16), (24, 22), (16, 28), (8, 22)]) # Detail layer
+
+    # Edge details - jagged edges - border already acts as outline
+
+    # Pixel noise for texture
+    rock = add_pixel_noise(rock, intensity=10)
+
+    return rock
+
+
+# More detailed intro background gradient - with noise and bands (alternating rows are shaded)
+def generate_intro_bg():
+    intro_bg = vertical_gradient((800,600), (10,10,30), (20,20,40), stripe_colors=((8,8,28), (18,18,38)), flags=pygame.SRCALPHA)
+    # Pixel noise for texture
+    intro_bg = add_pixel_noise(intro_bg, intensity=20)
+    return intro_bg
 
 
 # --------------------- Detailed Sprite Sheet Assets ---------------------
 # player_idle.png: 128x32 sprite sheet (4 frames of 32x32) - same size
-player_idle = pygame.Surface((128,32), pygame.SRCALPHA)
-for i in range(4):
-    frame = pygame.Surface((32,32), pygame.SRCALPHA) # Frame, same size
-    # Ukrainian soldier sprite (using function)
-    frame.blit(generate_detailed_ukrainian_soldier(), (0,0))
-    player_idle.blit(frame, (i*32, 0))
-save_asset(player_idle, "player_idle.png")
+def generate_player_idle():
+    player_idle = pygame.Surface((128,32), pygame.SRCALPHA)
+    for i in range(4):
+        frame = pygame.Surface((32,32), pygame.SRCALPHA) # Frame, same size
+        # Ukrainian soldier sprite (using function)
+        frame.blit(generate_detailed_ukrainian_soldier(), (0,0))
+        player_idle.blit(frame, (i*32, 0))
+    return player_idle
 
 # russian_invader.png: 128x32 sprite sheet (4 frames of 32x32) - same size
-russian_invader = pygame.Surface((128,32), pygame.SRCALPHA)
-for i in range(4):
-    frame = pygame.Surface((32,32), pygame.SRCALPHA) # Frame, same size
-    # Russian soldier sprite (using function)
-    frame.blit(generate_detailed_russian_soldier(), (0,0))
-    russian_invader.blit(frame, (i*32, 0))
-save_asset(russian_invader, "russian_invader.png")
+def generate_russian_invader():
+    russian_invader = pygame.Surface((128,32), pygame.SRCALPHA)
+    for i in range(4):
+        frame = pygame.Surface((32,32), pygame.SRCALPHA) # Frame, same size
+        # Russian soldier sprite (using function)
+        frame.blit(generate_detailed_russian_soldier(), (0,0))
+        russian_invader.blit(frame, (i*32, 0))
+    return russian_invader
 
 
 # --------------------- Detailed Building Assets ---------------------
-fortress = pygame.Surface((160, 128), pygame.SRCALPHA) # Slightly taller fortress
-# Fortress - even more detailed pixel art fortress - with outline
-fortress_wall_color_base = (95, 95, 95)
-fortress_wall_color_shade = (75, 75, 75)
-fortress_detail_color = (85, 85, 85)
-gate_color = (80, 60, 40)
-gate_detail_color = (60, 40, 20)
-outline_color = (20, 20, 20) # Fortress outline color
-
-# Walls - layered walls with more detail and outline
-pygame.draw.rect(fortress, outline_color, (8-1, 20-1, 144+2, 98+2), 1) # Wall outline
-pygame.draw.rect(fortress, fortress_wall_color_base, (8, 20, 144, 98)) # Wall base
-pygame.draw.polygon(fortress, fortress_wall_color_shade, [(8, 20), (80, 10), (152, 20), (152, 118), (8, 118)]) # Wall shading
-# Battlements - more detailed battlements with outline
-for x in range(20, 150, 20):
-    pygame.draw.rect(fortress, outline_color, (x-1, 8-1, 12+2, 12+2), 1) # Battlement outline
-    pygame.draw.rect(fortress, fortress_wall_color_base, (x, 8, 12, 12)) # Battlement base
-    pygame.draw.rect(fortress, fortress_wall_color_shade, (x, 8, 3, 12)) # Battlement shading
-    pygame.draw.rect(fortress, fortress_wall_color_shade, (x+9, 8, 3, 12)) # Battlement shading
-# Gate - detailed gate with wood texture and outline
-pygame.draw.rect(fortress, outline_color, (68-1, 100-1, 24+2, 28+2), 1) # Gate outline
-pygame.draw.rect(fortress, gate_color, (68, 100, 24, 28)) # Gate base
-pygame.draw.rect(fortress, gate_detail_color, (68, 100, 24, 8)) # Gate detail - top wood
-pygame.draw.rect(fortress, gate_detail_color, (68, 112, 24, 8)) # Gate detail - middle wood
-pygame.draw.rect(fortress, gate_detail_color, (68, 124, 24, 4)) # Gate detail - bottom wood
-pygame.draw.rect(fortress, outline_color, (68, 100, 24, 28), 1) # Gate border - already there, keep for emphasis
-
-# Wall details - stone blocks more defined
-block_size = 8
-for x in range(8, 152, block_size):
-    pygame.draw.line(fortress, fortress_detail_color, (x, 20), (x, 118), 1)
-for y in range(20 + block_size, 118, block_size):
-    pygame.draw.line(fortress, fortress_detail_color, (8, y), (152, y), 1)
-pygame.draw.rect(fortress, outline_color, (8, 20, 144, 98), 1) # Wall border - already there, keep for emphasis
-
-# Pixel noise for texture
-fortress = add_pixel_noise(fortress, intensity=20)
-
-save_asset(fortress, "fortress.png")
-
-
-
-village = pygame.Surface((128, 96), pygame.SRCALPHA) # Village, same size
-# Village - even more detailed pixel art village houses - with outline
-village_wall_color_base = (150, 130, 90)
-village_wall_color_shade = (130, 110, 70)
-village_roof_color_base = (110, 80, 50)
-village_roof_color_shade = (90, 60, 30)
-window_color = (180, 200, 220)
-window_detail_color = (150, 170, 190)
-door_color = (90, 70, 50)
-door_detail_color = (70, 50, 30)
-outline_color = (20, 20, 20) # Village outline color
-
-# House 1 - more detailed house with outline
-pygame.draw.rect(village, outline_color, (8-1, 28-1, 42+2, 42+2), 1) # House 1 outline
-pygame.draw.rect(village, village_wall_color_base, (8, 28, 42, 42)) # House 1 wall base
-pygame.draw.polygon(village, village_wall_color_shade, [(8, 28), (30, 23), (50, 28), (50, 70), (8, 70)]) # Wall shading
-pygame.draw.polygon(village, outline_color, [(3-1, 28-1), (30, 3-1), (57+1, 28-1)], 1) # Roof outline
-pygame.draw.polygon(village, village_roof_color_base, [(3, 28), (30, 3), (57, 28)]) # Roof base
-pygame.draw.polygon(village, village_roof_color_shade, [(3, 28), (30, 8), (57, 28)]) # Roof shading
-pygame.draw.rect(village, window_color, (18, 40, 12, 12)) # Window 1
-pygame.draw.rect(village, window_detail_color, (18, 40, 3, 12)) # Window detail
-pygame.draw.rect(village, door_color, (35, 50, 10, 20)) # Door 1
-pygame.draw.rect(village, door_detail_color, (35, 50, 10, 5)) # Door detail
-
-pygame.draw.rect(village, outline_color, (8, 28, 42, 42), 1) # House 1 border - already there, keep for emphasis
-
-# House 2 - more detailed house with outline
-pygame.draw.rect(village, outline_color, (68-1, 38-1, 42+2, 32+2), 1) # House 2 outline
-pygame.draw.rect(village, village_wall_color_base, (68, 38, 42, 32)) # House 2 wall base
-pygame.draw.polygon(village, village_wall_color_shade, [(68, 38), (90, 33), (110, 38), (110, 70), (68, 70)]) # Wall shading - NOTE: Y coord 70 is intentional to align with House 1
-pygame.draw.polygon(village, outline_color, [(63-1, 38-1), (90, 13-1), (117+1, 38-1)], 1) # Roof outline
-pygame.draw.polygon(village, village_roof_color_base, [(63, 38), (90, 13), (117, 38)]) # Roof base
-pygame.draw.polygon(village, village_roof_color_shade, [(63, 38), (90, 18), (117, 38)]) # Roof shading
-pygame.draw.rect(village, window_color, (78, 48, 12, 12)) # Window 2
-pygame.draw.rect(village, window_detail_color, (78, 48, 3, 12)) # Window detail
-
-pygame.draw.rect(village, outline_color, (68, 38, 42, 32), 1) # House 2 border - already there, keep for emphasis
-
-# Pixel noise for texture
-village = add_pixel_noise(village, intensity=20)
-
-save_asset(village, "village.png")
+def generate_fortress():
+    fortress = pygame.Surface((160, 128), pygame.SRCALPHA) # Slightly taller fortress
+    # Fortress - even more detailed pixel art fortress - with outline
+    fortress_wall_color_base = (95, 95, 95)
+    fortress_wall_color_shade = (75, 75, 75)
+    fortress_detail_color = (85, 85, 85)
+    gate_color = (80, 60, 40)
+    gate_detail_color = (60, 40, 20)
+    outline_color = (20, 20, 20) # Fortress outline color
+
+    # Walls - layered walls with more detail and outline
+    pygame.draw.rect(fortress, outline_color, (8-1, 20-1, 144+2, 98+2), 1) # Wall outline
+    pygame.draw.rect(fortress, fortress_wall_color_base, (8, 20, 144, 98)) # Wall base
+    pygame.draw.polygon(fortress, fortress_wall_color_shade, [(8, 20), (80, 10), (152, 20), (152, 118), (8, 118)]) # Wall shading
+    # Battlements - more detailed battlements with outline
+    for x in range(20, 150, 20):
+        pygame.draw.rect(fortress, outline_color, (x-1, 8-1, 12+2, 12+2), 1) # Battlement outline
+        pygame.draw.rect(fortress, fortress_wall_color_base, (x, 8, 12, 12)) # Battlement base
+        pygame.draw.rect(fortress, fortress_wall_color_shade, (x, 8, 3, 12)) # Battlement shading
+        pygame.draw.rect(fortress, fortress_wall_color_shade, (x+9, 8, 3, 12)) # Battlement shading
+    # Gate - detailed gate with wood texture and outline
+    pygame.draw.rect(fortress, outline_color, (68-1, 100-1, 24+2, 28+2), 1) # Gate outline
+    pygame.draw.rect(fortress, gate_color, (68, 100, 24, 28)) # Gate base
+    pygame.draw.rect(fortress, gate_detail_color, (68, 100, 24, 8)) # Gate detail - top wood
+    pygame.draw.rect(fortress, gate_detail_color, (68, 112, 24, 8)) # Gate detail - middle wood
+    pygame.draw.rect(fortress, gate_detail_color, (68, 124, 24, 4)) # Gate detail - bottom wood
+    pygame.draw.rect(fortress, outline_color, (68, 100, 24, 28), 1) # Gate border - already there, keep for emphasis
+
+    # Wall details - stone blocks more defined
+    block_size = 8
+    for x in range(8, 152, block_size):
+        pygame.draw.line(fortress, fortress_detail_color, (x, 20), (x, 118), 1)
+    for y in range(20 + block_size, 118, block_size):
+        pygame.draw.line(fortress, fortress_detail_color, (8, y), (152, y), 1)
+    pygame.draw.rect(fortress, outline_color, (8, 20, 144, 98), 1) # Wall border - already there, keep for emphasis
+
+    # Pixel noise for texture
+    fortress = add_pixel_noise(fortress, intensity=20)
+
+    return fortress
+
+
+
+def generate_village():
+    village = pygame.Surface((128, 96), pygame.SRCALPHA) # Village, same size
+    # Village - even more detailed pixel art village houses - with outline
+    village_wall_color_base = (150, 130, 90)
+    village_wall_color_shade = (130, 110, 70)
+    village_roof_color_base = (110, 80, 50)
+    village_roof_color_shade = (90, 60, 30)
+    window_color = (180, 200, 220)
+    window_detail_color = (150, 170, 190)
+    door_color = (90, 70, 50)
+    door_detail_color = (70, 50, 30)
+    outline_color = (20, 20, 20) # Village outline color
+
+    # House 1 - more detailed house with outline
+    pygame.draw.rect(village, outline_color, (8-1, 28-1, 42+2, 42+2), 1) # House 1 outline
+    pygame.draw.rect(village, village_wall_color_base, (8, 28, 42, 42)) # House 1 wall base
+    pygame.draw.polygon(village, village_wall_color_shade, [(8, 28), (30, 23), (50, 28), (50, 70), (8, 70)]) # Wall shading
+    pygame.draw.polygon(village, outline_color, [(3-1, 28-1), (30, 3-1), (57+1, 28-1)], 1) # Roof outline
+    pygame.draw.polygon(village, village_roof_color_base, [(3, 28), (30, 3), (57, 28)]) # Roof base
+    pygame.draw.polygon(village, village_roof_color_shade, [(3, 28), (30, 8), (57, 28)]) # Roof shading
+    pygame.draw.rect(village, window_color, (18, 40, 12, 12)) # Window 1
+    pygame.draw.rect(village, window_detail_color, (18, 40, 3, 12)) # Window detail
+    pygame.draw.rect(village, door_color, (35, 50, 10, 20)) # Door 1
+    pygame.draw.rect(village, door_detail_color, (35, 50, 10, 5)) # Door detail
+
+    pygame.draw.rect(village, outline_color, (8, 28, 42, 42), 1) # House 1 border - already there, keep for emphasis
+
+    # House 2 - more detailed house with outline
+    pygame.draw.rect(village, outline_color, (68-1, 38-1, 42+2, 32+2), 1) # House 2 outline
+    pygame.draw.rect(village, village_wall_color_base, (68, 38, 42, 32)) # House 2 wall base
+    pygame.draw.polygon(village, village_wall_color_shade, [(68, 38), (90, 33), (110, 38), (110, 70), (68, 70)]) # Wall shading - NOTE: Y coord 70 is intentional to align with House 1
+    pygame.draw.polygon(village, outline_color, [(63-1, 38-1), (90, 13-1), (117+1, 38-1)], 1) # Roof outline
+    pygame.draw.polygon(village, village_roof_color_base, [(63, 38), (90, 13), (117, 38)]) # Roof base
+    pygame.draw.polygon(village, village_roof_color_shade, [(63, 38), (90, 18), (117, 38)]) # Roof shading
+    pygame.draw.rect(village, window_color, (78, 48, 12, 12)) # Window 2
+    pygame.draw.rect(village, window_detail_color, (78, 48, 3, 12)) # Window detail
+
+    pygame.draw.rect(village, outline_color, (68, 38, 42, 32), 1) # House 2 border - already there, keep for emphasis
+
+    # Pixel noise for texture
+    village = add_pixel_noise(village, intensity=20)
+
+    return village
 
 
 
@@ -738,55 +691,54 @@ def generate_detailed_poster(): # Modified propaganda poster - pro-Ukrainian
 
     return poster
 
-poster = generate_detailed_poster()
-save_asset(poster, "propaganda_poster.png")
 
 
 
 # --------------------- Detailed Drone Asset ---------------------
-drone = pygame.Surface((32,32), pygame.SRCALPHA) # Drone, same size
-drone_body_color_base = (110, 110, 130) # Grey-blue drone color, darker
-drone_body_color_shade = (90, 90, 110)
-drone_propeller_color = (60, 60, 80) # Darker propellers
-drone_detail_color = (130, 130, 150) # Lighter detail color
-outline_color = (20, 20, 20) # Drone outline color
-
-# Drone body - more aerodynamic shape with layered shading and outline
-pygame.draw.ellipse(drone, outline_color, (4-1, 4-1, 24+2, 24+2), 1) # Body outline
-pygame.draw.ellipse(drone, drone_body_color_base, (4, 4, 24, 24)) # Body base ellipse
-pygame.draw.ellipse(drone, drone_body_color_shade, (4, 4, 12, 24)) # Body side shading
-pygame.draw.rect(drone, drone_body_color_base, (4, 4, 24, 10)) # Body top rect
-pygame.draw.polygon(drone, drone_body_color_shade, [(4, 4), (16, 2), (28, 4), (28, 14), (4, 14)]) # Body top shading
-
-
-# Propellers - more detailed propellers with blades and outline
-propeller_size = 5
-for angle_offset in range(0, 360, 90): # Rotated propellers
-    angle_rad = math.radians(angle_offset)
-    center_x = 16 + int(12 * math.cos(angle_rad))
-    center_y = 16 + int(12 * math.sin(angle_rad))
-    pygame.draw.rect(drone, outline_color, (center_x - propeller_size//2 -1, center_y - propeller_size//2-1, propeller_size+2, propeller_size+2), 1) # Prop base outline
-    pygame.draw.rect(drone, drone_propeller_color, (center_x - propeller_size//2, center_y - propeller_size//2, propeller_size, propeller_size), border_radius=1) # Prop base
-    pygame.draw.rect(drone, drone_detail_color, (center_x - 1, center_y - propeller_size//2 - 2, 2, 4)) # Prop blade 1
-    pygame.draw.rect(drone, drone_detail_color, (center_x - propeller_size//2 - 2, center_y - 1, 4, 2)) # Prop blade 2
-
-# Camera - front camera detail with outline
-pygame.draw.circle(drone, outline_color, (16, 8), 4) # Camera lens outline
-pygame.draw.circle(drone, drone_detail_color, (16, 8), 3) # Camera lens
-pygame.draw.circle(drone, outline_color, (16, 8), 3, 1) # Camera border - already there, keep for emphasis
-
-pygame.draw.rect(drone, outline_color, (4, 4, 24, 24), 1, border_radius=12) # Body border - already there, keep for emphasis
-
-d_font = pygame.font.Font(pygame.font.get_default_font(), 8) # Font, same size
-d_text = d_font.render("D", True, (255,255,255))
-d_text_scaled = pygame.transform.scale(d_text, (int(d_text.get_width()*1.2), int(d_text.get_height()*1.2))) # Scale up text
-drone.blit(d_text_scaled, d_text_scaled.get_rect(center=(16,16+2))) # Shift text down
+def generate_drone():
+    drone = pygame.Surface((32,32), pygame.SRCALPHA) # Drone, same size
+    drone_body_color_base = (110, 110, 130) # Grey-blue drone color, darker
+    drone_body_color_shade = (90, 90, 110)
+    drone_propeller_color = (60, 60, 80) # Darker propellers
+    drone_detail_color = (130, 130, 150) # Lighter detail color
+    outline_color = (20, 20, 20) # Drone outline color
+
+    # Drone body - more aerodynamic shape with layered shading and outline
+    pygame.draw.ellipse(drone, outline_color, (4-1, 4-1, 24+2, 24+2), 1) # Body outline
+    pygame.draw.ellipse(drone, drone_body_color_base, (4, 4, 24, 24)) # Body base ellipse
+    pygame.draw.ellipse(drone, drone_body_color_shade, (4, 4, 12, 24)) # Body side shading
+    pygame.draw.rect(drone, drone_body_color_base, (4, 4, 24, 10)) # Body top rect
+    pygame.draw.polygon(drone, drone_body_color_shade, [(4, 4), (16, 2), (28, 4), (28, 14), (4, 14)]) # Body top shading
+
+
+    # Propellers - more detailed propellers with blades and outline
+    propeller_size = 5
+    for angle_offset in range(0, 360, 90): # Rotated propellers
+        angle_rad = math.radians(angle_offset)
+        center_x = 16 + int(12 * math.cos(angle_rad))
+        center_y = 16 + int(12 * math.sin(angle_rad))
+        pygame.draw.rect(drone, outline_color, (center_x - propeller_size//2 -1, center_y - propeller_size//2-1, propeller_size+2, propeller_size+2), 1) # Prop base outline
+        pygame.draw.rect(drone, drone_propeller_color, (center_x - propeller_size//2, center_y - propeller_size//2, propeller_size, propeller_size), border_radius=1) # Prop base
+        pygame.draw.rect(drone, drone_detail_color, (center_x - 1, center_y - propeller_size//2 - 2, 2, 4)) # Prop blade 1
+        pygame.draw.rect(drone, drone_detail_color, (center_x - propeller_size//2 - 2, center_y - 1, 4, 2)) # Prop blade 2
+
+    # Camera - front camera detail with outline
+    pygame.draw.circle(drone, outline_color, (16, 8), 4) # Camera lens outline
+    pygame.draw.circle(drone, drone_detail_color, (16, 8), 3) # Camera lens
+    pygame.draw.circle(drone, outline_color, (16, 8), 3, 1) # Camera border - already there, keep for emphasis
+
+    pygame.draw.rect(drone, outline_color, (4, 4, 24, 24), 1, border_radius=12) # Body border - already there, keep for emphasis
+
+    d_font = pygame.font.Font(pygame.font.get_default_font(), 8) # Font, same size
+    d_text = d_font.render("D", True, (255,255,255))
+    d_text_scaled = pygame.transform.scale(d_text, (int(d_text.get_width()*1.2), int(d_text.get_height()*1.2))) # Scale up text
+    drone.blit(d_text_scaled, d_text_scaled.get_rect(center=(16,16+2))) # Shift text down
 
-# Pixel noise for texture
-drone = add_pixel_noise(drone, intensity=10)
+    # Pixel noise for texture
+    drone = add_pixel_noise(drone, intensity=10)
 
 
-save_asset(drone, "drone.png")
+    return drone
 
 
 
@@ -830,5 +782,64 @@ def generate_detailed_tank_t72(): # Even more detailed tank
 
     return surf
 
-tank_t72 = generate_detailed_tank_t72()
-save_asset(tank_t72, "tank_t72.png")
\ No newline at end of file
+
+
+# --------------------- Build Targets ---------------------
+TARGETS = [
+    AssetTarget("ukrainian_soldier", "assets/ukrainian_soldier.png", generate_detailed_ukrainian_soldier),
+    AssetTarget("russian_soldier", "assets/russian_soldier.png", generate_detailed_russian_soldier),
+    AssetTarget("mage", "assets/mage.png", generate_detailed_character, ("M", (150,50,200))),
+    AssetTarget("rogue", "assets/rogue.png", generate_detailed_character, ("R", (50,150,50))),
+    AssetTarget("engineer", "assets/engineer.png", generate_detailed_character, ("E", (100,100,150))),
+    AssetTarget("artist", "assets/artist.png", generate_detailed_character, ("A", (200,150,200))),
+    AssetTarget("weapon", "assets/weapon.png", generate_weapon_icon),
+    AssetTarget("armor", "assets/armor.png", generate_detailed_armor),
+    AssetTarget("accessory", "assets/accessory.png", generate_detailed_accessory),
+    AssetTarget("elder", "assets/elder.png", generate_detailed_npc, ("E", (120,100,80))),
+    AssetTarget("quest_master", "assets/quest_master.png", generate_detailed_npc, ("Q", (150,80,150))),
+    AssetTarget("elder_portrait", "assets/elder_portrait.png", generate_elder_portrait),
+    AssetTarget("level1_bg", "assets/level1_bg.png", generate_level1_bg),
+    AssetTarget("bg_layer1", "assets/bg_layer1.png", generate_bg_layer1),
+    AssetTarget("bg_layer2", "assets/bg_layer2.png", generate_bg_layer2),
+    AssetTarget("tileset", "assets/tileset.png", generate_tileset),
+    AssetTarget("tree", "assets/tree.png", generate_tree),
+    AssetTarget("rock", "assets/rock.png", generate_rock),
+    AssetTarget("intro_bg", "assets/intro_bg.png", generate_intro_bg),
+    AssetTarget("player_idle", "assets/player_idle.png", generate_player_idle),
+    AssetTarget("russian_invader", "assets/russian_invader.png", generate_russian_invader),
+    AssetTarget("fortress", "assets/fortress.png", generate_fortress),
+    AssetTarget("village", "assets/village.png", generate_village),
+    AssetTarget("propaganda_poster", "assets/propaganda_poster.png", generate_detailed_poster),
+    AssetTarget("drone", "assets/drone.png", generate_drone),
+    AssetTarget("tank_t72", "assets/tank_t72.png", generate_detailed_tank_t72),
+]
+
+
+def build_environment():
+    """
+    Settings that affect every generated image; changing any of them rebuilds everything.
+    """
+    return {"seed": ASSET_SEED, "numpy": has_numpy(), "pygame": pygame.version.ver}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("targets", nargs="*", help="targets to build (default: all)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--list", action="store_true", help="list the targets and exit")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.list:
+        for target in TARGETS:
+            print(f"{target.name:>18}  {target.output}")
+        return 0
+
+    result = asset_build.build(TARGETS, build_environment(), only=args.targets or None, force=args.force, jobs=args.jobs)
+    print(f"Built {len(result['built'])} asset(s), {len(result['skipped'])} up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
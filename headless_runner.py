@@ -0,0 +1,299 @@
+# headless_runner.py
+"""
+Runs PlayingState without a window, audio device or display flips.
+
+The simulation is stepped with fixed ticks as fast as the CPU allows, driven by scripted or
+random input, and the achieved ticks per second are reported. Useful for balance sweeps,
+soak tests and CI benchmarks on machines without a GPU or X server.
+
+Usage:
+    python headless_runner.py --ticks 10000 --input random --seed 1
+    python headless_runner.py --ticks 5000 --input sweep --render
+    python headless_runner.py --ticks 5000 --input sweep --render --dirty-rects
+    python headless_runner.py --ticks 10000 --input random --entity-store
+    python headless_runner.py --ticks 5000 --render --profile
+    python headless_runner.py --ticks 5000 --script my_inputs.json
+    python headless_runner.py --ticks 20000 --record session.rec (play it back with replay.py)
+
+A script file is a JSON list of steps that is played in a loop, e.g.
+    [{"ticks": 30, "keys": ["RIGHT"], "fire": true}, {"ticks": 30, "keys": ["LEFT"]}]
+"""
+import os
+
+# The SDL dummy drivers must be selected before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import logging
+import random
+import time
+
+import pygame
+
+from config import STATE_PLAYING, STATE_UPGRADE, STATE_GAMEOVER, SIMULATION_DT
+
+logger = logging.getLogger(__name__)
+
+SCREEN_SIZE = (800, 600)
+MOVEMENT_KEYS = {
+    "LEFT": pygame.K_LEFT,
+    "RIGHT": pygame.K_RIGHT,
+    "UP": pygame.K_UP,
+    "DOWN": pygame.K_DOWN,
+}
+
+
+class KeyState:
+    """
+    Minimal stand-in for pygame.key.get_pressed(): indexable by key constant, True for held keys.
+    """
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class IdleInput:
+    """
+    Input source that never presses anything.
+    """
+    def next_tick(self) -> tuple[KeyState, list[pygame.event.Event]]:
+        """
+        Returns the held keys and the events for the next tick.
+        """
+        return KeyState(), []
+
+
+class RandomInput:
+    """
+    Input source that wanders in random directions and fires at random.
+
+    Args:
+        rng:          Random generator used for all decisions (seed it for repeatable runs).
+        fire_chance:  Probability of pressing SPACE on a given tick.
+        hold_ticks:   Number of ticks a chosen movement direction is held.
+    """
+    def __init__(self, rng: random.Random, fire_chance: float = 0.1, hold_ticks: int = 20):
+        self.rng = rng
+        self.fire_chance = fire_chance
+        self.hold_ticks = hold_ticks
+        self._held = KeyState()
+        self._remaining = 0
+
+    def next_tick(self) -> tuple[KeyState, list[pygame.event.Event]]:
+        """
+        Returns the held keys and the events for the next tick.
+        """
+        if self._remaining <= 0:
+            names = self.rng.sample(sorted(MOVEMENT_KEYS), self.rng.randint(0, 2))
+            self._held = KeyState(MOVEMENT_KEYS[name] for name in names)
+            self._remaining = self.hold_ticks
+        self._remaining -= 1
+        events = []
+        if self.rng.random() < self.fire_chance:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        return self._held, events
+
+
+class ScriptedInput:
+    """
+    Input source that loops over a list of steps.
+
+    Each step is a dict with "ticks" (how long the step lasts), optional "keys" (names from
+    MOVEMENT_KEYS held during the step) and optional "fire" (press SPACE on every tick of the step).
+    """
+    def __init__(self, steps: list[dict]):
+        if not steps:
+            raise ValueError("An input script needs at least one step.")
+        self.steps = steps
+        self._index = 0
+        self._remaining = steps[0].get("ticks", 1)
+
+    @classmethod
+    def from_file(cls, path: str) -> "ScriptedInput":
+        """
+        Loads an input script from a JSON file.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def next_tick(self) -> tuple[KeyState, list[pygame.event.Event]]:
+        """
+        Returns the held keys and the events for the next tick.
+        """
+        while self._remaining <= 0:
+            self._index = (self._index + 1) % len(self.steps)
+            self._remaining = self.steps[self._index].get("ticks", 1)
+        step = self.steps[self._index]
+        self._remaining -= 1
+        keys = KeyState(MOVEMENT_KEYS[name] for name in step.get("keys", []))
+        events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)] if step.get("fire") else []
+        return keys, events
+
+
+# Strafe left and right along the bottom of the screen while firing.
+SWEEP_SCRIPT = [
+    {"ticks": 40, "keys": ["LEFT"], "fire": True},
+    {"ticks": 80, "keys": ["RIGHT"], "fire": True},
+    {"ticks": 40, "keys": ["LEFT"], "fire": True},
+]
+
+
+def init_headless():
+    """
+    Initializes only the pygame modules the simulation needs (no mixer) on the dummy video driver.
+
+    A display mode is still set because image loading uses convert_alpha(), but with the dummy
+    driver nothing is ever shown.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+
+def make_input(kind: str, seed: int, script_path: str | None = None):
+    """
+    Creates the input source selected on the command line.
+    """
+    if script_path:
+        return ScriptedInput.from_file(script_path)
+    if kind == "random":
+        return RandomInput(random.Random(seed))
+    if kind == "sweep":
+        return ScriptedInput(SWEEP_SCRIPT)
+    return IdleInput()
+
+
+def run(ticks: int, input_source, render: bool = False, stop_on_gameover: bool = False,
+        dirty_rects: bool = False, use_entity_store: bool = False, profiler=None, recorder=None) -> dict:
+    """
+    Steps a fresh PlayingState for the given number of ticks as fast as possible.
+
+    Level-ups skip the upgrade shop; a game over starts a new game unless stop_on_gameover is set.
+
+    Args:
+        ticks:            Number of simulation ticks to run.
+        input_source:     Object with next_tick() returning (keys, events).
+        render:           Also draw every tick onto an off-screen surface (never flipped).
+        stop_on_gameover: End the run at the first game over.
+        dirty_rects:      Render with the DirtyRectRenderer instead of redrawing the full screen.
+        use_entity_store: Move enemies, drones and projectiles in batch (see entity_store.py).
+        profiler:         An enabled profiler.Profiler to record every tick as one frame.
+        recorder:         A replay.InputRecorder to record the run to.
+
+    Returns:
+        A dict with the tick count, elapsed seconds, ticks per second, final game statistics, the
+        sprite pool statistics of the last game and, when rendering, the average share of the screen
+        redrawn per frame.
+    """
+    from states import PlayingState # Imported late so the dummy drivers are set up first
+
+    screen = pygame.Surface(SCREEN_SIZE)
+    state = PlayingState(screen, headless=True, dirty_rects=dirty_rects, use_entity_store=use_entity_store)
+    games = 1
+    game_overs = 0
+    completed = 0
+    screen_area = SCREEN_SIZE[0] * SCREEN_SIZE[1]
+    redrawn_area = 0
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        if profiler is not None:
+            profiler.end_frame(state) # Records the previous tick and instruments new states
+            profiler.begin_frame()
+        keys, events = input_source.next_tick()
+        result = state.process_events(events)
+        if recorder is not None:
+            recorder.frame(state, events, result)
+        state.update(SIMULATION_DT, keys)
+        if recorder is not None:
+            recorder.tick(state, keys)
+        if render:
+            state.draw()
+            if state.dirty_rects is None:
+                redrawn_area += screen_area
+            else:
+                redrawn_area += sum(rect.width * rect.height for rect in state.dirty_rects) # Overlaps counted twice
+        completed += 1
+
+        if state.next_state == STATE_UPGRADE:
+            state.next_state = STATE_PLAYING # No shop in headless runs
+        elif state.next_state == STATE_GAMEOVER:
+            game_overs += 1
+            if stop_on_gameover:
+                break
+            state = PlayingState(screen, headless=True, dirty_rects=dirty_rects, use_entity_store=use_entity_store)
+            games += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": completed,
+        "seconds": elapsed,
+        "ticks_per_second": completed / elapsed if elapsed > 0 else float("inf"),
+        "games": games,
+        "game_overs": game_overs,
+        "score": state.score,
+        "level": state.level,
+        "lives": state.lives,
+        "pool": state.sprite_pool.stats(),
+        "redrawn_fraction": redrawn_area / (screen_area * completed) if render and completed else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=10000, help="number of simulation ticks to run")
+    parser.add_argument("--input", choices=["idle", "random", "sweep"], default="random", help="built-in input source")
+    parser.add_argument("--script", help="JSON input script to loop instead of a built-in source")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the game and the random input")
+    parser.add_argument("--render", action="store_true", help="also draw each tick to an off-screen surface")
+    parser.add_argument("--dirty-rects", action="store_true", help="render with dirty rectangles (implies --render)")
+    parser.add_argument("--entity-store", action="store_true", help="move enemies and projectiles in batch with NumPy")
+    parser.add_argument("--profile", nargs="?", const="profile", metavar="BASENAME",
+                        help="time every phase and write BASENAME.csv/.json (default: profile)")
+    parser.add_argument("--record", metavar="FILE", help="record the run for replay.py")
+    parser.add_argument("--stop-on-gameover", action="store_true", help="stop at the first game over")
+    parser.add_argument("--verbose", action="store_true", help="show game log output")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    random.seed(args.seed)
+    init_headless()
+
+    profiler = None
+    if args.profile:
+        from profiler import Profiler
+        profiler = Profiler(history=args.ticks)
+        profiler.enable()
+    recorder = None
+    if args.record:
+        from replay import InputRecorder
+        recorder = InputRecorder(args.record)
+    result = run(args.ticks, make_input(args.input, args.seed, args.script), args.render or args.dirty_rects,
+                 args.stop_on_gameover, args.dirty_rects, args.entity_store, profiler, recorder)
+    if recorder is not None:
+        recorder.close()
+        print(f"recorded to {args.record}")
+    print(f"{result['ticks']} ticks in {result['seconds']:.3f}s: {result['ticks_per_second']:.1f} ticks/s "
+          f"({result['ticks_per_second'] * SIMULATION_DT:.1f}x real time)")
+    print(f"games: {result['games']}, game overs: {result['game_overs']}, "
+          f"final score: {result['score']}, level: {result['level']}, lives: {result['lives']}")
+    print("sprite pool: " + ", ".join(f"{name} {stats['created']} created/{stats['reused']} reused (high water {stats['high_water']})"
+                                      for name, stats in sorted(result["pool"].items())))
+    if result["redrawn_fraction"] is not None:
+        print(f"screen area redrawn per frame: {result['redrawn_fraction']:.1%}")
+    if profiler is not None:
+        profiler.end_frame()
+        print(f"{'section':<36} {'mean':>7} {'p50':>7} {'p95':>7} {'p99':>7}  (ms per tick)")
+        for label, stats in profiler.summary()["sections"].items():
+            print(f"{label:<36} {stats['mean']:>7.3f} {stats['p50']:>7.3f} {stats['p95']:>7.3f} {stats['p99']:>7.3f}")
+        print("wrote " + " and ".join(profiler.save(args.profile)))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
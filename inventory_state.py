@@ -1,7 +1,8 @@
 # inventory_state.py
 import pygame
 import textwrap
-from ui_helpers import draw_vertical_gradient
+from ui_helpers import gradient_surface
+from resources import get_sys_font, render_text
 
 
 class InventoryState:
@@ -13,10 +14,10 @@ class InventoryState:
     def __init__(self, screen, inventory):
         self.screen = screen
         self.inventory = inventory  # Expect list of Equipment objects.
-        self.font = pygame.font.SysFont("arial", 24)
+        self.font = get_sys_font("arial", 24)
         self.clock = pygame.time.Clock()
         self.offset = 0
-        self.instruction = self.font.render("UP/DOWN: Scroll, ESC: Exit Inventory", True, (200, 200, 200))
+        self.instruction = render_text(self.font, "UP/DOWN: Scroll, ESC: Exit Inventory", True, (200, 200, 200))
         self.inv_text = "\n\n".join([str(item) for item in self.inventory]) if self.inventory else "Inventory is empty."
         self.wrap_width = 80
         self.inv_lines = self.wrap_text(self.inv_text).split("\n")
@@ -43,13 +44,11 @@ class InventoryState:
 
     def draw(self):
         self.screen.fill((30, 30, 30))
-        panel = pygame.Surface((760, 540))
-        draw_vertical_gradient(panel, (50, 50, 100), (10, 10, 40))
-        pygame.draw.rect(panel, (255, 255, 255), panel.get_rect(), 2)
-        self.screen.blit(panel, (20, 20))
+        panel_rect = self.screen.blit(gradient_surface((760, 540), (50, 50, 100), (10, 10, 40)), (20, 20)) # Cached panel
+        pygame.draw.rect(self.screen, (255, 255, 255), panel_rect, 2)
         y = 30 - self.offset
         for line in self.inv_lines:
-            text_surf = self.font.render(line, True, (255, 255, 255))
+            text_surf = render_text(self.font, line, True, (255, 255, 255))
             self.screen.blit(text_surf, (40, y))
             y += 30
         self.screen.blit(self.instruction, (40, 500))
@@ -0,0 +1,305 @@
+# level_compiler.py
+"""
+Compiles JSON levels (assets/data/level*.json) into a compact binary format.
+
+A compiled level (assets/data/level1.lvl next to level1.json) is laid out as:
+
+    header    <8sIIIIIII   magic b"CLAYLVL1", version, width, height, metadata size,
+                           object count, NPC count, reserved
+    metadata  JSON         every other level key (tileset, tile_size, ...), the string table
+                           and the SHA-256 of the source JSON; padded to 8 bytes
+    tiles     uint16       width * height tile indices, row-major, little-endian
+    objects   <Hii         object table: (string index of the type, x, y) per object
+    npcs      <Hii         NPC table, same layout
+
+open_compiled() memory-maps the file and exposes the tile grid as a zero-copy memoryview, so
+loading does not parse or allocate the layout. LevelManager uses it when a compiled level
+exists and is up to date, and falls back to the JSON otherwise.
+
+A compiled level is up to date when the SHA-256 stored in it matches the level's JSON: the loose
+JSON file if there is one, otherwise the JSON in the mounted asset archive. This holds wherever
+the compiled level itself comes from, so a .lvl packed into assets.pak is ignored as soon as the
+JSON next to it is edited.
+
+Usage:
+    python level_compiler.py [assets/data/level1.json ...] [--check]
+"""
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import asset_pack
+from data_loader import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CLAYLVL1"
+VERSION = 1
+COMPILED_EXTENSION = ".lvl"
+_HEADER = struct.Struct("<8sIIIIIII")
+_ENTITY = struct.Struct("<Hii") # (string index of the type, x, y)
+_TABLE_KEYS = ("type", "position") # The only fields objects and NPCs may have to go into a table
+
+
+def compiled_path(json_path: str) -> str:
+    """
+    Returns the path of the compiled level for a JSON level path.
+    """
+    return os.path.splitext(json_path)[0] + COMPILED_EXTENSION
+
+
+def _pack_table(entries: list[dict], strings: list[str], kind: str) -> bytes:
+    """
+    Packs objects or NPCs into _ENTITY records, adding their types to the string table.
+
+    Raises:
+        ValueError: If an entry has fields the table cannot hold.
+    """
+    records = bytearray()
+    for entry in entries:
+        extra = set(entry) - set(_TABLE_KEYS)
+        if extra:
+            raise ValueError(f"{kind} entry {entry} has fields the compiled format does not support: {sorted(extra)}")
+        if entry["type"] not in strings:
+            strings.append(entry["type"])
+        x, y = entry.get("position", (0, 0))
+        records += _ENTITY.pack(strings.index(entry["type"]), int(x), int(y))
+    return bytes(records)
+
+
+def compile_level(json_path: str, output: str | None = None) -> str:
+    """
+    Compiles one JSON level.
+
+    Args:
+        json_path: Path of the JSON level.
+        output:    Path of the compiled level; next to the JSON by default.
+
+    Returns:
+        The path written.
+
+    Raises:
+        ValueError: If the level has tile indices outside 0..65535 or object/NPC fields the format cannot hold.
+    """
+    with open(json_path, "rb") as f:
+        source = f.read()
+    level = json.loads(source)
+    layout = level.pop("layout", [])
+    width, height = max((len(row) for row in layout), default=0), len(layout)
+
+    tiles = array("H")
+    for row in layout:
+        if any(not 0 <= tile <= 0xFFFF for tile in row):
+            raise ValueError(f"{json_path}: tile indices must be between 0 and 65535")
+        tiles.extend(row)
+        tiles.extend([0] * (width - len(row))) # Pad ragged rows; missing tiles are empty
+    if sys.byteorder == "big":
+        tiles.byteswap() # Stored little-endian
+
+    strings = []
+    objects = _pack_table(level.pop("objects", []), strings, "Object")
+    npcs = _pack_table(level.pop("npcs", []), strings, "NPC")
+    metadata = json.dumps({"level": level, "strings": strings, "source_sha256": hashlib.sha256(source).hexdigest()}).encode("utf-8")
+    metadata = metadata.ljust((len(metadata) + 7) // 8 * 8) # Keep the tile grid aligned
+
+    output = output or compiled_path(json_path)
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, width, height, len(metadata), len(objects) // _ENTITY.size, len(npcs) // _ENTITY.size, 0))
+        f.write(metadata)
+        f.write(tiles.tobytes())
+        f.write(objects)
+        f.write(npcs)
+    os.replace(tmp_path, output)
+    logger.info(f"Compiled {json_path} -> {output} ({width}x{height} tiles, {os.path.getsize(output)} bytes)")
+    return output
+
+
+class CompiledLevel:
+    """
+    A memory-mapped compiled level.
+
+    Attributes:
+        width:         Level width in tiles.
+        height:        Level height in tiles.
+        tiles:         Tile indices as a read-only memoryview of unsigned 16-bit ints, row-major.
+        source_sha256: SHA-256 of the JSON the level was compiled from.
+    """
+    def __init__(self, data, mapping: mmap.mmap | None = None, file=None):
+        """
+        Parses the header and tables of compiled level bytes (a memoryview, bytes or an mmap).
+
+        Raises:
+            ValueError: If the data is not a compiled level of a supported version.
+        """
+        self._mapping = mapping
+        self._file = file
+        view = memoryview(data)
+        magic, version, self.width, self.height, metadata_size, object_count, npc_count, _ = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a compiled level of a supported version")
+        offset = _HEADER.size
+        metadata = json.loads(bytes(view[offset:offset + metadata_size]))
+        offset += metadata_size
+        tile_bytes = view[offset:offset + self.width * self.height * 2]
+        offset += len(tile_bytes)
+        if sys.byteorder == "little":
+            self.tiles = tile_bytes.cast("H") # Zero-copy view of the mapping
+        else:
+            tiles = array("H", tile_bytes)
+            tiles.byteswap()
+            self.tiles = memoryview(tiles)
+
+        strings = metadata["strings"]
+        self._level = metadata["level"]
+        self.source_sha256 = metadata["source_sha256"]
+        self.objects = [{"type": strings[kind], "position": [x, y]}
+                        for kind, x, y in _ENTITY.iter_unpack(view[offset:offset + object_count * _ENTITY.size])]
+        offset += object_count * _ENTITY.size
+        self.npcs = [{"type": strings[kind], "position": [x, y]}
+                     for kind, x, y in _ENTITY.iter_unpack(view[offset:offset + npc_count * _ENTITY.size])]
+
+    def level_data(self) -> dict:
+        """
+        Returns the level dict as the JSON would load it, without "layout" (read tiles from `tiles`).
+        """
+        return {**self._level, "objects": [dict(obj) for obj in self.objects], "npcs": [dict(npc) for npc in self.npcs]}
+
+    def tile(self, col: int, row: int) -> int:
+        """
+        Returns the tile index at a position.
+        """
+        return self.tiles[row * self.width + col]
+
+    def layout(self) -> list[list[int]]:
+        """
+        Returns the whole tile grid as nested lists, like the JSON "layout" (with ragged rows padded).
+        """
+        return [self.tiles[row * self.width:(row + 1) * self.width].tolist() for row in range(self.height)]
+
+    def close(self):
+        """
+        Releases the mapping. The tiles view must not be used afterwards.
+        """
+        self.tiles.release()
+        if self._mapping is not None:
+            self._mapping.close()
+        if self._file is not None:
+            self._file.close()
+
+
+def load_compiled(path: str) -> CompiledLevel:
+    """
+    Memory-maps a compiled level file.
+
+    Raises:
+        OSError: If the file cannot be opened.
+        ValueError: If it is not a compiled level of a supported version.
+    """
+    file = open(path, "rb")
+    try:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return CompiledLevel(mapping, mapping, file)
+    except Exception:
+        file.close()
+        raise
+
+
+def open_compiled(json_filename: str) -> CompiledLevel | None:
+    """
+    Opens the compiled version of a level in assets/data, if there is an up-to-date one.
+
+    The mounted asset archive is checked first, then the loose file (memory-mapped). Either is
+    ignored if the level's JSON (see _source_sha256()) has changed since it was compiled.
+
+    Args:
+        json_filename: Level file name as passed to load_json() (e.g., "level1.json").
+
+    Returns:
+        The CompiledLevel, or None if there is none or it is stale or unreadable.
+    """
+    path = compiled_path(os.path.join(DATA_DIR, json_filename))
+    json_path = os.path.join(DATA_DIR, json_filename)
+    packed = asset_pack.mounted_file(path)
+    try:
+        if packed is not None:
+            level = CompiledLevel(packed) # Already a view of the archive's mapping
+        elif not os.path.exists(path):
+            return None
+        else:
+            level = load_compiled(path)
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        logger.error(f"Error reading compiled level {path}: {e}")
+        return None
+    source_sha256 = _source_sha256(json_path)
+    if source_sha256 is not None and source_sha256 != level.source_sha256:
+        logger.warning(f"Compiled level {path} is out of date; loading {json_path} (run python level_compiler.py)")
+        level.close()
+        return None
+    return level
+
+
+def _source_sha256(json_path: str) -> str | None:
+    """
+    Returns the SHA-256 of a level's JSON: the loose file if it exists, else its copy in the
+    mounted archive, or None if there is neither.
+    """
+    if os.path.exists(json_path):
+        with open(json_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    packed = asset_pack.mounted_file(json_path)
+    return hashlib.sha256(packed).hexdigest() if packed is not None else None
+
+
+def check(json_path: str, output: str | None = None) -> list[str]:
+    """
+    Compares a compiled level with its JSON source.
+
+    Returns:
+        A list of differences, empty if both load to the same level.
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        level = json.load(f)
+    path = output or compiled_path(json_path)
+    with open(path, "rb") as f:
+        compiled = CompiledLevel(f.read())
+    problems = []
+    layout = level.pop("layout", [])
+    width = max((len(row) for row in layout), default=0)
+    if compiled.layout() != [row + [0] * (width - len(row)) for row in layout]:
+        problems.append("layout differs")
+    expected = {**level, "objects": level.get("objects", []), "npcs": level.get("npcs", [])}
+    for key, value in expected.items():
+        if compiled.level_data().get(key) != value:
+            problems.append(f"{key} differs")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("levels", nargs="*", help="JSON levels to compile (default: assets/data/level*.json)")
+    parser.add_argument("--check", action="store_true", help="compare the compiled levels with their JSON instead of compiling")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    levels = args.levels or sorted(glob.glob(os.path.join(DATA_DIR, "level*.json")))
+    failed = 0
+    for json_path in levels:
+        if args.check:
+            problems = check(json_path)
+            failed += bool(problems)
+            print(f"{json_path}: {'OK' if not problems else ', '.join(problems)}")
+        else:
+            print(f"Wrote {compile_level(json_path)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
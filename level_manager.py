@@ -1,12 +1,100 @@
 # level_manager.py
+import abc
 import pygame
 import os
 import logging
 from data_loader import load_json  # Assuming you have a data_loader.py for JSON loading
 from resources import load_image_with_scale
+import level_compiler
 
 logger = logging.getLogger(__name__)
 
+SINGLE_CHUNK_MAX_SIZE = 2048 # Levels up to this size (in pixels, both ways) are baked into one surface
+CHUNK_TILES = 16 # Tiles are stored, baked and streamed in chunks of CHUNK_TILES x CHUNK_TILES tiles
+STREAM_MARGIN_CHUNKS = 1 # Chunks this far outside the viewport stay resident; anything further is evicted
+
+class ChunkSource(abc.ABC):
+    """
+    Supplies a level's tile layout one chunk at a time, so large levels need not be resident at once.
+
+    Attributes:
+        width:       Level width in tiles.
+        height:      Level height in tiles.
+        chunk_tiles: Edge length of a chunk in tiles.
+        writable:    True if set_tile() persists edits; otherwise edited chunks are kept resident.
+    """
+    writable = False
+
+    def __init__(self, width: int, height: int, chunk_tiles: int = CHUNK_TILES):
+        self.width = width
+        self.height = height
+        self.chunk_tiles = chunk_tiles
+
+    @abc.abstractmethod
+    def load_chunk(self, chunk: tuple[int, int]) -> list[list[int]]:
+        """
+        Returns the tiles of a chunk as chunk_tiles rows of chunk_tiles tile indices (0 past the level's edge).
+        """
+
+    def set_tile(self, col: int, row: int, tile_index: int):
+        """
+        Persists an edited tile. Only called if writable is True; read-only sources raise TypeError.
+        """
+        raise TypeError("read-only tile source")
+
+
+class LayoutChunkSource(ChunkSource):
+    """
+    ChunkSource over an in-memory layout (the "layout" list of a JSON level).
+    """
+    writable = True
+
+    def __init__(self, layout: list[list[int]], chunk_tiles: int = CHUNK_TILES):
+        super().__init__(max((len(row) for row in layout), default=0), len(layout), chunk_tiles)
+        self.layout = layout
+
+    def load_chunk(self, chunk: tuple[int, int]) -> list[list[int]]:
+        size = self.chunk_tiles
+        first_col, first_row = chunk[0] * size, chunk[1] * size
+        tiles = []
+        for row_idx in range(first_row, first_row + size):
+            row = self.layout[row_idx] if row_idx < len(self.layout) else []
+            values = row[first_col:first_col + size]
+            tiles.append(values + [0] * (size - len(values))) # Pad ragged and edge rows
+        return tiles
+
+    def set_tile(self, col: int, row: int, tile_index: int):
+        while len(self.layout) <= row:
+            self.layout.append([])
+        line = self.layout[row]
+        line.extend([0] * (col + 1 - len(line)))
+        line[col] = tile_index
+        self.width = max(self.width, col + 1)
+        self.height = max(self.height, row + 1)
+
+
+class CompiledChunkSource(ChunkSource):
+    """
+    Read-only ChunkSource over the memory-mapped tile grid of a compiled level (see level_compiler).
+    """
+    def __init__(self, compiled: "level_compiler.CompiledLevel", chunk_tiles: int = CHUNK_TILES):
+        super().__init__(compiled.width, compiled.height, chunk_tiles)
+        self.compiled = compiled
+
+    def load_chunk(self, chunk: tuple[int, int]) -> list[list[int]]:
+        size, width, tiles = self.chunk_tiles, self.width, self.compiled.tiles
+        first_col, first_row = chunk[0] * size, chunk[1] * size
+        last_col = min(first_col + size, width)
+        rows = []
+        for row_idx in range(first_row, first_row + size):
+            if row_idx < self.height and first_col < width:
+                values = tiles[row_idx * width + first_col:row_idx * width + last_col].tolist() # Only this chunk's slice is read
+            else:
+                values = []
+            rows.append(values + [0] * (size - len(values)))
+        return rows
+
+
 class LevelManager:
     """
     Manages level loading, rendering, and object placement based on level data from a JSON file.
@@ -16,20 +104,28 @@ class LevelManager:
         background: pygame.Surface for the level background image, or None if no background is specified.
         tile_size:  Integer representing the size of each tile in pixels.
         tileset:    pygame.Surface containing the tileset image, or None if no tileset is specified.
-        layout:     2D list representing the tile layout of the level.
+        layout:     2D list representing the tile layout of a JSON level (empty for compiled levels; read tiles with get_tile()).
+        compiled:   level_compiler.CompiledLevel the level was loaded from, or None if it was loaded from JSON.
+        tile_source: ChunkSource the tile chunks are streamed from.
         objects:    List of dictionaries, each defining an object to be placed in the level.
         object_assets: Dictionary mapping object types to their asset paths.
         loaded_objects: List of tuples, each containing a pygame.Surface (object image) and its position (tuple).
         npcs_data:  List of dictionaries, each defining NPC (Non-Player Character) data for the level.
+        chunk_size: (width, height) in pixels of the baked chunks the static layer is split into.
+        bakes:      Number of chunks baked so far (for profiling).
+        chunk_loads: Number of tile chunks loaded from the tile source so far.
+        evictions:  Number of baked and tile chunks evicted so far.
     """
-    def __init__(self, level_filename: str):
+    def __init__(self, level_filename: str, tile_source: ChunkSource | None = None):
         """
         Initializes the LevelManager by loading level data from the specified JSON file.
 
         Args:
             level_filename: Path to the JSON file containing level data.
+            tile_source:    Where to stream the tile layout from; defaults to the "layout" of the level data.
         """
-        self.level_data = self._load_level_data(level_filename) # Load level data from JSON
+        self.compiled = None # CompiledLevel when loaded from the binary format
+        self.level_data = self._load_level_data(level_filename) # Load compiled level data, or JSON
         if not self.level_data: # Handle case where level data loading failed
             raise ValueError(f"Failed to load level data from: {level_filename}. LevelManager cannot be initialized.")
 
@@ -37,6 +133,9 @@ class LevelManager:
         self.tile_size = self.level_data.get("tile_size", 32) # Default tile size if not in level data
         self.tileset = self._load_tileset() # Load tileset image
         self.layout = self.level_data.get("layout", []) # Default to empty layout if not specified
+        if tile_source is None:
+            tile_source = CompiledChunkSource(self.compiled) if self.compiled is not None else LayoutChunkSource(self.layout)
+        self.tile_source = tile_source
         self.objects = self.level_data.get("objects", []) # Default to empty objects list
         self.object_assets = { # Define object asset paths - consider moving to config or data file if more objects are added
             "tree": "assets/tree.png",
@@ -45,12 +144,29 @@ class LevelManager:
         self.loaded_objects = self._load_level_objects() # Load and create object sprites
         self.npcs_data = self.level_data.get("npcs", []) # Load NPC data
 
+        # Tile data streamed from the tile source by chunk; only chunks near the viewport stay resident
+        self._tile_chunks = {} # (chunk column, chunk row) -> rows of tile indices
+        self._edited_tile_chunks = set() # Edited chunks a read-only source cannot take back; never evicted
+        self.chunk_loads = 0
+        self.evictions = 0
+
+        # Static layer (background, tiles, objects) baked into chunk surfaces on first draw
+        self._extent = self._level_extent() # Recomputed only when the level is invalidated as a whole
+        self.chunk_size = self._choose_chunk_size()
+        self._chunks = {} # (chunk column, chunk row) -> baked pygame.Surface
+        self._dirty_chunks = set() # Chunks to re-bake before their next blit
+        self._index_objects()
+        self.bakes = 0
+
         logger.debug(f"LevelManager initialized for level: {level_filename}")
 
 
     def _load_level_data(self, level_filename: str) -> dict:
         """
-        Loads level data from a JSON file.
+        Loads level data, from the compiled binary level if there is an up-to-date one, otherwise from JSON.
+
+        A compiled level is memory-mapped: its tile grid is not parsed or copied, and the returned
+        dict has no "layout" (tiles are streamed through a CompiledChunkSource instead).
 
         Args:
             level_filename: Path to the JSON level file.
@@ -58,6 +174,10 @@ class LevelManager:
         Returns:
             A dictionary containing the level data, or None if loading fails.
         """
+        self.compiled = level_compiler.open_compiled(level_filename)
+        if self.compiled is not None:
+            logger.debug(f"Level data loaded from compiled level for: {level_filename}")
+            return self.compiled.level_data()
         try:
             level_data = load_json(level_filename) # Use data_loader to load JSON
             logger.debug(f"Level data loaded successfully from: {level_filename}")
@@ -78,7 +198,8 @@ class LevelManager:
         """
         bg_path = self.level_data.get("background")
         if bg_path:
-            background_image = load_image_with_scale(bg_path, (800, 600))
+            background_size = tuple(self.level_data.get("background_size", (800, 600))) # Repeated over larger levels
+            background_image = load_image_with_scale(bg_path, background_size)
             if background_image:
                 logger.debug(f"Background image loaded: {bg_path}")
                 return background_image
@@ -134,47 +255,281 @@ class LevelManager:
         return loaded_objects
 
 
-    def draw(self, screen: pygame.Surface):
+    def _level_extent(self) -> tuple[int, int]:
         """
-        Draws the level background, tiles, and objects onto the given screen.
+        Returns the pixel size covered by the tile grid and the objects (and the background on small levels).
+
+        Visits every object; callers read the stored self._extent instead.
+        """
+        width = self.tile_source.width * self.tile_size
+        height = self.tile_source.height * self.tile_size
+        if self.background: # The background repeats over larger levels, so it only sets a minimum
+            width, height = max(width, self.background.get_width()), max(height, self.background.get_height())
+        for image, pos in self.loaded_objects:
+            width = max(width, pos[0] + image.get_width())
+            height = max(height, pos[1] + image.get_height())
+        return width, height
+
+
+    def tile_rows(self) -> list[list[int]]:
+        """
+        Returns the whole tile grid as nested lists (ragged rows padded with 0), whichever way it was loaded.
+        """
+        return [[self.get_tile(col, row) for col in range(self.tile_source.width)] for row in range(self.tile_source.height)]
+
+
+    def close(self):
+        """
+        Releases the memory-mapped compiled level, if any. The level must not be drawn afterwards.
+        """
+        if self.compiled is not None:
+            self._tile_chunks.clear() # Chunk data are copies, but drop them with the level
+            self.compiled.close()
+            self.compiled = None
+
+
+    def level_size(self) -> tuple[int, int]:
+        """
+        Returns the level's size in pixels, e.g. to clamp a Camera.
+        """
+        return self._extent
+
+
+    def _choose_chunk_size(self) -> tuple[int, int]:
+        """
+        Bakes small levels into a single surface and splits larger ones into tile chunks.
+
+        Returns:
+            The (width, height) of a baked chunk in pixels.
+        """
+        width, height = self._extent
+        if width <= SINGLE_CHUNK_MAX_SIZE and height <= SINGLE_CHUNK_MAX_SIZE:
+            return max(width, 1), max(height, 1) # One chunk, one blit per frame
+        edge = self.tile_source.chunk_tiles * self.tile_size # Baked chunks line up with tile chunks
+        return edge, edge
+
+
+    def _index_objects(self):
+        """
+        Buckets the level objects by the baked chunks they overlap, so a bake only visits its own.
+        """
+        self._objects_by_chunk = {}
+        for image, pos in self.loaded_objects:
+            for chunk in self._chunks_in(pygame.Rect(pos, image.get_size())):
+                self._objects_by_chunk.setdefault(chunk, []).append((image, pos))
+
+
+    def _chunk_rect(self, chunk: tuple[int, int]) -> pygame.Rect:
+        """
+        Returns the area of the level covered by a chunk, in level pixels.
+        """
+        chunk_width, chunk_height = self.chunk_size
+        return pygame.Rect(chunk[0] * chunk_width, chunk[1] * chunk_height, chunk_width, chunk_height)
+
+
+    def _chunks_in(self, area: pygame.Rect):
+        """
+        Yields the chunks overlapping an area of the level (in level pixels).
+        """
+        chunk_width, chunk_height = self.chunk_size
+        extent = pygame.Rect((0, 0), self._extent).clip(area)
+        if not extent.width or not extent.height:
+            return
+        for chunk_y in range(extent.top // chunk_height, (extent.bottom - 1) // chunk_height + 1):
+            for chunk_x in range(extent.left // chunk_width, (extent.right - 1) // chunk_width + 1):
+                yield chunk_x, chunk_y
+
+
+    def _tile_chunk(self, chunk: tuple[int, int]) -> list[list[int]]:
+        """
+        Returns the tile data of a chunk, streaming it in from the tile source if it is not resident.
+        """
+        tiles = self._tile_chunks.get(chunk)
+        if tiles is None:
+            tiles = self.tile_source.load_chunk(chunk)
+            self._tile_chunks[chunk] = tiles
+            self.chunk_loads += 1
+        return tiles
+
+
+    def get_tile(self, col: int, row: int) -> int:
+        """
+        Returns the tileset index at a tile position (0 for empty or outside the level).
+        """
+        if col < 0 or row < 0 or col >= self.tile_source.width or row >= self.tile_source.height:
+            return 0
+        size = self.tile_source.chunk_tiles
+        return self._tile_chunk((col // size, row // size))[row % size][col % size]
+
+
+    def _bake_chunk(self, chunk: tuple[int, int]) -> pygame.Surface:
+        """
+        Renders the background, tiles and objects of one chunk into an opaque surface.
 
         Args:
-            screen: The pygame.Surface to draw the level onto.
+            chunk: (chunk column, chunk row).
+
+        Returns:
+            The baked pygame.Surface.
         """
+        area = self._chunk_rect(chunk)
+        surface = self._chunks.get(chunk)
+        if surface is None:
+            surface = pygame.Surface(area.size)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert() # Display format, fastest to blit
+        surface.fill((0, 0, 0)) # Black where there is no background, like a direct draw
         if self.background:
-            screen.blit(self.background, (0, 0)) # Draw background first
+            background_width, background_height = self.background.get_size()
+            for y in range(area.top - area.top % background_height, area.bottom, background_height): # Repeat over large levels
+                for x in range(area.left - area.left % background_width, area.right, background_width):
+                    surface.blit(self.background, (x - area.x, y - area.y))
+        self._draw_tiles(surface, area)
+        self._draw_objects(surface, area, self._objects_by_chunk.get(chunk, ()))
+        self._chunks[chunk] = surface
+        self._dirty_chunks.discard(chunk)
+        self.bakes += 1
+        return surface
+
+
+    def set_tile(self, col: int, row: int, tile_index: int):
+        """
+        Changes one tile and marks the chunk containing it for re-baking.
+
+        Args:
+            col:        Tile column.
+            row:        Tile row.
+            tile_index: New tileset index (0 for empty).
+        """
+        size = self.tile_source.chunk_tiles
+        chunk = (col // size, row // size)
+        inside = col < self.tile_source.width and row < self.tile_source.height
+        if self.tile_source.writable:
+            self.tile_source.set_tile(col, row, tile_index) # Persist first: evicted chunks reload from the source
+        elif not inside:
+            raise ValueError(f"Tile ({col}, {row}) is outside the level and the tile source is read-only")
         else:
-            screen.fill((0, 0, 0)) # Fill screen with black if no background
+            self._edited_tile_chunks.add(chunk) # Only the resident copy has the edit
+        if chunk in self._tile_chunks or not self.tile_source.writable:
+            self._tile_chunk(chunk)[row % size][col % size] = tile_index
+
+        tile_rect = pygame.Rect(col * self.tile_size, row * self.tile_size, self.tile_size, self.tile_size)
+        if not inside or not pygame.Rect((0, 0), self._extent).contains(tile_rect):
+            self.invalidate() # The level grew: chunk layout changes
+            return
+        self.invalidate(tile_rect)
+
+
+    def invalidate(self, area: pygame.Rect | None = None):
+        """
+        Marks the baked chunks overlapping an area (in level pixels) for re-baking, or drops all of them.
+
+        Call after changing the background or objects directly.
+        """
+        if area is None:
+            self._chunks.clear()
+            self._dirty_chunks.clear()
+            self._extent = self._level_extent() # The grid, background or objects may have changed
+            self.chunk_size = self._choose_chunk_size()
+            self._index_objects()
+            return
+        self._dirty_chunks.update(chunk for chunk in self._chunks_in(area) if chunk in self._chunks)
+
+
+    def stream(self, view: pygame.Rect):
+        """
+        Evicts baked chunks and tile data far from the viewport; they stream back in when they come into view.
+
+        Everything within STREAM_MARGIN_CHUNKS chunks of the viewport stays resident, so scrolling
+        does not re-bake the chunks just outside the screen.
+
+        Args:
+            view: The visible area, in level pixels.
+        """
+        margin_x = STREAM_MARGIN_CHUNKS * self.tile_source.chunk_tiles * self.tile_size
+        margin_y = margin_x
+        keep_area = view.inflate(2 * margin_x, 2 * margin_y)
+        keep_baked = set(self._chunks_in(keep_area))
+        for chunk in [chunk for chunk in self._chunks if chunk not in keep_baked]:
+            del self._chunks[chunk]
+            self._dirty_chunks.discard(chunk)
+            self.evictions += 1
 
-        self._draw_tiles(screen) # Draw level tiles
-        self._draw_objects(screen) # Draw level objects
+        size = self.tile_source.chunk_tiles * self.tile_size
+        first_x, first_y = keep_area.left // size, keep_area.top // size
+        last_x, last_y = (keep_area.right - 1) // size, (keep_area.bottom - 1) // size
+        for chunk in list(self._tile_chunks):
+            if chunk in self._edited_tile_chunks:
+                continue
+            if not (first_x <= chunk[0] <= last_x and first_y <= chunk[1] <= last_y):
+                del self._tile_chunks[chunk]
+                self.evictions += 1
 
 
-    def _draw_tiles(self, screen: pygame.Surface):
+    def resident_chunks(self) -> dict:
         """
-        Draws the level tiles based on the layout and tileset.
+        Returns how many baked surfaces and tile chunks are in memory, and their approximate size in bytes.
+        """
+        baked_bytes = sum(surface.get_pitch() * surface.get_height() for surface in self._chunks.values())
+        return {"baked": len(self._chunks), "baked_bytes": baked_bytes, "tiles": len(self._tile_chunks)}
+
+
+    def draw(self, screen: pygame.Surface, camera=None):
+        """
+        Draws the level background, tiles, and objects onto the given screen.
+
+        The static layer is baked into chunk surfaces once; a frame blits the chunks under the
+        viewport (a single one for small levels), re-baking only chunks whose tiles changed,
+        and evicts chunks that are far away.
+
+        Args:
+            screen: The pygame.Surface to draw the level onto.
+            camera: Camera whose viewport is drawn; without one the level's top-left corner fills the screen.
+        """
+        view = camera.rect if camera is not None else screen.get_rect()
+        if not pygame.Rect((0, 0), self._extent).contains(view):
+            screen.fill((0, 0, 0)) # Part of the viewport is beyond the level's extent
+        for chunk in self._chunks_in(view):
+            surface = self._chunks.get(chunk)
+            if surface is None or chunk in self._dirty_chunks:
+                surface = self._bake_chunk(chunk)
+            chunk_rect = self._chunk_rect(chunk)
+            screen.blit(surface, (chunk_rect.x - view.x, chunk_rect.y - view.y))
+        self.stream(view)
+
+
+    def _draw_tiles(self, target: pygame.Surface, area: pygame.Rect):
+        """
+        Draws the level tiles inside an area of the level based on the layout and tileset.
 
         Args:
-            screen: The pygame.Surface to draw the tiles onto.
+            target: The pygame.Surface to draw the tiles onto; its top-left is area's top-left.
+            area:   The part of the level to draw, in level pixels.
         """
-        if not self.tileset or not self.layout: # Check if tileset and layout are loaded
-            return # Exit if tileset or layout is missing
+        if not self.tileset: # Check if the tileset is loaded
+            return # Exit if the tileset is missing
 
         tile_size = self.tile_size # Get tile size for calculations
-        for row_idx, row in enumerate(self.layout):
-            for col_idx, tile_index in enumerate(row):
+        first_row, last_row = area.top // tile_size, (area.bottom - 1) // tile_size
+        first_col, last_col = area.left // tile_size, (area.right - 1) // tile_size
+        for row_idx in range(max(first_row, 0), min(last_row + 1, self.tile_source.height)):
+            for col_idx in range(max(first_col, 0), min(last_col + 1, self.tile_source.width)):
+                tile_index = self.get_tile(col_idx, row_idx)
                 if tile_index > 0: # Tile index 0 is considered empty/transparent
                     source_rect = pygame.Rect((tile_index - 1) * tile_size, 0, tile_size, tile_size) # Calculate source rect in tileset
-                    dest_rect = pygame.Rect(col_idx * tile_size, row_idx * tile_size, tile_size, tile_size) # Calculate destination rect on screen
-                    screen.blit(self.tileset, dest_rect, source_rect) # Blit tile onto the screen
+                    dest = (col_idx * tile_size - area.x, row_idx * tile_size - area.y) # Tile position relative to the area
+                    target.blit(self.tileset, dest, source_rect) # Blit tile onto the target
 
 
-    def _draw_objects(self, screen: pygame.Surface):
+    def _draw_objects(self, target: pygame.Surface, area: pygame.Rect, objects=None):
         """
-        Draws the loaded level objects onto the screen.
+        Draws the loaded level objects overlapping an area of the level.
 
         Args:
-            screen: The pygame.Surface to draw the objects onto.
+            target:  The pygame.Surface to draw the objects onto; its top-left is area's top-left.
+            area:    The part of the level to draw, in level pixels.
+            objects: The (image, position) pairs to consider; all loaded objects if None.
         """
-        for image, pos in self.loaded_objects:
-            screen.blit(image, pos) # Blit each object image at its position
\ No newline at end of file
+        for image, pos in (self.loaded_objects if objects is None else objects):
+            if area.colliderect(pygame.Rect(pos, image.get_size())):
+                target.blit(image, (pos[0] - area.x, pos[1] - area.y)) # Blit each object image at its position
\ No newline at end of file
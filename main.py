@@ -13,6 +13,11 @@ from config import (
     STATE_DIALOGUE,
     STATE_PUTIN_CUTSCENE,
     STATE_QUIT,
+    SIMULATION_DT,
+    MAX_TICKS_PER_FRAME,
+    MAX_RENDER_FPS,
+    IDLE_WAIT_MS,
+    config,
 )
 
 from states import (
@@ -31,33 +36,30 @@ from dialogue_journal_state import DialogueJournalState
 from state_manager import StateManager
 from save_load import save_game, load_game
 from level_manager import LevelManager
+from preloader import AssetPreloader
+from profiler import PROFILER, TOGGLE_KEY as PROFILER_KEY
+from replay import InputRecorder
 
 import resources
-resources
+import asset_pack
+import data_loader
 
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
-def fade_transition(screen, duration=500):
-    fade = pygame.Surface(screen.get_size()).convert_alpha()
-    clock = pygame.time.Clock()
-    for alpha in range(0, 256, 5):
-        fade.fill((0, 0, 0, alpha))
-        screen.blit(fade, (0, 0))
-        pygame.display.flip()
-        clock.tick(60)
-    for alpha in range(255, -1, -5):
-        fade.fill((0, 0, 0, alpha))
-        screen.blit(fade, (0, 0))
-        pygame.display.flip()
-        clock.tick(60)
-
-
-def handle_state_transitions(manager, screen, result):
-    """Handle state changes based on the result string returned by states."""
+def handle_state_transitions(manager, screen, result, preloader=None):
+    """Handle state changes based on the result string returned by states.
+
+    If a preloader is given, the assets of the next state are finished before it is built.
+    A new game crossfades in from the frame on screen instead (see StateManager.start_transition);
+    its assets keep loading in the background until the fade starts.
+    """
     if result is None:
         return
     if result == STATE_QUIT:
+        if preloader is not None:
+            preloader.shutdown()
+        PROFILER.save() # Writes profile.csv/profile.json if the profiler recorded any frames
         pygame.quit()
         sys.exit()
 
@@ -69,10 +71,17 @@ def handle_state_transitions(manager, screen, result):
             manager.pop_state()
         else:
             # Starting the actual game from menu or cutscene
-            manager.states.clear()
-            playing_state = PlayingState(screen)
-            manager.push_state(playing_state)
-            fade_transition(screen)
+            ready = None
+            if preloader is not None:
+                preloader.warm(STATE_PLAYING) # Usually already decoded during the intro
+                ready = lambda: not preloader.busy(STATE_PLAYING)
+
+            def build_game():
+                if preloader is not None:
+                    preloader.warm(STATE_PUTIN_CUTSCENE) # Next asset-heavy state
+                return PlayingState(pygame.display.get_surface()) # F11 may have replaced `screen` meanwhile
+
+            manager.start_transition(screen.copy(), build_game, ready=ready, replace=True)
     elif result == STATE_PAUSED:
         pause_state = PauseState(screen, current)
         manager.push_state(pause_state)
@@ -92,6 +101,8 @@ def handle_state_transitions(manager, screen, result):
     elif result == STATE_DIALOGUE:
         manager.push_state(DialogueState(screen))
     elif result == STATE_PUTIN_CUTSCENE:
+        if preloader is not None:
+            preloader.wait(STATE_PUTIN_CUTSCENE)
         manager.push_state(PutinCutsceneState(screen))
 
 def main():
@@ -100,6 +111,29 @@ def main():
     pygame.display.set_caption("Pixel War: Multiverse Battle")
     fullscreen = False
 
+    # One memory-mapped archive instead of dozens of loose files, if it has been built.
+    if config["use_asset_pack"]:
+        asset_pack.mount()
+
+    # Bound the memory used by cached images and sounds; assets every scene needs stay pinned.
+    resources.set_cache_budget(config["resource_cache_budget_mb"] * 1024 * 1024)
+    for asset in ("bg_layer1.png", "bg_layer2.png", "player_idle.png"):
+        resources.pin_asset(asset)
+
+    # Pack the small sprites and sheets into shared atlas pages before anything loads them.
+    if config["texture_atlas"]:
+        resources.build_texture_atlas()
+
+    # Pick up edits to dialogue, quest and level JSON while the game runs.
+    data_loader.set_hot_reload(config["hot_reload_data"])
+
+    # Record every game for replay.py (written out on exit).
+    recorder = InputRecorder(config["record_input"]) if config["record_input"] else None
+
+    # Decode the gameplay assets on worker threads while the intro cutscene is running.
+    preloader = AssetPreloader()
+    preloader.warm(STATE_PLAYING)
+
     # Start with MainMenu.
     menu_state = MainMenu(screen)
     manager = StateManager(menu_state)
@@ -110,11 +144,37 @@ def main():
 
     current_settings = {"volume": 50, "difficulty": "Normal", "controls": "Default"}
 
+    # Fixed-timestep loop: real elapsed time is banked in an accumulator and spent in fixed
+    # simulation ticks, so game speed no longer depends on how fast frames are rendered.
+    clock = pygame.time.Clock()
+    tick_ms = SIMULATION_DT * 1000
+    accumulator_ms = 0.0
+    shown = None # State whose frame is on screen
+    held_events = [] # Input that arrived during a transition, for the state shown after it
+    idle = False # The shown state is static and nothing changed since its frame was presented
+
     while True:
+        # Menus, pause and game over screens only change on input: sleep until an event arrives
+        # instead of redrawing the same frame. The timeout keeps background work below running.
+        waited = []
+        if idle:
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            if event.type != pygame.NOEVENT:
+                waited.append(event)
+
+        # Cap the render rate and bank the elapsed time. Under load several ticks run per frame
+        # (renders are skipped); anything beyond MAX_TICKS_PER_FRAME is dropped so the game slows
+        # down instead of falling further and further behind.
+        frame_ms = clock.tick(MAX_RENDER_FPS)
+        accumulator_ms = min(accumulator_ms + frame_ms, tick_ms * MAX_TICKS_PER_FRAME)
+        PROFILER.begin_frame() # Frame work starts after the frame-rate wait
+
         # Get all events once per frame.
-        events = pygame.event.get()
+        events = waited + pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
+                preloader.shutdown()
+                PROFILER.save()
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
@@ -125,6 +185,13 @@ def main():
                     screen = pygame.display.set_mode((800, 600))
                 for s in manager.states:
                     s.screen = screen
+                    if getattr(s, "dirty_renderer", None) is not None:
+                        s.dirty_renderer.invalidate() # Cached static layer belongs to the old display surface
+            elif event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                PROFILER.toggle() # Frame timing overlay; states are instrumented from the end of this frame
+                for s in manager.states:
+                    if getattr(s, "dirty_renderer", None) is not None:
+                        s.dirty_renderer.invalidate() # Redraw the area under the overlay
 
         # Debug: check if Enter key is pressed.
         keys = pygame.key.get_pressed()
@@ -134,24 +201,73 @@ def main():
         current = manager.current_state()
         # print("Current state:", type(current).__name__)  # Debug print
 
-        # Pass events to the current state's process_events.
-        result = manager.current_state().process_events(events)
+        if manager.transition is not None:
+            # States are paused during a transition; they get its input once it is over.
+            held_events.extend(events)
+            result = None
+            accumulator_ms = 0.0 # The incoming state starts when the fade ends instead of catching up on it
+        else:
+            # Pass events to the current state's process_events.
+            events, held_events = held_events + events, []
+            result = manager.current_state().process_events(events)
+            if recorder is not None and isinstance(current, PlayingState):
+                recorder.frame(current, events, result)
+
+        # Run the simulation ticks that are due, then render once.
+        while accumulator_ms >= tick_ms:
+            current = manager.current_state()
+            if recorder is not None and isinstance(current, PlayingState):
+                keys = pygame.key.get_pressed()
+                current.update(SIMULATION_DT, keys)
+                recorder.tick(current, keys)
+            else:
+                current.update()
+            accumulator_ms -= tick_ms
+            if isinstance(current, PlayingState) and current.next_state != STATE_PLAYING:
+                break # Let the pending transition happen before simulating further
+
+        current = manager.current_state()
+        if events or not idle: # After a timeout without input the frame on screen is still current
+            transitioning = manager.transition is not None
+            if transitioning:
+                manager.draw_transition(screen, frame_ms) # May build and push the incoming state
+                current = manager.current_state()
+            elif isinstance(current, PlayingState):
+                # Interpolate sprites by how far we are into the next tick.
+                current.draw(min(accumulator_ms / tick_ms, 1.0))
+            else:
+                current.draw()
+            shown = current
+            overlay_rect = PROFILER.draw_overlay(screen) # None unless profiling
+            # States only draw; the main loop presents the frame
+            dirty_rects = None if transitioning else getattr(current, "dirty_rects", None)
+            if dirty_rects is not None:
+                if overlay_rect is not None:
+                    dirty_rects = dirty_rects + [overlay_rect]
+                PROFILER.call("present", pygame.display.update, dirty_rects) # Push only the regions that changed
+            else:
+                PROFILER.call("present", pygame.display.flip)
 
-        # Update and draw current state.
-        manager.current_state().update()
-        manager.current_state().draw()
+        preloader.pump() # Finish assets decoded in the background, a couple of milliseconds at most
+        data_loader.poll_changes() # Only checks the files in hot-reload mode
 
         # Handle direct results from process_events
-        handle_state_transitions(manager, screen, result)
+        handle_state_transitions(manager, screen, result, preloader)
 
         # Some states signal transitions via a `next_state` attribute (e.g. PlayingState)
         current = manager.current_state()
         next_state = getattr(current, "next_state", STATE_PLAYING)
         if isinstance(current, PlayingState) and next_state != STATE_PLAYING:
             current.next_state = STATE_PLAYING
-            handle_state_transitions(manager, screen, next_state)
+            handle_state_transitions(manager, screen, next_state, preloader)
 
-        pygame.time.delay(10)
+        PROFILER.end_frame(manager.current_state())
+
+        # Idle from the next frame on if the static state drawn this frame is still showing. The
+        # profiler overlay and assets still being finalized by pump() need the loop running.
+        current = manager.current_state()
+        idle = (getattr(current, "static_frame", False) and current is shown and manager.transition is None
+                and not PROFILER.enabled and not preloader.busy())
 
 
 if __name__ == "__main__":
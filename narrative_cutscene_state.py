@@ -1,19 +1,21 @@
 # ====================== File: narrative_cutscene_state.py ======================
 import pygame, textwrap
 from data_loader import load_json
-from resources import load_image_with_scale
+from resources import load_image_with_scale, get_sys_font, render_text
+from config import SIMULATION_DT
+
+FADE_IN_SPEED = 150 # Alpha units per second (the original 5 per frame at 30 FPS)
 
 class NarrativeCutsceneState:
     def __init__(self, screen, filename="cutscene_intro.json", scroll_delay=40, wrap_width=70):
         self.screen = screen
-        self.data = load_json(filename)
+        self.data = load_json(filename, frozen=True) # Shared cached data, read only
         if not self.data:
             self.data = {"text": "In a world torn by conflict, a new era begins...", "bg_image": ""}
         self.full_text = self.data.get("text", "")
         self.scroll_delay = scroll_delay
         self.wrap_width = wrap_width
-        self.font = pygame.font.SysFont("arial", 28)
-        self.clock = pygame.time.Clock()
+        self.font = get_sys_font("arial", 28)
         self.displayed_text = ""
         self.text_index = 0
         self.last_char_time = pygame.time.get_ticks()
@@ -66,9 +68,9 @@ class NarrativeCutsceneState:
 
         return None
 
-    def update(self):
+    def update(self, dt=SIMULATION_DT):
         if self.fading_in:
-            self.alpha += 5
+            self.alpha += FADE_IN_SPEED * dt
             if self.alpha >= 255:
                 self.alpha = 255
                 self.fading_in = False
@@ -90,7 +92,7 @@ class NarrativeCutsceneState:
             bg = pygame.Surface((800,600))
             bg.fill((0, 0, 0))
         fade = pygame.Surface((800,600))
-        fade.set_alpha(255 - self.alpha)
+        fade.set_alpha(255 - int(self.alpha))
         fade.fill((0, 0, 0))
         bg.blit(fade, (0,0))
         self.screen.blit(bg, (0,0))
@@ -98,11 +100,9 @@ class NarrativeCutsceneState:
         lines = wrapped_text.split("\n")
         y = 100
         for line in lines:
-            text_surf = self.font.render(line, True, (255,255,255))
+            text_surf = render_text(self.font, line, True, (255,255,255))
             self.screen.blit(text_surf, (100, y))
             y += 35
         if self.done:
-            instruction = self.font.render("Press ENTER to continue...", True, (200,200,200))
+            instruction = render_text(self.font, "Press ENTER to continue...", True, (200,200,200))
             self.screen.blit(instruction, (100, y+20))
-        pygame.display.flip()
-        self.clock.tick(30)
@@ -17,7 +17,7 @@ class ClassDependentNPC(NPC):
         self.friendly_threshold = friendly_threshold
         self.interaction_prompt = f"Press E to talk to {self.name}"
         if dialogue_script is None:
-            dialogue_script = load_json("dialogue_elder.json")
+            dialogue_script = load_json("dialogue_elder.json", frozen=True) # Cached and shared by every NPC, read only
             if not dialogue_script:
                 dialogue_script = {
                     "text": "Greetings, traveler. What do you seek?",
@@ -7,7 +7,7 @@ import logging
 from npc_dialogue import ClassDependentNPC
 from advanced_quest import Quest
 from branching_dialogue_ui import BranchingDialogueUI
-from data_loader import load_json
+from data_loader import load_json, thaw
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +28,12 @@ class QuestMasterNPC(ClassDependentNPC):
         dialogue_ui = BranchingDialogueUI(pygame.display.get_surface(), self.dialogue_script)
         choice = dialogue_ui.run()
         logger.info(f"{self.name} received choice: {choice}")
-        quest_data = load_json("quest_data.json")
+        quest_data = load_json("quest_data.json", frozen=True) # Cached; re-parsed only if the file changed
         quests = quest_data.get("quests", [])
         if choice == "A":
             if quests:
                 q = quests[0]
-                new_quest = Quest(q["quest_id"], q["description"], q.get("objectives", []), q.get("rewards", {}))
+                new_quest = Quest(q["quest_id"], q["description"], thaw(q.get("objectives", [])), thaw(q.get("rewards", {})))
                 if hasattr(player, "quest_log"):
                     player.quest_log.add_quest(new_quest)
                 print(f"{self.name}: You must defend the outpost!")
@@ -42,7 +42,7 @@ class QuestMasterNPC(ClassDependentNPC):
         elif choice == "B":
             if len(quests) > 1:
                 q = quests[1]
-                new_quest = Quest(q["quest_id"], q["description"], q.get("objectives", []), q.get("rewards", {}))
+                new_quest = Quest(q["quest_id"], q["description"], thaw(q.get("objectives", [])), thaw(q.get("rewards", {})))
                 if hasattr(player, "quest_log"):
                     player.quest_log.add_quest(new_quest)
                 print(f"{self.name}: Infiltrate the castle and steal the artifact!")
@@ -1,9 +1,12 @@
 # pause_state.py
 import pygame
-from ui_helpers import draw_vertical_gradient
+from config import IDLE_WAIT_MS
+from ui_helpers import gradient_surface
+from resources import get_sys_font, render_text
+from static_frame import StaticFrame
 
 
-class PauseState:
+class PauseState(StaticFrame):
     """
     A polished pause menu state.
     Use UP/DOWN to navigate and ENTER to select.
@@ -15,11 +18,14 @@ class PauseState:
         self.clock = pygame.time.Clock()
         self.options = ["Resume", "Settings", "Save", "Quit"]
         self.selection = 0
-        self.font = pygame.font.SysFont("arial", 36)
-        self.instruction = self.font.render("UP/DOWN: Navigate, ENTER: Select", True, (255, 255, 255))
+        self.font = get_sys_font("arial", 36)
+        self.instruction = render_text(self.font, "UP/DOWN: Navigate, ENTER: Select", True, (255, 255, 255))
 
     def process_events(self):
-        for event in pygame.event.get():
+        # The menu only changes on input; sleep until some arrives instead of spinning.
+        event = pygame.event.wait(IDLE_WAIT_MS)
+        events = [event] if event.type != pygame.NOEVENT else []
+        for event in events + pygame.event.get():
             if event.type == pygame.QUIT:
                 return "quit"
             elif event.type == pygame.KEYDOWN:
@@ -27,8 +33,10 @@ class PauseState:
                     return "resume"
                 elif event.key == pygame.K_UP:
                     self.selection = (self.selection - 1) % len(self.options)
+                    self.invalidate()
                 elif event.key == pygame.K_DOWN:
                     self.selection = (self.selection + 1) % len(self.options)
+                    self.invalidate()
                 elif event.key == pygame.K_RETURN:
                     return self.options[self.selection].lower()
         return None
@@ -36,22 +44,24 @@ class PauseState:
     def update(self):
         pass
 
-    def draw(self):
-        self.screen.fill((20, 20, 20))
-        panel = pygame.Surface((400, 300))
-        draw_vertical_gradient(panel, (50, 50, 100), (10, 10, 40))
-        pygame.draw.rect(panel, (255, 255, 255), panel.get_rect(), 3)
+    def render(self, surface):
+        surface.fill((20, 20, 20))
+        panel = gradient_surface((400, 300), (50, 50, 100), (10, 10, 40)) # Cached; shared, so the border goes on the frame
         panel_x = (800 - panel.get_width()) // 2
         panel_y = (600 - panel.get_height()) // 2
-        self.screen.blit(panel, (panel_x, panel_y))
+        panel_rect = surface.blit(panel, (panel_x, panel_y))
+        pygame.draw.rect(surface, (255, 255, 255), panel_rect, 3)
         y = panel_y + 50
         for i, option in enumerate(self.options):
             color = (255, 255, 0) if i == self.selection else (255, 255, 255)
-            text = self.font.render(option, True, color)
+            text = render_text(self.font, option, True, color)
             text_rect = text.get_rect(centerx=panel_x + panel.get_width() // 2, top=y)
-            self.screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
             y += 60
         inst_rect = self.instruction.get_rect(center=(800 // 2, panel_y + panel.get_height() - 30))
-        self.screen.blit(self.instruction, inst_rect)
+        surface.blit(self.instruction, inst_rect)
+
+    def draw(self):
+        super().draw()
         pygame.display.flip()
         self.clock.tick(60)
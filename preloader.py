@@ -0,0 +1,165 @@
+# preloader.py
+"""
+Background asset preloader.
+
+Reads a manifest (assets/data/preload_manifest.json) listing the images, sprite sheets and
+sounds each state needs. warm() submits the files of a state to a thread pool, where they are
+read and decoded off the main thread. pump(), called once per frame from the main loop, then
+finishes the completed jobs on the main thread (convert_alpha(), scaling, caching) within a
+small time budget, so by the time the state is constructed its assets are already cached.
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+import resources
+from data_loader import load_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST = "preload_manifest.json"
+DEFAULT_PUMP_BUDGET_MS = 2.0 # Main-thread time spent finishing decoded assets per frame
+
+
+class AssetPreloader:
+    """
+    Decodes the assets of upcoming states on worker threads and caches them on the main thread.
+
+    All interaction with the resource cache and the display happens on the thread calling
+    pump()/wait(); worker threads only read and decode files.
+
+    Attributes:
+        manifest:  Dict mapping state names to {"images": [...], "sheets": [...], "sounds": [...]}.
+        finished:  Number of assets finalized so far.
+    """
+    def __init__(self, manifest: dict | None = None, max_workers: int = 2):
+        """
+        Initializes the preloader and its worker pool.
+
+        Args:
+            manifest:    Manifest dict; loaded from assets/data/preload_manifest.json if None.
+            max_workers: Number of decoding threads.
+        """
+        self.manifest = manifest if manifest is not None else load_json(DEFAULT_MANIFEST, frozen=True)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preload")
+        self._pending = {} # cache key -> (future, finalize callable)
+        self.finished = 0
+
+    def _jobs(self, state_name: str):
+        """
+        Yields (cache key, decode callable, finalize callable) for every asset of a state.
+        finalize takes the decode result, or None if decoding failed.
+        """
+        entry = self.manifest.get(state_name, {})
+        for image in entry.get("images", []):
+            path, size = image["path"], tuple(image["size"])
+            colorkey, mode = image.get("colorkey"), image.get("mode", "alpha")
+            yield (resources.image_cache_key(path, size, colorkey, mode),
+                   lambda path=path: resources.decode_image(path),
+                   lambda decoded, path=path, size=size, colorkey=colorkey, mode=mode:
+                       resources.finalize_image(path, decoded, size, colorkey, mode))
+        for sheet in entry.get("sheets", []):
+            path, layout = sheet["path"], (sheet["frame_width"], sheet["frame_height"], sheet["frames"])
+            colorkey = sheet.get("colorkey")
+            yield (resources.sheet_cache_key(path, *layout, colorkey),
+                   lambda path=path: resources.decode_image(path),
+                   lambda decoded, path=path, layout=layout, colorkey=colorkey:
+                       resources.finalize_sprite_sheet(path, decoded, *layout, colorkey) if decoded is not None else None)
+        if pygame.mixer.get_init(): # Without a mixer the sounds would fail and be cached as None
+            for path in entry.get("sounds", []):
+                yield (resources.sound_cache_key(path),
+                       lambda path=path: resources.decode_sound(path),
+                       lambda sound, path=path: resources.finalize_sound(path, sound))
+
+    def warm(self, state_name: str) -> int:
+        """
+        Starts decoding the assets a state needs that are neither cached nor already in flight.
+
+        Args:
+            state_name: A state name from the manifest (e.g., STATE_PLAYING).
+
+        Returns:
+            The number of assets submitted.
+        """
+        submitted = 0
+        for key, decode, finalize in self._jobs(state_name):
+            if key in self._pending or resources.is_cached(key):
+                continue
+            self._pending[key] = (self._executor.submit(decode), finalize)
+            submitted += 1
+        if submitted:
+            logger.debug(f"Preloading {submitted} assets for state '{state_name}'")
+        return submitted
+
+    def _finish(self, key: tuple):
+        """
+        Finalizes one decoded asset on the calling (main) thread.
+        """
+        future, finalize = self._pending.pop(key)
+        try:
+            decoded = future.result()
+        except Exception as e: # Decoding errors are reported like a synchronous load would
+            logger.error(f"Error preloading {key[0]} {key[1]}: {e}")
+            decoded = None
+        if not resources.is_cached(key): # A synchronous load may have beaten the preloader
+            finalize(decoded)
+        self.finished += 1
+
+    def pump(self, budget_ms: float = DEFAULT_PUMP_BUDGET_MS) -> int:
+        """
+        Finalizes decoded assets until the time budget is used up. Call once per frame.
+
+        Args:
+            budget_ms: Maximum main-thread time to spend, in milliseconds.
+
+        Returns:
+            The number of assets finalized.
+        """
+        done = 0
+        deadline = time.perf_counter() + budget_ms / 1000
+        for key in [key for key, (future, _) in self._pending.items() if future.done()]:
+            self._finish(key)
+            done += 1
+            if time.perf_counter() >= deadline:
+                break
+        return done
+
+    def wait(self, state_name: str | None = None):
+        """
+        Blocks until the assets of a state (or everything in flight) are decoded and cached.
+
+        Called right before constructing a state so its constructor only hits the cache.
+        """
+        if state_name is not None:
+            self.warm(state_name) # Anything not yet requested is decoded now, still in parallel
+            keys = [key for key, _, _ in self._jobs(state_name) if key in self._pending]
+        else:
+            keys = list(self._pending)
+        for key in keys:
+            self._finish(key)
+
+    def is_ready(self, state_name: str) -> bool:
+        """
+        Returns True if every asset of a state is cached.
+        """
+        return all(resources.is_cached(key) for key, _, _ in self._jobs(state_name))
+
+    def busy(self, state_name: str | None = None) -> bool:
+        """
+        Returns True while assets (of a state, or any) are decoding or waiting for pump().
+
+        Unlike is_ready(), this turns False for assets that failed to decode; constructing the
+        state then reports the error through the usual synchronous load.
+        """
+        if state_name is None:
+            return bool(self._pending)
+        return any(key in self._pending for key, _, _ in self._jobs(state_name))
+
+    def shutdown(self):
+        """
+        Stops the worker threads, dropping jobs that have not started yet.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
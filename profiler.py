@@ -0,0 +1,269 @@
+# profiler.py
+"""
+Per-frame profiler with an in-game overlay.
+
+While profiling is on (toggled with F3 in the game, or --profile in headless_runner.py), the
+profiler times the phases of every frame and keeps a rolling window of per-frame timings and
+sprite group sizes:
+
+    process_events, update, draw   every state, as called by the main loop
+    update.* and draw.*            the sub-steps a state lists in its PROFILE_SECTIONS
+    present                        pygame.display.flip()/update(), timed by the main loop
+
+Timing works by wrapping the listed methods on the state's instances when profiling is turned
+on and removing the wrappers when it is turned off, so the game runs the plain methods and
+pays nothing while the profiler is off. Section times are inclusive (update contains its
+sub-steps) and summed over the frame (one frame may run several simulation ticks).
+
+The overlay shows the 50th/95th/99th percentiles of every section and the current group
+sizes. save() writes the recorded frames to a CSV file (one row per frame) and the summary
+to a JSON file; the game calls it on exit if anything was recorded.
+"""
+import csv
+import json
+import logging
+import time
+import weakref
+from collections import deque
+
+import pygame
+
+from resources import get_font
+
+logger = logging.getLogger(__name__)
+
+TOGGLE_KEY = pygame.K_F3
+HISTORY_FRAMES = 3600 # Frames kept for percentiles and the dump (one minute at 60 FPS)
+OVERLAY_REFRESH_MS = 500 # The overlay text is re-rendered at most this often
+OVERLAY_FONT_SIZE = 18
+DUMP_BASENAME = "profile" # save() writes profile.csv and profile.json
+DEFAULT_SECTIONS = ( # (label, method) timed on every state
+    ("process_events", "process_events"),
+    ("update", "update"),
+    ("draw", "draw"),
+)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of an ascending list (0.0 for an empty one).
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class Profiler:
+    """
+    Times frame phases of instrumented states and keeps a rolling history of them.
+
+    Attributes:
+        enabled: True while timing. Toggle with toggle(), or enable()/disable().
+        frames:  deque of recorded frames, each {"frame_ms", "sections": {label: ms}, "counts": {group: size}}.
+    """
+    def __init__(self, history: int = HISTORY_FRAMES):
+        """
+        Initializes a disabled profiler.
+
+        Args:
+            history: Number of frames kept.
+        """
+        self.enabled = False
+        self.frames = deque(maxlen=history)
+        self._patched = weakref.WeakKeyDictionary() # state -> [(owner, attribute name)] of the installed wrappers
+        self._sections = {} # label -> ns accumulated in the current frame
+        self._frame_start = None
+        self._overlay = None
+        self._overlay_time = 0
+
+    def enable(self):
+        """
+        Starts timing. States are instrumented as they are passed to attach() or end_frame().
+        """
+        self.enabled = True
+        self._frame_start = None
+        logger.info("Profiler enabled")
+
+    def disable(self):
+        """
+        Stops timing and removes every installed wrapper.
+        """
+        self.enabled = False
+        for patches in self._patched.values():
+            for owner, name in patches:
+                try:
+                    delattr(owner, name) # Uncovers the class method again
+                except AttributeError:
+                    pass
+        self._patched.clear()
+        self._overlay = None
+        logger.info("Profiler disabled")
+
+    def toggle(self) -> bool:
+        """
+        Turns profiling on or off. Returns the new state.
+        """
+        self.disable() if self.enabled else self.enable()
+        return self.enabled
+
+    def _timed(self, label: str, func):
+        """
+        Returns func wrapped to add its run time to the current frame under label.
+        """
+        sections = self._sections
+        clock = time.perf_counter_ns
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sections[label] = sections.get(label, 0) + clock() - start
+        timed.__wrapped__ = func
+        return timed
+
+    def attach(self, state):
+        """
+        Instruments a state: its process_events/update/draw and the (label, "attribute.path") pairs
+        of its PROFILE_SECTIONS. Does nothing if profiling is off or the state is already instrumented.
+        """
+        if not self.enabled or state is None or state in self._patched:
+            return
+        patches = []
+        for label, path in DEFAULT_SECTIONS + tuple(getattr(state, "PROFILE_SECTIONS", ())):
+            owner = state
+            *parents, name = path.split(".")
+            for parent in parents:
+                owner = getattr(owner, parent, None)
+            method = getattr(owner, name, None)
+            if method is None or not callable(method):
+                continue
+            setattr(owner, name, self._timed(label, method))
+            patches.append((owner, name))
+        self._patched[state] = patches
+
+    def call(self, label: str, func, *args):
+        """
+        Calls func, timing it under label while profiling is on.
+        """
+        if not self.enabled:
+            return func(*args)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            self._sections[label] = self._sections.get(label, 0) + time.perf_counter_ns() - start
+
+    def begin_frame(self):
+        """
+        Marks the start of a frame's work (after the frame-rate wait).
+        """
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+
+    def end_frame(self, state=None):
+        """
+        Records the frame and instruments the state for the next one.
+
+        Args:
+            state: The current state; its sprite group sizes are recorded.
+        """
+        if not self.enabled:
+            return
+        if self._frame_start is not None:
+            counts = {}
+            if state is not None:
+                counts = {name: len(value) for name, value in vars(state).items()
+                          if isinstance(value, pygame.sprite.AbstractGroup)}
+            self.frames.append({
+                "frame_ms": (time.perf_counter_ns() - self._frame_start) / 1e6,
+                "sections": {label: ns / 1e6 for label, ns in self._sections.items()},
+                "counts": counts,
+            })
+        self._sections.clear()
+        self.attach(state) # Picks up states created during the frame
+
+    def summary(self) -> dict:
+        """
+        Returns {"frames", "frame_ms", "sections", "counts"}: percentiles ("mean", "p50", "p95", "p99",
+        "max" in ms) of the frame time and of every section (frames that did not run a section count
+        as 0 ms), and the mean and max size of every sprite group.
+        """
+        frames = list(self.frames)
+        def stats(values):
+            values = sorted(values)
+            return {"mean": sum(values) / len(values) if values else 0.0, "p50": percentile(values, 0.50),
+                    "p95": percentile(values, 0.95), "p99": percentile(values, 0.99), "max": values[-1] if values else 0.0}
+        labels = sorted({label for frame in frames for label in frame["sections"]})
+        groups = sorted({name for frame in frames for name in frame["counts"]})
+        return {
+            "frames": len(frames),
+            "frame_ms": stats(frame["frame_ms"] for frame in frames),
+            "sections": {label: stats(frame["sections"].get(label, 0.0) for frame in frames) for label in labels},
+            "counts": {name: {"mean": sum(frame["counts"].get(name, 0) for frame in frames) / len(frames),
+                              "max": max(frame["counts"].get(name, 0) for frame in frames)} for name in groups},
+        }
+
+    def _render_overlay(self) -> pygame.Surface:
+        """
+        Renders the overlay panel from the current summary.
+        """
+        font = get_font(None, OVERLAY_FONT_SIZE)
+        summary = self.summary()
+        frame = summary["frame_ms"]
+        lines = [f"frame  p50 {frame['p50']:.2f}  p95 {frame['p95']:.2f}  p99 {frame['p99']:.2f} ms  ({summary['frames']} frames)"]
+        for label, stats in summary["sections"].items():
+            lines.append(f"{label:<32} {stats['p50']:6.2f} {stats['p95']:6.2f} {stats['p99']:6.2f}")
+        latest = self.frames[-1]["counts"] if self.frames else {}
+        if latest:
+            lines.append("  ".join(f"{name.removesuffix('_group')} {count}" for name, count in sorted(latest.items())))
+        rendered = [font.render(line, True, (255, 255, 255)) for line in lines] # Changing text: not worth the text cache
+        width = max(surface.get_width() for surface in rendered) + 12
+        line_height = font.get_linesize()
+        panel = pygame.Surface((width, line_height * len(rendered) + 8))
+        panel.fill((0, 0, 0)) # Opaque, so redrawing it over itself (dirty-rect frames) leaves no trails
+        for i, surface in enumerate(rendered):
+            panel.blit(surface, (6, 4 + i * line_height))
+        return panel
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect | None:
+        """
+        Draws the overlay in the top-left corner of a surface while profiling is on.
+
+        Returns:
+            The rect drawn over, or None if nothing was drawn.
+        """
+        if not self.enabled or not self.frames:
+            return None
+        now = pygame.time.get_ticks()
+        if self._overlay is None or now - self._overlay_time >= OVERLAY_REFRESH_MS:
+            self._overlay = self._render_overlay()
+            self._overlay_time = now
+        return surface.blit(self._overlay, (0, 0))
+
+    def save(self, basename: str = DUMP_BASENAME) -> tuple[str, str] | None:
+        """
+        Writes the recorded frames to <basename>.csv and the summary to <basename>.json.
+
+        Returns:
+            The two paths written, or None if no frame was recorded.
+        """
+        if not self.frames:
+            return None
+        frames = list(self.frames)
+        labels = sorted({label for frame in frames for label in frame["sections"]})
+        groups = sorted({name for frame in frames for name in frame["counts"]})
+        csv_path, json_path = basename + ".csv", basename + ".json"
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "frame_ms"] + [f"{label}_ms" for label in labels] + groups)
+            for i, frame in enumerate(frames):
+                writer.writerow([i, f"{frame['frame_ms']:.4f}"]
+                                + [f"{frame['sections'].get(label, 0.0):.4f}" for label in labels]
+                                + [frame["counts"].get(name, 0) for name in groups])
+        with open(json_path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+        logger.info(f"Profile of {len(frames)} frames written to {csv_path} and {json_path}")
+        return csv_path, json_path
+
+
+PROFILER = Profiler() # Shared by the main loop and the states
@@ -1,7 +1,8 @@
 # quest_journal_state.py
 import pygame
 import textwrap
-from ui_helpers import draw_vertical_gradient
+from ui_helpers import gradient_surface
+from resources import get_sys_font, render_text
 
 
 class QuestJournalState:
@@ -13,10 +14,10 @@ class QuestJournalState:
     def __init__(self, screen, quest_log):
         self.screen = screen
         self.quest_log = quest_log  # Expect an AdvancedQuestLog instance.
-        self.font = pygame.font.SysFont("arial", 24)
+        self.font = get_sys_font("arial", 24)
         self.clock = pygame.time.Clock()
         self.offset = 0
-        self.instruction = self.font.render("UP/DOWN: Scroll, ESC: Exit Quest Journal", True, (200, 200, 200))
+        self.instruction = render_text(self.font, "UP/DOWN: Scroll, ESC: Exit Quest Journal", True, (200, 200, 200))
         quest_texts = []
         for quest in self.quest_log.quests.values():
             quest_texts.append(str(quest))
@@ -46,13 +47,11 @@ class QuestJournalState:
 
     def draw(self):
         self.screen.fill((20, 20, 20))
-        panel = pygame.Surface((760, 540))
-        draw_vertical_gradient(panel, (50, 50, 100), (10, 10, 40))
-        pygame.draw.rect(panel, (255, 255, 255), panel.get_rect(), 2)
-        self.screen.blit(panel, (20, 20))
+        panel_rect = self.screen.blit(gradient_surface((760, 540), (50, 50, 100), (10, 10, 40)), (20, 20)) # Cached panel
+        pygame.draw.rect(self.screen, (255, 255, 255), panel_rect, 2)
         y = 30 - self.offset
         for line in self.journal_lines:
-            text_surf = self.font.render(line, True, (255, 255, 255))
+            text_surf = render_text(self.font, line, True, (255, 255, 255))
             self.screen.blit(text_surf, (40, y))
             y += 30
         self.screen.blit(self.instruction, (40, 500))
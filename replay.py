@@ -0,0 +1,378 @@
+# replay.py
+"""
+Deterministic input recording and replay for PlayingState.
+
+Every random spawn of a PlayingState comes from its own seeded generator (PlayingState.rng),
+so a game is fully determined by its seed, the input it receives and the tunables changed
+outside it (the upgrade shop and the settings screen). An InputRecorder writes exactly that to
+a compact binary file while the game runs; replay() feeds the file back through the headless
+loop and reproduces the session bit-exactly, checking the recorded transitions and periodic
+state checksums on the way.
+
+File format: a 10-byte header (magic, format version, simulation rate) followed by records,
+each starting with one opcode byte:
+
+    0x00-0x0F  TICK       one simulation tick; the low nibble is the held arrow keys (KEY_BITS)
+    0x10-0x1F  FRAME      one process_events() call; the low nibble is the number of events that
+                          follow as one byte each (EVENT_CODES), 15 meaning a 2-byte count follows
+    0x20       RESULT     1 byte: the transition (RESULTS) of the preceding FRAME or TICK
+    0x30       TUNABLES   soldier speed, projectile speed, lives, boss health (TUNABLES_FORMAT)
+    0x40       NEW_GAME   8 bytes: seed of a new PlayingState
+    0x50       CHECK      4 bytes: state_checksum() after the preceding TICK
+
+A minute of play at 60 FPS takes about 7 KB. A replay is also a repeatable perf workload:
+
+Usage:
+    python replay.py session.rec
+    python replay.py session.rec --render --repeat 5
+    python replay.py session.rec --entity-store --profile
+
+Sessions are recorded by the game when config["record_input"] names a file, or by
+python headless_runner.py --record session.rec.
+"""
+import os
+
+# The SDL dummy drivers must be selected before pygame is imported.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import atexit
+import logging
+import struct
+import time
+import zlib
+from array import array
+
+import pygame
+
+import config
+from config import (STATE_PLAYING, STATE_PAUSED, STATE_SETTINGS, STATE_QUIT, STATE_UPGRADE, STATE_GAMEOVER,
+                    SIMULATION_DT, SIMULATION_HZ)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CLAYREC"
+VERSION = 1
+HEADER = struct.Struct("<7sBH") # Magic, format version, simulation ticks per second
+TUNABLES_FORMAT = struct.Struct("<ddii")
+CHECK_INTERVAL = 60 # Ticks between state checksums
+FLUSH_BYTES = 64 * 1024 # Buffered bytes written out at once
+
+OP_TICK, OP_FRAME, OP_RESULT, OP_TUNABLES, OP_NEW_GAME, OP_CHECK = 0x00, 0x10, 0x20, 0x30, 0x40, 0x50
+KEY_BITS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN) # A TICK has bit i set while KEY_BITS[i] is held
+EVENT_CODES = {pygame.K_SPACE: 0, pygame.K_p: 1, pygame.K_o: 2} # KEYDOWN keys PlayingState reacts to
+QUIT_CODE = 3
+RESULTS = (STATE_PAUSED, STATE_SETTINGS, STATE_QUIT, STATE_UPGRADE, STATE_GAMEOVER)
+
+
+class ReplayError(Exception):
+    """
+    Raised for a file that is not a recording of this game version.
+    """
+
+
+def state_checksum(state) -> int:
+    """
+    Returns a CRC-32 of everything the simulation carries from tick to tick: score, lives, level,
+    timers, the rect of every sprite and the state of the random number generator.
+    """
+    values = array("q", (state.score, state.lives, state.level))
+    for group, _ in state._sprite_layers():
+        for sprite in group:
+            values.extend(sprite.rect)
+    crc = zlib.crc32(values)
+    crc = zlib.crc32(struct.pack("<ddd", state.invulnerable_timer_ms, state.shield_timer_ms,
+                                 state.powerup_spawn_timer_ms), crc)
+    return zlib.crc32(array("I", state.rng.getstate()[1]), crc) # Mersenne Twister words and position
+
+
+def _tunables(state) -> tuple:
+    """
+    Returns the values other states may change on a PlayingState between its frames.
+    """
+    return (float(state.soldier.speed), float(state.projectile_speed), state.lives, config.config["boss_health"])
+
+
+def _apply_tunables(state, values: tuple):
+    """
+    Sets recorded tunables on a PlayingState.
+    """
+    state.soldier.speed, state.projectile_speed, state.lives, config.config["boss_health"] = values
+
+
+class InputRecorder:
+    """
+    Records the input and transitions of PlayingStates to a file.
+
+    Call frame() after every process_events() and tick() after every update() of a PlayingState.
+    A new PlayingState (restart or new game) starts a new game in the recording automatically.
+    """
+    def __init__(self, path: str):
+        """
+        Creates the recording file. It is completed by close(), which also runs at interpreter exit.
+
+        Args:
+            path: File to write.
+        """
+        self.path = path
+        self._file = open(path, "wb")
+        self._buffer = bytearray(HEADER.pack(MAGIC, VERSION, SIMULATION_HZ))
+        self._state = None # PlayingState being recorded
+        self._tunables = None # Last TUNABLES written
+        self._ticks = 0 # Ticks recorded in the current game
+        atexit.register(self.close)
+        logger.info(f"Recording input to {path}")
+
+    def _sync(self, state):
+        """
+        Starts a new game on a new state and records tunables changed since the last record.
+        """
+        if state is not self._state:
+            self._state = state
+            self._tunables = None
+            self._ticks = 0
+            self._buffer.append(OP_NEW_GAME)
+            self._buffer += struct.pack("<Q", state.seed)
+        tunables = _tunables(state)
+        if tunables != self._tunables:
+            self._tunables = tunables
+            self._buffer.append(OP_TUNABLES)
+            self._buffer += TUNABLES_FORMAT.pack(*tunables)
+
+    def _result(self, result: str | None):
+        if result is not None and result in RESULTS:
+            self._buffer.append(OP_RESULT)
+            self._buffer.append(RESULTS.index(result))
+
+    def frame(self, state, events: list[pygame.event.Event], result: str | None):
+        """
+        Records one process_events() call of a PlayingState and what it returned.
+        """
+        self._sync(state)
+        codes = bytearray()
+        for event in events:
+            if event.type == pygame.QUIT:
+                codes.append(QUIT_CODE)
+                break # process_events() returns here; later events are never seen
+            if event.type == pygame.KEYDOWN and event.key in EVENT_CODES:
+                codes.append(EVENT_CODES[event.key])
+                if event.key != pygame.K_SPACE:
+                    break
+        if len(codes) < 15:
+            self._buffer.append(OP_FRAME | len(codes))
+        else:
+            self._buffer.append(OP_FRAME | 15)
+            self._buffer += struct.pack("<H", len(codes))
+        self._buffer += codes
+        self._result(result)
+
+    def tick(self, state, keys):
+        """
+        Records one update() of a PlayingState with the key state it was given.
+        """
+        if state is not self._state:
+            self._sync(state)
+        mask = 0
+        for bit, key in enumerate(KEY_BITS):
+            if keys[key]:
+                mask |= 1 << bit
+        self._buffer.append(OP_TICK | mask)
+        self._result(state.next_state if state.next_state != STATE_PLAYING else None)
+        self._ticks += 1
+        if self._ticks % CHECK_INTERVAL == 0:
+            self._buffer.append(OP_CHECK)
+            self._buffer += struct.pack("<I", state_checksum(state))
+        if len(self._buffer) >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered records to the file.
+        """
+        if self._file is not None and self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self):
+        """
+        Writes the remaining records and closes the file. Closing twice does nothing.
+        """
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+        atexit.unregister(self.close)
+        logger.info(f"Input recording written to {self.path}")
+
+
+class _HeldKeys:
+    """
+    Key state of a TICK record, indexable by key constant like pygame.key.get_pressed().
+    """
+    def __init__(self, mask: int):
+        self.pressed = frozenset(key for bit, key in enumerate(KEY_BITS) if mask & (1 << bit))
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+_KEY_STATES = [_HeldKeys(mask) for mask in range(16)]
+_EVENTS = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in sorted(EVENT_CODES, key=EVENT_CODES.get)]
+_EVENTS.append(pygame.event.Event(pygame.QUIT))
+
+
+def replay(path: str, render: bool = False, dirty_rects: bool = False, use_entity_store: bool = False,
+           profiler=None) -> dict:
+    """
+    Plays a recording back through PlayingState as fast as possible and checks that it matches.
+
+    Args:
+        path:             Recording written by an InputRecorder.
+        render:           Also draw every tick onto an off-screen surface (never flipped).
+        dirty_rects:      Render with the DirtyRectRenderer instead of redrawing the full screen.
+        use_entity_store: Move enemies, drones and projectiles in batch (see entity_store.py).
+        profiler:         An enabled profiler.Profiler to record every tick as one frame.
+
+    Returns:
+        A dict with the tick, frame and game counts, elapsed seconds, ticks per second, the number
+        of checksums verified, the final score and "divergence": None if the replay matched the
+        recording, otherwise a description of the first mismatch (the replay stops there).
+
+    Raises:
+        ReplayError: If the file is not a recording for this simulation rate and format version.
+    """
+    from states import PlayingState # Imported late so the dummy drivers are set up first
+
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ReplayError(f"{path} is not an input recording")
+    magic, version, hz = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ReplayError(f"{path} is not an input recording of format version {VERSION}")
+    if hz != SIMULATION_HZ:
+        raise ReplayError(f"{path} was recorded at {hz} ticks per second, the game runs at {SIMULATION_HZ}")
+
+    screen = pygame.Surface((800, 600))
+    state = None
+    ticks = frames = games = checks = 0
+    divergence = None
+    pos, end = HEADER.size, len(data)
+
+    def expected_result():
+        nonlocal pos
+        if pos < end and data[pos] == OP_RESULT:
+            pos += 2
+            return RESULTS[data[pos - 1]]
+        return None
+
+    start = time.perf_counter()
+    while pos < end and divergence is None:
+        op = data[pos]
+        pos += 1
+        kind = op & 0xF0
+        if kind == OP_TICK:
+            if profiler is not None:
+                profiler.end_frame(state)
+                profiler.begin_frame()
+            state.update(SIMULATION_DT, _KEY_STATES[op])
+            if render:
+                state.draw()
+            ticks += 1
+            actual = state.next_state if state.next_state != STATE_PLAYING else None
+            expected = expected_result()
+            if actual != expected:
+                divergence = f"tick {ticks}: transition {actual!r}, recorded {expected!r}"
+            state.next_state = STATE_PLAYING # Transitions are the other states' business
+        elif kind == OP_FRAME:
+            count = op & 0x0F
+            if count == 15:
+                count, = struct.unpack_from("<H", data, pos)
+                pos += 2
+            events = [_EVENTS[code] for code in data[pos:pos + count]]
+            pos += count
+            frames += 1
+            actual = state.process_events(events)
+            expected = expected_result()
+            if actual != expected:
+                divergence = f"frame {frames}: process_events returned {actual!r}, recorded {expected!r}"
+        elif op == OP_CHECK:
+            recorded, = struct.unpack_from("<I", data, pos)
+            pos += 4
+            actual = state_checksum(state)
+            checks += 1
+            if actual != recorded:
+                divergence = f"tick {ticks}: state checksum {actual:08x}, recorded {recorded:08x}"
+        elif op == OP_TUNABLES:
+            _apply_tunables(state, TUNABLES_FORMAT.unpack_from(data, pos))
+            pos += TUNABLES_FORMAT.size
+        elif op == OP_NEW_GAME:
+            seed, = struct.unpack_from("<Q", data, pos)
+            pos += 8
+            state = PlayingState(screen, headless=True, dirty_rects=dirty_rects,
+                                 use_entity_store=use_entity_store, seed=seed)
+            games += 1
+        else:
+            raise ReplayError(f"{path}: unknown record 0x{op:02x} at byte {pos - 1}")
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "frames": frames,
+        "games": games,
+        "checks": checks,
+        "seconds": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+        "score": state.score if state is not None else 0,
+        "divergence": divergence,
+    }
+
+
+def main():
+    from headless_runner import init_headless
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", help="file written by an InputRecorder")
+    parser.add_argument("--repeat", type=int, default=1, help="play the recording this many times")
+    parser.add_argument("--render", action="store_true", help="also draw each tick to an off-screen surface")
+    parser.add_argument("--dirty-rects", action="store_true", help="render with dirty rectangles (implies --render)")
+    parser.add_argument("--entity-store", action="store_true", help="move enemies and projectiles in batch with NumPy")
+    parser.add_argument("--profile", nargs="?", const="profile", metavar="BASENAME",
+                        help="time every phase and write BASENAME.csv/.json (default: profile)")
+    parser.add_argument("--verbose", action="store_true", help="show game log output")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    init_headless()
+
+    profiler = None
+    if args.profile:
+        from profiler import Profiler
+        profiler = Profiler(history=1_000_000)
+        profiler.enable()
+    diverged = False
+    for run in range(args.repeat):
+        try:
+            result = replay(args.recording, args.render or args.dirty_rects, args.dirty_rects, args.entity_store, profiler)
+        except ReplayError as e:
+            parser.exit(2, f"error: {e}\n")
+        print(f"run {run + 1}: {result['ticks']} ticks, {result['frames']} frames, {result['games']} games in "
+              f"{result['seconds']:.3f}s: {result['ticks_per_second']:.1f} ticks/s, final score {result['score']}, "
+              f"{result['checks']} checksums " + ("matched" if result["divergence"] is None else f"- DIVERGED at {result['divergence']}"))
+        diverged = diverged or result["divergence"] is not None
+    if profiler is not None:
+        profiler.end_frame()
+        print(f"{'section':<36} {'mean':>7} {'p50':>7} {'p95':>7} {'p99':>7}  (ms per tick)")
+        for label, stats in profiler.summary()["sections"].items():
+            print(f"{label:<36} {stats['mean']:>7.3f} {stats['p50']:>7.3f} {stats['p95']:>7.3f} {stats['p99']:>7.3f}")
+        print("wrote " + " and ".join(profiler.save(args.profile)))
+    pygame.quit()
+    if diverged:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,247 @@
 import pygame
 import os
 import logging
+from collections import OrderedDict
+
+import asset_pack
+import atlas
+from data_loader import load_json
 
 # Set up logging for resource loading (useful for debugging)
 logger = logging.getLogger(__name__)
 
-# Resource cache to store loaded images and sounds for efficiency
-_resource_cache = {}
+DEFAULT_CACHE_BUDGET_BYTES = 64 * 1024 * 1024 # Memory budget of the resource cache (decoded pixels and samples)
+IMAGE_MODES = ("alpha", "opaque", "none") # convert_alpha(), convert(), or keep the loaded pixel format
+
+_MISSING = object() # Cache lookup sentinel (a cached sound may legitimately be None)
+
+
+def resource_size(resource) -> int:
+    """
+    Estimates the memory held by a cached resource in bytes.
+
+    Surfaces are measured from their dimensions and pixel format, sounds from their length
+    and the mixer format, and lists (sprite sheet frames) as the sum of their items.
+
+    Args:
+        resource: A pygame.Surface, pygame.mixer.Sound, list of those, or None.
+
+    Returns:
+        The estimated size in bytes (0 for unknown types and None).
+    """
+    if isinstance(resource, pygame.Surface):
+        return resource.get_pitch() * resource.get_height() # Pitch includes row padding
+    if isinstance(resource, (list, tuple)):
+        return sum(resource_size(item) for item in resource)
+    if isinstance(resource, pygame.mixer.Sound):
+        mixer_format = pygame.mixer.get_init() # (frequency, format, channels), None if the mixer is down
+        if mixer_format:
+            frequency, sample_format, channels = mixer_format
+            return int(resource.get_length() * frequency * channels * (abs(sample_format) // 8))
+    return 0
+
+
+class ResourceCache:
+    """
+    LRU cache for loaded resources with a memory budget.
+
+    Entries are keyed by a tuple whose first two items are the resource kind ("image", "sheet",
+    "sound") and the full asset path, followed by everything that changes the loaded result
+    (size, colorkey, conversion mode, ...). When the estimated size of all entries exceeds the
+    budget, the least recently used entries are evicted. Entries of pinned asset paths are never
+    evicted. Evicting an entry only drops the cache's reference; sprites that still hold the
+    resource keep using it, it is just loaded again on the next miss.
+
+    Attributes:
+        budget_bytes: Maximum estimated size of all cached resources in bytes.
+        hits:         Number of lookups answered from the cache.
+        misses:       Number of lookups that had to load the resource.
+        evictions:    Number of entries evicted to stay within the budget.
+        bytes:        Current estimated size of all cached resources in bytes.
+    """
+    def __init__(self, budget_bytes: int = DEFAULT_CACHE_BUDGET_BYTES):
+        """
+        Initializes an empty ResourceCache.
+
+        Args:
+            budget_bytes: Maximum estimated size of all cached resources in bytes.
+        """
+        self.budget_bytes = budget_bytes
+        self._entries = OrderedDict() # key -> (resource, size in bytes), least recently used first
+        self._pinned_paths = {} # full asset path -> pin count
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple, default=None):
+        """
+        Returns a cached resource and marks it as most recently used, counting a hit or a miss.
+
+        Args:
+            key:     The cache key.
+            default: Value returned (and counted as a miss) if the key is not cached.
+
+        Returns:
+            The cached resource, or default.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: tuple, resource):
+        """
+        Stores a resource, then evicts least recently used entries until the cache fits its budget.
+
+        Args:
+            key:      The cache key. key[1] must be the full asset path.
+            resource: The loaded resource.
+        """
+        self.discard(key)
+        size = resource_size(resource)
+        self._entries[key] = (resource, size)
+        self.bytes += size
+        self._evict()
+
+    def discard(self, key: tuple):
+        """
+        Removes one entry if it is cached, pinned or not.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def set_budget(self, budget_bytes: int):
+        """
+        Changes the memory budget, evicting entries right away if the cache is now over it.
+        """
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def pin(self, full_path: str):
+        """
+        Protects every cached variant of an asset path (current and future) from eviction.
+        Pins are counted; each pin() needs a matching unpin().
+        """
+        self._pinned_paths[full_path] = self._pinned_paths.get(full_path, 0) + 1
+
+    def unpin(self, full_path: str):
+        """
+        Releases one pin of an asset path. Its entries become evictable when no pins are left.
+        """
+        count = self._pinned_paths.get(full_path, 0)
+        if count <= 1:
+            self._pinned_paths.pop(full_path, None)
+            self._evict() # Entries kept only because of the pin may now exceed the budget
+        else:
+            self._pinned_paths[full_path] = count - 1
+
+    def is_pinned(self, key: tuple) -> bool:
+        """
+        Returns True if the entry with this key belongs to a pinned asset path.
+        """
+        return key[1] in self._pinned_paths
+
+    def clear(self, kind: str | None = None, path: str | None = None, keep_pinned: bool = False) -> int:
+        """
+        Removes entries matching all given filters; without filters the whole cache is cleared.
+
+        Args:
+            kind:        Only remove entries of this kind ("image", "sheet" or "sound").
+            path:        Only remove entries loaded from this full asset path.
+            keep_pinned: Leave entries of pinned asset paths in place.
+
+        Returns:
+            The number of entries removed.
+        """
+        removed = 0
+        for key in list(self._entries):
+            if kind is not None and key[0] != kind:
+                continue
+            if path is not None and key[1] != path:
+                continue
+            if keep_pinned and self.is_pinned(key):
+                continue
+            self.discard(key)
+            removed += 1
+        return removed
+
+    def reset_stats(self):
+        """
+        Resets the hit, miss and eviction counters.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            A dict with "hits", "misses", "evictions", "hit_rate", "entries", "bytes",
+            "pinned_bytes" and "budget_bytes".
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "pinned_bytes": sum(size for key, (_, size) in self._entries.items() if self.is_pinned(key)),
+            "budget_bytes": self.budget_bytes,
+        }
+
+    def _evict(self):
+        """
+        Evicts least recently used unpinned entries until the cache fits its budget.
+        """
+        if self.bytes <= self.budget_bytes:
+            return
+        for key in list(self._entries): # Oldest first
+            if self.bytes <= self.budget_bytes:
+                break
+            if self.is_pinned(key):
+                continue
+            self.discard(key)
+            self.evictions += 1
+            logger.debug(f"Evicted {key[0]} {key[1]} from resource cache")
+
+
+# Resource cache to store loaded images, sprite sheets and sounds for efficiency
+_resource_cache = ResourceCache()
+
+# Shared sprite images, built once by the factory registered under each name
+_sprite_image_factories = {}
+_sprite_images = {}
+
+# Texture atlas: cache key -> subsurface (image) or list of subsurfaces (sheet frames), see build_texture_atlas()
+ATLAS_MANIFEST = "atlas.json"
+_atlas_regions = {}
+_atlas_pages = []
+_atlas_stats = {}
+
+# Font pool shared by all states, keyed by ("file" | "sys", name, size)
+_font_cache = {}
+ASSET_MANIFEST = "asset_manifest.json" # Written by generate_assets.py (see asset_build)
+_asset_manifest = None # Generated asset entries by asset path, loaded on first use
+
+# LRU cache of rendered text surfaces, keyed by (font, text, antialias, color, background)
+TEXT_CACHE_SIZE = 512 # Maximum number of rendered strings kept
+_text_cache = OrderedDict()
+_text_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
 
 def get_asset_path(filename: str) -> str:
     """
@@ -29,11 +264,108 @@ def get_asset_path(filename: str) -> str:
         return normalized_path # Assume path is already correctly specified
     return os.path.join("assets", normalized_path) # Prepend "assets" directory
 
-def load_image_with_scale(path: str, expected_size: tuple[int, int], colorkey=None) -> pygame.Surface:
+def _colorkey_key(colorkey):
+    """
+    Turns a colorkey argument into a hashable cache key component.
+    """
+    return tuple(colorkey) if colorkey is not None else None # pygame.Color is not hashable
+
+def _convert(image: pygame.Surface, mode: str) -> pygame.Surface:
+    """
+    Converts a freshly loaded image to the display format according to an IMAGE_MODES mode.
+    """
+    if mode == "alpha":
+        return image.convert_alpha() # Per-pixel alpha in display format
+    if mode == "opaque":
+        return image.convert() # Display format without alpha, fastest to blit
+    return image
+
+def image_cache_key(path: str, expected_size: tuple[int, int], colorkey=None, mode: str = "alpha") -> tuple:
+    """
+    Returns the resource cache key of an image as load_image_with_scale() would cache it.
+    """
+    return ("image", get_asset_path(path), tuple(expected_size), _colorkey_key(colorkey), mode)
+
+def sheet_cache_key(path: str, frame_width: int, frame_height: int, num_frames: int, colorkey=None) -> tuple:
+    """
+    Returns the resource cache key of a sprite sheet as load_sprite_sheet() would cache it.
+    """
+    return ("sheet", get_asset_path(path), frame_width, frame_height, num_frames, _colorkey_key(colorkey)) # Same sheet can be cut differently
+
+def sound_cache_key(path: str) -> tuple:
+    """
+    Returns the resource cache key of a sound as load_sound() would cache it.
+    """
+    return ("sound", get_asset_path(path))
+
+def is_cached(key: tuple) -> bool:
+    """
+    Returns True if a resource with this cache key is cached (does not count as a hit or miss).
+    """
+    return key in _resource_cache or key in _atlas_regions
+
+def decode_image(path: str) -> pygame.Surface:
+    """
+    Reads and decodes an image file without touching the display or the cache.
+
+    This is the slow part of loading an image and is safe to call from a worker thread;
+    pass the result to finalize_image() on the main thread. Reads from the mounted asset
+    archive if it contains the file, otherwise from the loose file.
+
+    Args:
+        path: Path to the image file, relative to the 'assets' directory.
+
+    Returns:
+        The decoded pygame.Surface in the file's own pixel format.
+
+    Raises:
+        pygame.error: If the file cannot be read or decoded.
+        FileNotFoundError: If the file does not exist.
+    """
+    full_path = get_asset_path(path)
+    packed = asset_pack.mounted_file(full_path)
+    if packed is not None:
+        return pygame.image.load(asset_pack.MemoryViewReader(packed), os.path.basename(full_path)) # Name hints the format
+    return pygame.image.load(full_path)
+
+def finalize_image(path: str, decoded: pygame.Surface | None, expected_size: tuple[int, int], colorkey=None, mode: str = "alpha") -> pygame.Surface:
+    """
+    Converts, scales and caches a decoded image. Must run on the main thread (convert needs the display).
+
+    Args:
+        path:          Path to the image file, relative to the 'assets' directory.
+        decoded:       Result of decode_image(), or None if decoding failed.
+        expected_size: Tuple (width, height) defining the size to scale the image to.
+        colorkey:      Optional color to set as transparent.
+        mode:          Pixel format conversion, see load_image_with_scale().
+
+    Returns:
+        The processed pygame.Surface, or a transparent placeholder of the expected size if decoded is None.
+    """
+    if mode not in IMAGE_MODES:
+        raise ValueError(f"Unknown image mode {mode!r}, expected one of {IMAGE_MODES}")
+    if decoded is None:
+        image = pygame.Surface(expected_size, pygame.SRCALPHA) # Create a transparent surface as a placeholder
+        image.fill((0, 0, 0, 0)) # Fill with transparent black
+    else:
+        image = _convert(decoded, mode) # Convert to the requested format
+        current_size = image.get_size()
+        if current_size != expected_size:
+            logger.debug(f"Scaling image {path} from {current_size} to {expected_size}")
+            image = pygame.transform.scale(image, expected_size) # Scale image to expected size
+
+        if colorkey is not None:
+            image.set_colorkey(colorkey) # Set specific color to be transparent
+
+    _resource_cache.put(image_cache_key(path, expected_size, colorkey, mode), image) # Store processed image in cache
+    return image
+
+def load_image_with_scale(path: str, expected_size: tuple[int, int], colorkey=None, mode: str = "alpha") -> pygame.Surface:
     """
     Loads an image from the given path, scales it to the expected size, and applies an optional colorkey.
 
     Utilizes a resource cache to avoid reloading images from disk repeatedly.
+    Each combination of path, size, colorkey and mode is cached separately.
     If the image is not found in the cache, it is loaded, scaled, and then stored in the cache.
 
     Args:
@@ -41,34 +373,66 @@ def load_image_with_scale(path: str, expected_size: tuple[int, int], colorkey=No
         expected_size:  Tuple (width, height) defining the size to scale the image to.
         colorkey:  Optional color to set as transparent (e.g., pygame.Color('white')).
                    If None, no transparency is set.
+        mode:      Pixel format conversion: "alpha" (convert_alpha), "opaque" (convert)
+                   or "none" (keep the format the file was decoded to).
 
     Returns:
         A pygame.Surface object representing the loaded and processed image.
         Returns an empty, transparent Surface of the expected size if loading fails.
     """
-    global _resource_cache
-    full_path = get_asset_path(path)
+    if mode not in IMAGE_MODES:
+        raise ValueError(f"Unknown image mode {mode!r}, expected one of {IMAGE_MODES}")
 
-    if full_path in _resource_cache:
-        return _resource_cache[full_path] # Return cached image if available
+    key = image_cache_key(path, expected_size, colorkey, mode)
+    image = _atlas_regions.get(key)
+    if image is not None:
+        return image # Packed into the texture atlas
+    image = _resource_cache.get(key)
+    if image is not None:
+        return image # Return cached image if available
 
     try:
-        image = pygame.image.load(full_path).convert_alpha() # Load and convert with alpha transparency
-        current_size = image.get_size()
-        if current_size != expected_size:
-            logger.debug(f"Scaling image {path} from {current_size} to {expected_size}")
-            image = pygame.transform.scale(image, expected_size) # Scale image to expected size
+        decoded = decode_image(path) # Load from disk
+    except (pygame.error, FileNotFoundError) as e: # Catch Pygame image loading errors specifically
+        logger.error(f"Error loading image {path}: {e}")
+        if generated_asset(path) is not None:
+            logger.error(f"{path} is a generated asset; run 'python generate_assets.py' to rebuild it")
+        decoded = None
+    return finalize_image(path, decoded, expected_size, colorkey, mode)
 
-        if colorkey is not None:
-            image.set_colorkey(colorkey) # Set specific color to be transparent
+def finalize_sprite_sheet(path: str, decoded: pygame.Surface, frame_width: int, frame_height: int, num_frames: int, colorkey=None) -> list[pygame.Surface]:
+    """
+    Converts a decoded sprite sheet, cuts it into frames and caches them. Must run on the main thread.
 
-    except pygame.error as e: # Catch Pygame image loading errors specifically
-        logger.error(f"Error loading image {path}: {e}")
-        image = pygame.Surface(expected_size, pygame.SRCALPHA) # Create a transparent surface as a placeholder
-        image.fill((0, 0, 0, 0)) # Fill with transparent black
+    Args:
+        path:        Path to the sprite sheet image file.
+        decoded:     Result of decode_image() for the sheet.
+        frame_width:   Width of each frame in pixels.
+        frame_height:  Height of each frame in pixels.
+        num_frames:    Number of frames in the sprite sheet.
+        colorkey:    Optional color to set as transparent for the entire sheet.
 
-    _resource_cache[full_path] = image # Store loaded image in cache
-    return image
+    Returns:
+        A list of pygame.Surface objects, one per frame.
+    """
+    sprite_sheet = decoded.convert_alpha() # Convert sprite sheet
+    expected_sheet_size = (frame_width * num_frames, frame_height)
+    current_sheet_size = sprite_sheet.get_size()
+
+    if current_sheet_size != expected_sheet_size:
+        logger.debug(f"Scaling sprite sheet {path} from {current_sheet_size} to {expected_sheet_size}")
+        sprite_sheet = pygame.transform.scale(sprite_sheet, expected_sheet_size) # Scale if size doesn't match
+
+    if colorkey is not None:
+        sprite_sheet.set_colorkey(colorkey) # Apply colorkey transparency to the whole sheet
+
+    frames = []
+    for i in range(num_frames):
+        frame_rect = (i * frame_width, 0, frame_width, frame_height) # Calculate frame rectangle
+        frame = sprite_sheet.subsurface(frame_rect).copy() # Extract frame as a subsurface and create independent copy
+        frames.append(frame)
+    _resource_cache.put(sheet_cache_key(path, frame_width, frame_height, num_frames, colorkey), frames) # Store extracted frames in cache
+    return frames
 
 def load_sprite_sheet(path: str, frame_width: int, frame_height: int, num_frames: int, colorkey=None) -> list[pygame.Surface]:
     """
@@ -76,6 +440,7 @@ def load_sprite_sheet(path: str, frame_width: int, frame_height: int, num_frames
 
     Assumes the sprite sheet is a horizontal strip of frames of equal size.
     Returns a list of pygame.Surface objects, each representing a frame.
+    Frame lists are cached and shared between callers, so the frames must not be drawn on.
 
     Args:
         path:        Path to the sprite sheet image file.
@@ -88,30 +453,48 @@ def load_sprite_sheet(path: str, frame_width: int, frame_height: int, num_frames
         A list of pygame.Surface objects, where each Surface is a frame from the sprite sheet.
         Returns an empty list if loading fails.
     """
-    full_path = get_asset_path(path)
+    key = sheet_cache_key(path, frame_width, frame_height, num_frames, colorkey)
+    frames = _atlas_regions.get(key)
+    if frames is not None:
+        return frames # Packed into the texture atlas
+    frames = _resource_cache.get(key)
+    if frames is not None:
+        return frames # Return cached frames if available
 
     try:
-        sprite_sheet = pygame.image.load(full_path).convert_alpha() # Load sprite sheet
-        expected_sheet_size = (frame_width * num_frames, frame_height)
-        current_sheet_size = sprite_sheet.get_size()
+        decoded = decode_image(path) # Load sprite sheet
+    except (pygame.error, FileNotFoundError) as e: # Catch Pygame image loading errors
+        logger.error(f"Error loading sprite sheet {path}: {e}")
+        return [] # Return empty list if loading fails
+    return finalize_sprite_sheet(path, decoded, frame_width, frame_height, num_frames, colorkey)
 
-        if current_sheet_size != expected_sheet_size:
-            logger.debug(f"Scaling sprite sheet {path} from {current_sheet_size} to {expected_sheet_size}")
-            sprite_sheet = pygame.transform.scale(sprite_sheet, expected_sheet_size) # Scale if size doesn't match
+def decode_sound(path: str) -> pygame.mixer.Sound:
+    """
+    Reads and decodes a sound file without touching the cache. Safe to call from a worker thread.
+    Reads from the mounted asset archive if it contains the file, otherwise from the loose file.
 
-        if colorkey is not None:
-            sprite_sheet.set_colorkey(colorkey) # Apply colorkey transparency to the whole sheet
+    Args:
+        path: Path to the sound file, relative to the 'assets' directory.
 
-        frames = []
-        for i in range(num_frames):
-            frame_rect = (i * frame_width, 0, frame_width, frame_height) # Calculate frame rectangle
-            frame = sprite_sheet.subsurface(frame_rect).copy() # Extract frame as a subsurface and create independent copy
-            frames.append(frame)
-        return frames
+    Returns:
+        The decoded pygame.mixer.Sound.
 
-    except pygame.error as e: # Catch Pygame image loading errors
-        logger.error(f"Error loading sprite sheet {path}: {e}")
-        return [] # Return empty list if loading fails
+    Raises:
+        pygame.error: If the mixer is not initialized or the file cannot be decoded.
+        FileNotFoundError: If the file does not exist.
+    """
+    full_path = get_asset_path(path)
+    packed = asset_pack.mounted_file(full_path)
+    if packed is not None:
+        return pygame.mixer.Sound(file=asset_pack.MemoryViewReader(packed))
+    return pygame.mixer.Sound(full_path)
+
+def finalize_sound(path: str, sound: pygame.mixer.Sound | None) -> pygame.mixer.Sound | None:
+    """
+    Caches a decoded sound (or None for a failed load) and returns it. Must run on the main thread.
+    """
+    _resource_cache.put(sound_cache_key(path), sound) # Cache the loaded sound (or None in case of failure)
+    return sound
 
 def load_sound(path: str) -> pygame.mixer.Sound | None:
     """
@@ -125,28 +508,302 @@ def load_sound(path: str) -> pygame.mixer.Sound | None:
     Returns:
         A pygame.mixer.Sound object if loading is successful, otherwise None.
     """
-    global _resource_cache
-    full_path = get_asset_path(path)
-
-    if full_path in _resource_cache:
-        return _resource_cache[full_path] # Return cached sound if available
+    sound = _resource_cache.get(sound_cache_key(path), _MISSING)
+    if sound is not _MISSING:
+        return sound # Return cached sound if available
 
     try:
-        sound = pygame.mixer.Sound(full_path) # Load sound file
-    except pygame.error as e: # Catch Pygame sound loading errors
+        sound = decode_sound(path) # Load sound file
+    except (pygame.error, FileNotFoundError) as e: # Catch Pygame sound loading errors
         logger.error(f"Error loading sound {path}: {e}")
         sound = None # Return None if loading fails
+    return finalize_sound(path, sound)
 
-    _resource_cache[full_path] = sound # Cache the loaded sound (or None in case of failure)
-    return sound
-
-def clear_cache():
+def clear_cache(kind: str | None = None, path: str | None = None, keep_pinned: bool = False):
     """
-    Clears the resource cache.
+    Clears the resource cache, or only the entries matching the given filters.
 
-    This forces resources to be reloaded from disk on their next access.
+    This forces the cleared resources to be reloaded from disk on their next access.
     Useful for debugging or resource reloading scenarios.
+
+    Args:
+        kind:        Only clear entries of this kind ("image", "sheet" or "sound").
+        path:        Only clear entries of this asset (relative to 'assets', like the loaders take it).
+        keep_pinned: Leave pinned assets cached.
+    """
+    full_path = get_asset_path(path) if path is not None else None
+    removed = _resource_cache.clear(kind, full_path, keep_pinned)
+    for key in [key for key in _atlas_regions if (kind is None or key[0] == kind) and (full_path is None or key[1] == full_path)]:
+        del _atlas_regions[key] # Reloads as a separate surface; the page itself stays until the atlas is rebuilt
+        removed += 1
+    if kind is None and path is None:
+        _sprite_images.clear() # Sprite images may have been built from cached files
+        _atlas_pages.clear()
+        _atlas_stats.clear()
+    logger.debug(f"Resource cache cleared ({removed} entries, kind={kind}, path={path}).")
+
+def pin_asset(path: str):
+    """
+    Keeps every cached variant of an asset in the cache regardless of the memory budget.
+
+    Use for assets that are needed throughout a scene (backgrounds, the player sheet).
+    Each pin_asset() needs a matching unpin_asset().
+
+    Args:
+        path: Path to the asset, relative to the 'assets' directory.
+    """
+    _resource_cache.pin(get_asset_path(path))
+
+def unpin_asset(path: str):
+    """
+    Releases a pin taken with pin_asset(); the asset becomes evictable again when no pins are left.
+
+    Args:
+        path: Path to the asset, relative to the 'assets' directory.
+    """
+    _resource_cache.unpin(get_asset_path(path))
+
+def set_cache_budget(budget_bytes: int):
+    """
+    Sets the memory budget of the resource cache, evicting least recently used entries if needed.
+
+    Args:
+        budget_bytes: Maximum estimated size of all cached resources in bytes.
+    """
+    _resource_cache.set_budget(budget_bytes)
+
+def cache_stats() -> dict:
+    """
+    Returns the resource cache counters (see ResourceCache.stats()).
+    """
+    return _resource_cache.stats()
+
+def get_font(name: str | None, size: int) -> pygame.font.Font:
+    """
+    Returns a pooled pygame.font.Font, creating it on first use.
+
+    Equivalent to pygame.font.Font(name, size), but every caller asking for the same font
+    shares one object, so states do not load the font file again per instance.
+
+    Args:
+        name: Path to a font file, or None for pygame's default font.
+        size: Font size in points.
+
+    Returns:
+        The shared pygame.font.Font object.
+    """
+    key = ("file", name, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size) # Load the font once
+        _font_cache[key] = font
+        logger.debug(f"Font loaded: {name or 'default'} ({size}pt)")
+    return font
+
+def get_sys_font(name: str, size: int) -> pygame.font.Font:
+    """
+    Returns a pooled system font, creating it on first use.
+
+    Equivalent to pygame.font.SysFont(name, size), which has to search the installed system
+    fonts every time it is called; the pooled object is shared by all callers.
+
+    Args:
+        name: System font name (e.g., "arial").
+        size: Font size in points.
+
+    Returns:
+        The shared pygame.font.Font object.
+    """
+    key = ("sys", name, size)
+    font = _font_cache.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size) # Look up and load the system font once
+        _font_cache[key] = font
+        logger.debug(f"System font loaded: {name} ({size}pt)")
+    return font
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color, background=None) -> pygame.Surface:
+    """
+    Renders text with a font, reusing the surface if the same string was rendered before.
+
+    Takes the same arguments as pygame.font.Font.render(). Rendered surfaces are kept in an
+    LRU cache of TEXT_CACHE_SIZE entries, so strings that do not change between frames are
+    only rasterized once. The returned surface is shared: blit it, but do not draw on it.
+
+    Args:
+        font:       The font to render with (ideally one from get_font()/get_sys_font()).
+        text:       The string to render.
+        antialias:  Whether to render with antialiased edges.
+        color:      Text color.
+        background: Optional background color; None renders on a transparent background.
+
+    Returns:
+        A pygame.Surface with the rendered text.
+    """
+    key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key) # Mark as most recently used
+        _text_cache_stats["hits"] += 1
+        return surface
+
+    _text_cache_stats["misses"] += 1
+    surface = font.render(text, antialias, color, background) # Rasterize the string
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False) # Evict the least recently used string
+        _text_cache_stats["evictions"] += 1
+    return surface
+
+def text_cache_stats() -> dict:
+    """
+    Returns the text cache counters.
+
+    Returns:
+        A dict with "hits", "misses", "evictions", "size" (entries currently cached) and "hit_rate".
+    """
+    lookups = _text_cache_stats["hits"] + _text_cache_stats["misses"]
+    return {
+        **_text_cache_stats,
+        "size": len(_text_cache),
+        "hit_rate": _text_cache_stats["hits"] / lookups if lookups else 0.0,
+    }
+
+def clear_text_cache():
+    """
+    Clears the rendered text cache and resets its counters. Pooled fonts are kept.
+    """
+    _text_cache.clear()
+    for counter in _text_cache_stats:
+        _text_cache_stats[counter] = 0
+    logger.debug("Text cache cleared.")
+
+def register_sprite_image(name: str, factory):
+    """
+    Registers how to build a shared sprite image.
+
+    Sprite classes register a factory for every image they use instead of loading or drawing
+    it per instance; get_sprite_image() then builds it once and hands out the same Surface.
+
+    Args:
+        name:    Registry name of the image (e.g., "projectile").
+        factory: Callable without arguments that returns the pygame.Surface.
+    """
+    _sprite_image_factories[name] = factory
+    _sprite_images.pop(name, None) # Rebuild on next access if the factory changed
+
+def get_sprite_image(name: str) -> pygame.Surface:
+    """
+    Returns a shared sprite image, building it on first access.
+
+    The Surface is shared by every sprite using it: blit it, but do not draw on it.
+
+    Args:
+        name: Registry name passed to register_sprite_image().
+
+    Returns:
+        The shared pygame.Surface.
+
+    Raises:
+        KeyError: If no factory is registered under the name.
+    """
+    image = _sprite_images.get(name)
+    if image is None:
+        image = _sprite_image_factories[name]() # Build once
+        _sprite_images[name] = image
+        logger.debug(f"Sprite image built: {name}")
+    return image
+
+def preload_sprite_images():
+    """
+    Builds every registered sprite image up front, so the first use during play does not stall.
+    """
+    for name in _sprite_image_factories:
+        get_sprite_image(name)
+    logger.debug(f"Preloaded {len(_sprite_images)} sprite images.")
+
+def generated_asset(path: str) -> dict | None:
+    """
+    Looks up an asset in the manifest written by generate_assets.py.
+
+    Args:
+        path: Path to the asset file, relative to the 'assets' directory.
+
+    Returns:
+        The manifest entry ({"path", "size", "hash", "sha256"}), or None if the asset is not
+        generated or no manifest has been built.
+    """
+    global _asset_manifest
+    if _asset_manifest is None:
+        targets = load_json(ASSET_MANIFEST, frozen=True).get("targets", {})
+        _asset_manifest = {os.path.normpath(entry["path"]): entry for entry in targets.values()}
+    return _asset_manifest.get(get_asset_path(path))
+
+def _atlas_source(path: str, size: tuple[int, int]) -> pygame.Surface | None:
+    """
+    Decodes, converts and scales one image for the texture atlas, like finalize_image() but uncached.
+    """
+    try:
+        image = _convert(decode_image(path), "alpha")
+    except (pygame.error, FileNotFoundError) as e:
+        logger.error(f"Error loading image {path} for the texture atlas: {e}")
+        return None
+    if image.get_size() != size:
+        image = pygame.transform.scale(image, size)
+    return image
+
+def build_texture_atlas(manifest: dict | None = None, max_size: int = atlas.DEFAULT_MAX_PAGE_SIZE) -> dict:
+    """
+    Packs small images and sprite sheets into texture atlas pages.
+
+    load_image_with_scale() and load_sprite_sheet() then return subsurfaces of the pages for the
+    packed entries, so their pixels share one Surface and blits read from the same source.
+    Only per-pixel alpha images without a colorkey are packed, at exactly the size they are
+    loaded with; other requests still load separate surfaces. Must run on the main thread.
+
+    Args:
+        manifest: {"images": [{"path", "size"}], "sheets": [{"path", "frame_width", "frame_height", "frames"}]};
+                  loaded from assets/data/atlas.json if None.
+        max_size: Largest page edge in pixels.
+
+    Returns:
+        The packing statistics of atlas.build_atlas().
+    """
+    if manifest is None:
+        manifest = load_json(ATLAS_MANIFEST, frozen=True)
+    sources = {}
+    for entry in manifest.get("images", []):
+        size = tuple(entry["size"])
+        image = _atlas_source(entry["path"], size)
+        if image is not None:
+            sources[image_cache_key(entry["path"], size)] = image
+    sheets = {}
+    for entry in manifest.get("sheets", []):
+        layout = (entry["frame_width"], entry["frame_height"], entry["frames"])
+        image = _atlas_source(entry["path"], (layout[0] * layout[2], layout[1])) # Whole strip in one region
+        if image is not None:
+            key = sheet_cache_key(entry["path"], *layout)
+            sources[key] = image
+            sheets[key] = layout
+
+    pages, subsurfaces, stats = atlas.build_atlas(sources, max_size)
+    for key, region in subsurfaces.items():
+        if region is None:
+            continue # Larger than a page, loads separately
+        if key in sheets:
+            frame_width, frame_height, num_frames = sheets[key]
+            region = [region.subsurface((i * frame_width, 0, frame_width, frame_height)) for i in range(num_frames)]
+        _resource_cache.discard(key) # The atlas copy replaces a separately cached one
+        _atlas_regions[key] = region
+    _atlas_pages.extend(pages)
+    _atlas_stats.clear()
+    _atlas_stats.update(stats)
+    logger.info(f"Texture atlas: {stats['images']} images on {stats['pages']} page(s), "
+                f"{stats['efficiency']:.0%} packed, {stats['saved_bytes'] / 1024:+.0f} KiB vs separate surfaces")
+    return stats
+
+def atlas_stats() -> dict:
+    """
+    Returns the packing statistics of the last build_texture_atlas() call (empty if none).
     """
-    global _resource_cache
-    _resource_cache.clear() # Clear the dictionary to release cached resources
-    logger.debug("Resource cache cleared.")
\ No newline at end of file
+    return dict(_atlas_stats)
\ No newline at end of file
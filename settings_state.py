@@ -1,5 +1,6 @@
 # settings_state.py
 import pygame
+from resources import get_sys_font, render_text
 
 
 class SettingsState:
@@ -19,8 +20,8 @@ class SettingsState:
         }
         self.options = list(self.settings.keys())
         self.selection = 0
-        self.font = pygame.font.SysFont("arial", 32)
-        self.instruction = self.font.render("UP/DOWN: Select, LEFT/RIGHT: Adjust, ESC: Exit", True, (255, 255, 255))
+        self.font = get_sys_font("arial", 32)
+        self.instruction = render_text(self.font, "UP/DOWN: Select, LEFT/RIGHT: Adjust, ESC: Exit", True, (255, 255, 255))
 
     def process_events(self):
         for event in pygame.event.get():
@@ -56,13 +57,13 @@ class SettingsState:
 
     def draw(self):
         self.screen.fill((30, 30, 30))
-        header = self.font.render("Settings", True, (255, 255, 0))
+        header = render_text(self.font, "Settings", True, (255, 255, 0))
         self.screen.blit(header, (50, 50))
         y = 120
         for i, key in enumerate(self.options):
             value = self.settings[key]
             color = (255, 255, 0) if i == self.selection else (255, 255, 255)
-            option_text = self.font.render(f"{key.capitalize()}: {value}", True, color)
+            option_text = render_text(self.font, f"{key.capitalize()}: {value}", True, color)
             self.screen.blit(option_text, (50, y))
             y += 50
         self.screen.blit(self.instruction, (50, 500))
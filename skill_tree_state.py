@@ -5,7 +5,8 @@ Uses a gradient header and modern panel.
 """
 import pygame
 from skill_tree import SkillTree
-from ui_helpers import draw_vertical_gradient
+from ui_helpers import gradient_surface
+from resources import get_sys_font, render_text
 
 
 class SkillTreeState:
@@ -20,8 +21,8 @@ class SkillTreeState:
         self.skill_points = self.player.skill_points
         self.options = list(self.skill_tree.nodes.keys())
         self.selection = 0
-        self.font = pygame.font.SysFont("arial", 32)
-        self.instruction = self.font.render("UP/DOWN: Navigate, ENTER: Upgrade, ESC: Exit", True, (255, 255, 255))
+        self.font = get_sys_font("arial", 32)
+        self.instruction = render_text(self.font, "UP/DOWN: Navigate, ENTER: Upgrade, ESC: Exit", True, (255, 255, 255))
 
     def process_events(self):
         for event in pygame.event.get():
@@ -50,13 +51,11 @@ class SkillTreeState:
 
     def draw(self):
         self.screen.fill((40, 40, 40))
-        header = pygame.Surface((800, 80))
-        draw_vertical_gradient(header, (50, 50, 100), (10, 10, 40))
-        pygame.draw.rect(header, (255, 255, 255), header.get_rect(), 2)
-        header_text = self.font.render("Skill Tree", True, (255, 255, 0))
-        header.blit(header_text, (20, 20))
-        self.screen.blit(header, (0, 0))
-        sp_text = self.font.render(f"Skill Points: {self.skill_points}", True, (255, 215, 0))
+        header_rect = self.screen.blit(gradient_surface((800, 80), (50, 50, 100), (10, 10, 40)), (0, 0)) # Cached header
+        pygame.draw.rect(self.screen, (255, 255, 255), header_rect, 2)
+        header_text = render_text(self.font, "Skill Tree", True, (255, 255, 0))
+        self.screen.blit(header_text, (header_rect.x + 20, header_rect.y + 20))
+        sp_text = render_text(self.font, f"Skill Points: {self.skill_points}", True, (255, 215, 0))
         self.screen.blit(sp_text, (600, 20))
         panel = pygame.Surface((500, 400), pygame.SRCALPHA)
         panel.fill((0, 0, 0, 180))
@@ -66,7 +65,7 @@ class SkillTreeState:
         for i, skill in enumerate(self.options):
             node = self.skill_tree.get_node(skill)
             color = (255, 255, 0) if i == self.selection else (255, 255, 255)
-            option_text = self.font.render(f"{skill.capitalize()}: Level {node['level']} / {node['max_level']}", True,
+            option_text = render_text(self.font, f"{skill.capitalize()}: Level {node['level']} / {node['max_level']}", True,
                                            color)
             self.screen.blit(option_text, (270, y))
             y += 50
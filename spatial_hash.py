@@ -0,0 +1,247 @@
+# spatial_hash.py
+"""
+Uniform-grid spatial hash used as a collision broadphase.
+
+The hash buckets sprites by the grid cells their rects overlap, so a collision query
+only has to test the sprites that share a cell with the query rect instead of every
+sprite in the group. The query helpers mirror pygame.sprite.spritecollide,
+spritecollideany and groupcollide (same hit sets, same ordering, same kill semantics),
+so they can be dropped into existing collision code.
+
+Building the grid costs more than it saves for small groups: below GRID_MIN_SPRITES sprites,
+pygame's pairwise checks are faster, and PairwiseCollisions offers them behind the same interface.
+"""
+import bisect
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CELL_SIZE = 64 # Roughly the size of the larger sprites (enemies are 50px, the boss 80px)
+GRID_MIN_SPRITES = 400 # Pairwise checks win below this many sprites in the queried groups (benchmarks.bench_collisions: ~150 enemies)
+
+
+class SpatialHash:
+    """
+    A uniform grid of cells that indexes sprites from one or more groups by their rects.
+
+    The grid is rebuilt once per frame from the current sprite rects (see rebuild()).
+    Sprites that move after the rebuild must be re-indexed with update(); sprites that
+    are killed after the rebuild are ignored automatically because every candidate is
+    checked for group membership before it is returned.
+
+    Attributes:
+        cell_size: Width and height of a grid cell in pixels.
+    """
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        """
+        Initializes an empty SpatialHash.
+
+        Args:
+            cell_size: Width and height of a grid cell in pixels.
+        """
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+        self._cells = {} # group id -> {(cell x, cell y): list of (order, sprite)}
+        self._entries = {} # sprite -> (group id, order, list of cell keys)
+        self._groups = {} # group id -> group (keeps indexed groups alive while referenced)
+
+    def clear(self):
+        """
+        Removes every sprite from the hash.
+        """
+        self._cells.clear()
+        self._entries.clear()
+        self._groups.clear()
+
+    def rebuild(self, *groups: pygame.sprite.AbstractGroup):
+        """
+        Clears the hash and indexes every sprite of the given groups by its current rect.
+
+        Args:
+            *groups: The sprite groups to index. Queries may only target these groups.
+        """
+        self.clear()
+        for group in groups:
+            group_id = id(group)
+            self._groups[group_id] = group
+            cells = self._cells[group_id] = {}
+            for order, sprite in enumerate(group.sprites()): # Group order is kept so results match pygame's
+                self._insert(cells, group_id, order, sprite)
+
+    def update(self, sprite: pygame.sprite.Sprite):
+        """
+        Re-indexes a sprite after its rect was moved since the last rebuild.
+
+        Args:
+            sprite: A sprite that was indexed by the last rebuild(). Unknown sprites are ignored.
+        """
+        entry = self._entries.get(sprite)
+        if entry is None:
+            return
+        group_id, order, cell_keys = entry
+        cells = self._cells[group_id]
+        for key in cell_keys:
+            bucket = cells[key]
+            bucket[:] = [item for item in bucket if item[1] is not sprite]
+        cell_keys = self._cell_keys(sprite.rect)
+        for key in cell_keys:
+            bucket = cells.setdefault(key, [])
+            index = bisect.bisect([item[0] for item in bucket], order) # Keep buckets sorted by group order
+            bucket.insert(index, (order, sprite))
+        self._entries[sprite] = (group_id, order, cell_keys)
+
+    def _insert(self, cells: dict, group_id: int, order: int, sprite: pygame.sprite.Sprite):
+        """
+        Appends a sprite to every cell its rect overlaps. Sprites must be inserted in group order.
+        """
+        cell_keys = self._cell_keys(sprite.rect)
+        item = (order, sprite)
+        for key in cell_keys:
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [item]
+            else:
+                bucket.append(item)
+        self._entries[sprite] = (group_id, order, cell_keys)
+
+    def _cell_keys(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        """
+        Returns the (cell x, cell y) coordinates of every cell a rect overlaps.
+        """
+        size = self.cell_size
+        x, y, w, h = rect
+        left = x // size
+        top = y // size
+        right = (x + w - 1) // size if w > 0 else left # Rects are half-open on the right/bottom edge
+        bottom = (y + h - 1) // size if h > 0 else top
+        if left == right and top == bottom:
+            return [(left, top)]
+        return [(cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1)]
+
+    def candidates(self, rect: pygame.Rect, group: pygame.sprite.AbstractGroup) -> list[pygame.sprite.Sprite]:
+        """
+        Returns the sprites of a group that share at least one grid cell with a rect.
+
+        Candidates are returned in the group's iteration order (as of the last rebuild) and
+        are not yet tested for overlap. Sprites that left the group since the rebuild are skipped.
+
+        Args:
+            rect:  The query rectangle.
+            group: One of the groups passed to the last rebuild().
+
+        Returns:
+            A list of candidate sprites.
+        """
+        cells = self._cells.get(id(group))
+        if cells is None:
+            raise KeyError(f"Group {group!r} was not indexed by the last rebuild().")
+
+        members = group.spritedict # Membership test without AbstractGroup.has() overhead
+        keys = self._cell_keys(rect)
+        if len(keys) == 1: # Common case: a single bucket is already in group order and free of duplicates
+            bucket = cells.get(keys[0])
+            if not bucket:
+                return []
+            return [sprite for _, sprite in bucket if sprite in members]
+
+        found = {}
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket:
+                for order, sprite in bucket:
+                    found[order] = sprite
+        if not found:
+            return []
+        return [found[order] for order in sorted(found) if found[order] in members]
+
+    def spritecollide(self, sprite: pygame.sprite.Sprite, group: pygame.sprite.AbstractGroup, dokill: bool) -> list[pygame.sprite.Sprite]:
+        """
+        Grid-accelerated equivalent of pygame.sprite.spritecollide (rect collision).
+
+        Args:
+            sprite: The sprite to test.
+            group:  An indexed group to test against.
+            dokill: If True, colliding sprites are killed.
+
+        Returns:
+            A list of the sprites in the group that collide with the sprite.
+        """
+        candidates = self.candidates(sprite.rect, group)
+        if not candidates:
+            return []
+        hits = [candidates[i] for i in sprite.rect.collidelistall([other.rect for other in candidates])]
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+    def spritecollideany(self, sprite: pygame.sprite.Sprite, group: pygame.sprite.AbstractGroup) -> pygame.sprite.Sprite | None:
+        """
+        Grid-accelerated equivalent of pygame.sprite.spritecollideany (rect collision).
+
+        Args:
+            sprite: The sprite to test.
+            group:  An indexed group to test against.
+
+        Returns:
+            The first sprite in the group that collides with the sprite, or None.
+        """
+        sprite_rect = sprite.rect
+        for other in self.candidates(sprite_rect, group):
+            if sprite_rect.colliderect(other.rect):
+                return other
+        return None
+
+    def groupcollide(self, groupa: pygame.sprite.AbstractGroup, groupb: pygame.sprite.AbstractGroup,
+                     dokilla: bool, dokillb: bool) -> dict[pygame.sprite.Sprite, list[pygame.sprite.Sprite]]:
+        """
+        Grid-accelerated equivalent of pygame.sprite.groupcollide (rect collision).
+
+        Only groupb has to be indexed; the sprites of groupa are used as queries.
+
+        Args:
+            groupa:  The group whose sprites are tested.
+            groupb:  An indexed group to test against.
+            dokilla: If True, sprites of groupa that collide are killed.
+            dokillb: If True, sprites of groupb that collide are killed.
+
+        Returns:
+            A dict mapping each colliding sprite of groupa to the list of sprites of groupb it hit.
+        """
+        crashed = {}
+        for sprite in groupa.sprites():
+            collision = self.spritecollide(sprite, groupb, dokillb)
+            if collision:
+                crashed[sprite] = collision
+                if dokilla:
+                    sprite.kill()
+        return crashed
+
+
+class PairwiseCollisions:
+    """
+    The SpatialHash interface backed by pygame's pairwise collision functions, for small groups.
+
+    Nothing is indexed, so rebuild(), update() and clear() do nothing.
+    """
+    def clear(self):
+        pass
+
+    def rebuild(self, *groups: pygame.sprite.AbstractGroup):
+        pass
+
+    def update(self, sprite: pygame.sprite.Sprite):
+        pass
+
+    def spritecollide(self, sprite: pygame.sprite.Sprite, group: pygame.sprite.AbstractGroup, dokill: bool) -> list[pygame.sprite.Sprite]:
+        return pygame.sprite.spritecollide(sprite, group, dokill)
+
+    def spritecollideany(self, sprite: pygame.sprite.Sprite, group: pygame.sprite.AbstractGroup) -> pygame.sprite.Sprite | None:
+        return pygame.sprite.spritecollideany(sprite, group)
+
+    def groupcollide(self, groupa: pygame.sprite.AbstractGroup, groupb: pygame.sprite.AbstractGroup,
+                     dokilla: bool, dokillb: bool) -> dict[pygame.sprite.Sprite, list[pygame.sprite.Sprite]]:
+        return pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb)
@@ -0,0 +1,141 @@
+# sprite_pool.py
+"""
+Object pooling for short-lived sprites.
+
+A SpritePool keeps a free list per sprite class. acquire() hands out a recycled sprite,
+reinitialized through its reset() hook, or constructs a new one, and adds it to the given
+groups. Pooled sprites derive from Poolable and go back to their pool automatically as soon
+as they are in no group any more: kill(), Group.remove(), Group.empty() and
+groupcollide(..., dokill=True) all return them. Nothing is allocated for a reused sprite,
+so long sessions of constant firing and exploding do not churn the garbage collector.
+"""
+import logging
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FREE = 64 # Killed sprites kept for reuse per class; more are left to the garbage collector
+
+
+class Poolable:
+    """
+    Mixin for sprites handed out by a SpritePool. Put it before the pygame.sprite.Sprite base.
+
+    Attributes:
+        pool: The SpritePool the sprite returns to when it leaves its last group, or None.
+    """
+    pool = None
+
+    def reset(self, *args, **kwargs):
+        """
+        Reinitializes a recycled sprite with constructor arguments. Re-runs __init__ by default;
+        override it where a cheaper reset is possible.
+        """
+        self.__init__(*args, **kwargs)
+
+    def kill(self):
+        was_alive = self.alive()
+        super().kill() # Does not go through remove_internal()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
+
+    def remove_internal(self, group):
+        super().remove_internal(group)
+        if self.pool is not None and not self.alive():
+            self.pool.release(self)
+
+
+class _ClassPool:
+    """
+    Free list and counters of one sprite class.
+    """
+    def __init__(self):
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.dropped = 0 # Released while the free list was full
+        self.live = 0 # Acquired and not yet released
+        self.high_water = 0 # Most sprites live at once
+
+
+class SpritePool:
+    """
+    Hands out sprites of any Poolable class, reusing released ones.
+
+    Attributes:
+        max_free: Most released sprites kept per class.
+    """
+    def __init__(self, max_free: int = DEFAULT_MAX_FREE):
+        """
+        Initializes an empty pool.
+
+        Args:
+            max_free: Most released sprites kept per class.
+        """
+        self.max_free = max_free
+        self._pools = {} # sprite class -> _ClassPool
+        self._free_ids = set() # ids of the sprites sitting in a free list
+
+    def _pool(self, sprite_class) -> _ClassPool:
+        pool = self._pools.get(sprite_class)
+        if pool is None:
+            pool = self._pools[sprite_class] = _ClassPool()
+        return pool
+
+    def acquire(self, sprite_class, *args, groups=(), **kwargs):
+        """
+        Returns a sprite initialized with constructor arguments, added to the given groups.
+
+        Args:
+            sprite_class: A Poolable sprite class.
+            *args:        Constructor arguments.
+            groups:       Groups to add the sprite to.
+            **kwargs:     Constructor keyword arguments.
+        """
+        pool = self._pool(sprite_class)
+        sprite = None
+        while pool.free:
+            candidate = pool.free.pop()
+            self._free_ids.discard(id(candidate))
+            if not candidate.alive(): # Skip sprites put back into a group behind the pool's back
+                sprite = candidate
+                break
+        if sprite is not None:
+            sprite.reset(*args, **kwargs)
+            pool.reused += 1
+        else:
+            sprite = sprite_class(*args, **kwargs)
+            sprite.pool = self
+            pool.created += 1
+        pool.live += 1
+        pool.high_water = max(pool.high_water, pool.live)
+        if groups:
+            sprite.add(*groups)
+        return sprite
+
+    def release(self, sprite):
+        """
+        Takes back a sprite that left its last group. Called by Poolable; releasing twice does nothing.
+        """
+        if id(sprite) in self._free_ids:
+            return
+        pool = self._pool(type(sprite))
+        pool.released += 1
+        pool.live -= 1
+        if len(pool.free) < self.max_free:
+            pool.free.append(sprite)
+            self._free_ids.add(id(sprite))
+        else:
+            pool.dropped += 1
+
+    def stats(self) -> dict:
+        """
+        Returns a dict mapping sprite class names to their counters: "created", "reused", "released",
+        "dropped", "live", "high_water" and "free".
+        """
+        return {sprite_class.__name__: {"created": pool.created, "reused": pool.reused, "released": pool.released,
+                                        "dropped": pool.dropped, "live": pool.live, "high_water": pool.high_water,
+                                        "free": len(pool.free)}
+                for sprite_class, pool in self._pools.items()}
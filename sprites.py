@@ -1,12 +1,98 @@
 # sprites.py
 import pygame, math
-from resources import load_image_with_scale, load_sprite_sheet, get_asset_path
+from resources import load_image_with_scale, load_sprite_sheet, register_sprite_image, get_sprite_image
 import config
+from entity_store import StoredAttribute, BOUNCE, BOB, VERTICAL
+from sprite_pool import Poolable
+
+INTERPOLATION_SNAP_DISTANCE = 100 # Moves larger than this in one tick are teleports and are not interpolated
+
+# ------------------------------
+# MovingSprite Base Class
+# ------------------------------
+class MovingSprite(pygame.sprite.Sprite):
+    """
+    Base class for sprites that move by elapsed simulation time instead of per frame.
+
+    Keeps a sub-pixel position next to the integer rect so fractional per-tick movement is not
+    lost, and remembers the rect position of the previous tick so the renderer can interpolate
+    between ticks (see draw_interpolated()). Code outside the sprite may still move the rect
+    directly; the next begin_tick() picks the new position up as a teleport.
+    """
+    def init_motion(self):
+        """
+        Initializes the sub-pixel position from the current rect. Call once the rect is placed.
+        """
+        self.pos = pygame.math.Vector2(self.rect.topleft)
+        self.prev_pos = self.rect.topleft
+        self._synced_topleft = self.rect.topleft
+
+    def begin_tick(self):
+        """
+        Records the position at the start of a tick and resyncs after external rect changes.
+        """
+        if self.rect.topleft != self._synced_topleft: # Rect was moved directly (e.g. respawn), snap to it
+            self.pos.update(self.rect.topleft)
+            self._synced_topleft = self.rect.topleft
+        self.prev_pos = self._synced_topleft
+
+    def sync_rect(self):
+        """
+        Copies the sub-pixel position to the rect.
+        """
+        self.rect.topleft = self.pos
+        self._synced_topleft = self.rect.topleft
+
+    def move_by(self, dx: float, dy: float):
+        """
+        Moves the sprite by a sub-pixel offset.
+        """
+        self.pos.x += dx
+        self.pos.y += dy
+        self.sync_rect()
+
+
+def interpolated_position(sprite: pygame.sprite.Sprite, alpha: float) -> tuple[int, int]:
+    """
+    Returns where a sprite should be drawn, between its previous and current tick position.
+
+    Sprites without a previous position (anything that is not a MovingSprite) and moves longer
+    than INTERPOLATION_SNAP_DISTANCE (teleports, screen wraps) are drawn at their current rect.
+
+    Args:
+        sprite: The sprite to place.
+        alpha:  Fraction of a tick elapsed since the last simulation update (0.0 to 1.0).
+
+    Returns:
+        The (x, y) top-left pixel position to draw the sprite at.
+    """
+    x, y = sprite.rect.topleft
+    prev_pos = getattr(sprite, "prev_pos", None)
+    if prev_pos is not None and alpha < 1.0:
+        dx = x - prev_pos[0]
+        dy = y - prev_pos[1]
+        if abs(dx) + abs(dy) <= INTERPOLATION_SNAP_DISTANCE:
+            x = round(prev_pos[0] + dx * alpha)
+            y = round(prev_pos[1] + dy * alpha)
+    return x, y
+
+
+def draw_interpolated(group, surface: pygame.Surface, alpha: float):
+    """
+    Draws a sprite group with each MovingSprite placed between its previous and current tick position.
+
+    Args:
+        group:   The sprite group to draw.
+        surface: The surface to draw onto.
+        alpha:   Fraction of a tick elapsed since the last simulation update (0.0 to 1.0).
+    """
+    for sprite in group:
+        surface.blit(sprite.image, interpolated_position(sprite, alpha))
 
 # ------------------------------
 # AnimatedSprite Base Class
 # ------------------------------
-class AnimatedSprite(pygame.sprite.Sprite):
+class AnimatedSprite(MovingSprite):
     def __init__(self, image_path, frame_width, frame_height, num_frames, animation_speed=150):
         super().__init__()
         # load_sprite_sheet returns a list of frames directly.
@@ -15,19 +101,19 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.image = self.frames[self.current_frame]
         self.rect = self.image.get_rect()
         self.animation_speed = animation_speed
-        self.last_update = pygame.time.get_ticks()
+        self.anim_elapsed_ms = 0.0 # Simulation time shown on the current frame, so renders do not depend on the wall clock
 
-    def update_animation(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.animation_speed:
+    def update_animation(self, dt=config.SIMULATION_DT):
+        self.anim_elapsed_ms += dt * 1000
+        if self.anim_elapsed_ms >= self.animation_speed:
+            self.anim_elapsed_ms -= self.animation_speed # Keep the remainder so the rate does not drift with the tick length
             self.current_frame = (self.current_frame + 1) % len(self.frames)
             self.image = self.frames[self.current_frame]
-            self.last_update = now
 
 # ------------------------------
 # ClaySoldier (Player)
 # ------------------------------
-class ClaySoldier(pygame.sprite.Sprite):
+class ClaySoldier(MovingSprite):
     def __init__(self, pos):
         super().__init__()
         # Load idle frames from "player_idle.png" (4 frames, each 50x50)
@@ -37,61 +123,90 @@ class ClaySoldier(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=pos)
         self.speed = 5
         self.animation_speed = 150  # milliseconds per frame
-        self.last_update = pygame.time.get_ticks()
+        self.anim_elapsed_ms = 0.0 # Simulation time shown on the current frame
+        self.init_motion()
 
-    def update(self, keys):
+    def update(self, keys, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        step = self.speed * dt * config.SIMULATION_HZ
         # Movement using arrow keys
+        dx = dy = 0
         if keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed
+            dx -= step
         if keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed
+            dx += step
         if keys[pygame.K_UP]:
-            self.rect.y -= self.speed
+            dy -= step
         if keys[pygame.K_DOWN]:
-            self.rect.y += self.speed
+            dy += step
+        self.move_by(dx, dy)
 
         # Update animation
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.animation_speed:
+        self.anim_elapsed_ms += dt * 1000
+        if self.anim_elapsed_ms >= self.animation_speed:
+            self.anim_elapsed_ms -= self.animation_speed
             self.current_frame = (self.current_frame + 1) % len(self.frames)
             self.image = self.frames[self.current_frame]
-            self.last_update = now
+
+def solid_image(size, color, flags=0) -> pygame.Surface:
+    """
+    Returns a new surface of the given size filled with one color.
+    """
+    image = pygame.Surface(size, flags)
+    image.fill(color)
+    return image
 
 # ------------------------------
 # EnemyUnit (Static Russian Invader)
 # ------------------------------
-class EnemyUnit(pygame.sprite.Sprite):
+register_sprite_image("enemy_unit", lambda: solid_image((50,50), (255,0,0)))
+
+class EnemyUnit(MovingSprite):
+    motion = BOUNCE # Batch-moved in an EntityGroup (see entity_store)
+    speed = StoredAttribute()
+    direction = StoredAttribute()
+
     def __init__(self, pos):
         super().__init__()
-        self.image = pygame.Surface((50,50))
-        self.image.fill((255,0,0))
+        self.image = get_sprite_image("enemy_unit")
         self.rect = self.image.get_rect(center=pos)
         self.base_speed = 3
         self.speed = self.base_speed
         self.direction = 1
+        self.init_motion()
 
-    def update(self):
-        self.rect.x += self.speed * self.direction
+    def update(self, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        self.move_by(self.speed * self.direction * dt * config.SIMULATION_HZ, 0)
         if self.rect.right >= 800 or self.rect.left <= 0:
             self.direction *= -1
 
 # ------------------------------
 # BossEnemy (Boss)
 # ------------------------------
-class BossEnemy(pygame.sprite.Sprite):
+register_sprite_image("boss_enemy", lambda: solid_image((80,80), (128,0,128)))
+
+class BossEnemy(MovingSprite):
+    motion = BOUNCE
+    speed = StoredAttribute()
+    direction = StoredAttribute()
+    health = StoredAttribute()
+    attack_timer_ms = StoredAttribute()
+
     def __init__(self, pos):
         super().__init__()
-        self.image = pygame.Surface((80,80))
-        self.image.fill((128,0,128))
+        self.image = get_sprite_image("boss_enemy")
         self.rect = self.image.get_rect(center=pos)
         self.base_speed = 2
         self.speed = self.base_speed
         self.direction = 1
         self.health = config.config["boss_health"]
-        self.attack_timer = 0
+        self.attack_timer_ms = 0
+        self.init_motion()
 
-    def update(self):
-        self.rect.x += self.speed * self.direction
+    def update(self, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        self.move_by(self.speed * self.direction * dt * config.SIMULATION_HZ, 0)
         if self.rect.right >= 800 or self.rect.left <= 0:
             self.direction *= -1
 
@@ -99,6 +214,10 @@ class BossEnemy(pygame.sprite.Sprite):
 # AnimatedEnemy (Animated Russian Invader)
 # ------------------------------
 class AnimatedEnemy(AnimatedSprite):
+    motion = BOUNCE
+    speed = StoredAttribute()
+    direction = StoredAttribute()
+
     def __init__(self, pos):
         # Use "russian_invader.png" with 4 frames of 50x50, animation speed 200 ms
         super().__init__("russian_invader.png", 50, 50, 4, animation_speed=200)
@@ -106,31 +225,44 @@ class AnimatedEnemy(AnimatedSprite):
         self.base_speed = 2
         self.speed = self.base_speed
         self.direction = 1
+        self.init_motion()
 
-    def update(self):
-        self.rect.x += self.speed * self.direction
+    def update(self, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        self.move_by(self.speed * self.direction * dt * config.SIMULATION_HZ, 0)
         if self.rect.right >= 800 or self.rect.left <= 0:
             self.direction *= -1
-        self.update_animation()
+        self.update_animation(dt)
 
 # ------------------------------
 # Drone (Futuristic Ukrainian Drone)
 # ------------------------------
-class Drone(pygame.sprite.Sprite):
+class Drone(Poolable, MovingSprite):
+    motion = BOB
+    speed = StoredAttribute()
+    amplitude = StoredAttribute()
+    frequency = StoredAttribute()
+    start_y = StoredAttribute()
+    counter = StoredAttribute()
+
     def __init__(self, pos):
         super().__init__()
         self.image = load_image_with_scale("drone.png", (40,40))
         self.rect = self.image.get_rect(center=pos)
         self.speed = 3
         self.amplitude = 20
-        self.frequency = 0.05
+        self.frequency = 0.05 # Radians per tick
         self.start_y = pos[1]
-        self.counter = 0
+        self.counter = 0 # Elapsed ticks, drives the sine bob
+        self.init_motion()
 
-    def update(self):
-        self.rect.x += self.speed
-        self.counter += 1
-        self.rect.y = self.start_y + self.amplitude * math.sin(self.frequency * self.counter)
+    def update(self, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        ticks = dt * config.SIMULATION_HZ
+        self.pos.x += self.speed * ticks
+        self.counter += ticks
+        self.pos.y = self.start_y + self.amplitude * math.sin(self.frequency * self.counter)
+        self.sync_rect()
         if self.rect.left > 800:
             self.rect.right = 0
 
@@ -146,20 +278,33 @@ class PropagandaPoster(pygame.sprite.Sprite):
 # ------------------------------
 # Projectile (Fired by Player)
 # ------------------------------
-class Projectile(pygame.sprite.Sprite):
+register_sprite_image("projectile", lambda: load_image_with_scale("weapon.png", (32,32))) # Cached, packed and atlas-aware like other images
+
+class Projectile(Poolable, MovingSprite):
+    motion = VERTICAL
+    speed = StoredAttribute()
+    direction = StoredAttribute()
+
     def __init__(self, pos, speed=10):
         super().__init__()
-        try:
-            self.image = pygame.image.load(get_asset_path("weapon.png")).convert_alpha()
-        except Exception as e:
-            print("Error loading projectile image:", e)
-            self.image = pygame.Surface((10,20), pygame.SRCALPHA)
-            self.image.fill((0,0,255))
+        self.image = get_sprite_image("projectile")
         self.rect = self.image.get_rect(center=pos)
         self.speed = speed
+        self.direction = -1 # Upwards
+        self.init_motion()
+
+    def reset(self, pos, speed=10):
+        """
+        Reinitializes a recycled projectile as if it was newly constructed.
+        """
+        self.rect.center = pos
+        self.speed = speed
+        self.direction = -1
+        self.init_motion()
 
-    def update(self):
-        self.rect.y -= self.speed
+    def update(self, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        self.move_by(0, self.speed * self.direction * dt * config.SIMULATION_HZ)
         # Debug: print position to check if moving
         # print("Projectile at:", self.rect)
         if self.rect.bottom < 0:
@@ -168,32 +313,66 @@ class Projectile(pygame.sprite.Sprite):
 # ------------------------------
 # BossProjectile (Fired by Boss)
 # ------------------------------
-class BossProjectile(pygame.sprite.Sprite):
+def _boss_projectile_image():
+    image = pygame.Surface((15,15), pygame.SRCALPHA)
+    pygame.draw.circle(image, (255,255,0), (7,7), 7)
+    return image
+
+register_sprite_image("boss_projectile", _boss_projectile_image)
+
+class BossProjectile(Poolable, MovingSprite):
+    motion = VERTICAL
+    speed = StoredAttribute()
+    direction = StoredAttribute()
+
     def __init__(self, pos):
         super().__init__()
-        self.image = pygame.Surface((15,15), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, (255,255,0), (7,7), 7)
+        self.image = get_sprite_image("boss_projectile")
         self.rect = self.image.get_rect(center=pos)
         self.speed = 7
+        self.direction = 1 # Downwards
+        self.init_motion()
+
+    def reset(self, pos):
+        """
+        Reinitializes a recycled projectile as if it was newly constructed.
+        """
+        self.rect.center = pos
+        self.speed = 7
+        self.direction = 1
+        self.init_motion()
 
-    def update(self):
-        self.rect.y += self.speed
+    def update(self, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        self.move_by(0, self.speed * self.direction * dt * config.SIMULATION_HZ)
         if self.rect.top > 600:
             self.kill()
 
 # ------------------------------
 # PowerUp (Extra Life)
 # ------------------------------
-class PowerUp(pygame.sprite.Sprite):
+register_sprite_image("powerup", lambda: solid_image((30,30), (0,255,0)))
+register_sprite_image("shield_powerup", lambda: solid_image((30,30), (0,255,255)))
+
+class PowerUp(Poolable, MovingSprite):
     def __init__(self, pos):
         super().__init__()
-        self.image = pygame.Surface((30,30))
-        self.image.fill((0,255,0))
+        self.image = get_sprite_image("powerup")
         self.rect = self.image.get_rect(center=pos)
         self.speed = 2
+        self.init_motion()
+
+    def reset(self, pos):
+        """
+        Reinitializes a recycled power-up as if it was newly constructed.
+        """
+        self.rect.center = pos
+        self.speed = 2
+        self.init_motion()
 
-    def update(self):
-        self.rect.y += self.speed
+    def update(self, dt=config.SIMULATION_DT):
+        self.begin_tick()
+        self.move_by(0, self.speed * dt * config.SIMULATION_HZ)
         if self.rect.top > 600:
             self.kill()
 
@@ -203,33 +382,59 @@ class PowerUp(pygame.sprite.Sprite):
 class ShieldPowerUp(PowerUp):
     def __init__(self, pos):
         super().__init__(pos)
-        self.image.fill((0,255,255))
+        self.image = get_sprite_image("shield_powerup")
 
 # ------------------------------
 # Explosion (Visual Effect)
 # ------------------------------
-class Explosion(pygame.sprite.Sprite):
+EXPLOSION_SIZE = (50, 50)
+EXPLOSION_FRAMES = 20
+_explosion_frames = None # Shared animation frames, rendered on first use
+
+def explosion_frames() -> list[pygame.Surface]:
+    """
+    Returns the explosion animation frames, rendering them once on first use.
+
+    Every explosion plays the same expanding, fading circle, so the frames are shared by
+    all Explosion sprites and must not be drawn on.
+    """
+    global _explosion_frames
+    if _explosion_frames is None:
+        frames = []
+        center = (EXPLOSION_SIZE[0] // 2, EXPLOSION_SIZE[1] // 2)
+        for frame in range(EXPLOSION_FRAMES):
+            image = pygame.Surface(EXPLOSION_SIZE, pygame.SRCALPHA)
+            radius = int((frame / EXPLOSION_FRAMES) * 40)
+            if radius > 0:
+                alpha = 255 - int((frame / EXPLOSION_FRAMES) * 255)
+                pygame.draw.circle(image, (255,165,0,alpha), center, radius)
+            frames.append(image)
+        _explosion_frames = frames
+    return _explosion_frames
+
+class Explosion(Poolable, pygame.sprite.Sprite):
     def __init__(self, pos):
         super().__init__()
+        self.frames = explosion_frames()
         self.frame = 0
-        self.max_frames = 20
-        self.image = pygame.Surface((50,50), pygame.SRCALPHA)
+        self.max_frames = EXPLOSION_FRAMES
+        self.image = self.frames[0]
         self.rect = self.image.get_rect(center=pos)
-        self.update_image()
-
-    def update_image(self):
-        radius = int((self.frame / self.max_frames) * 40)
-        self.image.fill((0,0,0,0))
-        if radius > 0:
-            alpha = 255 - int((self.frame / self.max_frames) * 255)
-            color = (255,165,0,alpha)
-            pygame.draw.circle(self.image, color, (25,25), radius)
-
-    def update(self):
-        self.frame += 1
-        self.update_image()
+
+    def reset(self, pos):
+        """
+        Restarts a recycled explosion at a new position.
+        """
+        self.frame = 0
+        self.image = self.frames[0]
+        self.rect.center = pos
+
+    def update(self, dt=config.SIMULATION_DT):
+        self.frame += 1 # One animation frame per simulation tick
         if self.frame >= self.max_frames:
             self.kill()
+        else:
+            self.image = self.frames[self.frame]
 
 # ------------------------------
 # ParallaxBackground (Scrolling Background)
@@ -244,16 +449,18 @@ class ParallaxBackground:
         self.speed1 = 0.5
         self.speed2 = 1
 
-    def update(self):
-        self.x1 = (self.x1 - self.speed1) % self.layer1.get_width()
-        self.x2 = (self.x2 - self.speed2) % self.layer2.get_width()
+    def update(self, dt=config.SIMULATION_DT):
+        ticks = dt * config.SIMULATION_HZ
+        self.x1 = (self.x1 - self.speed1 * ticks) % self.layer1.get_width()
+        self.x2 = (self.x2 - self.speed2 * ticks) % self.layer2.get_width()
 
-    def draw(self):
-        sw = self.screen.get_width()
+    def draw(self, surface=None):
+        surface = surface if surface is not None else self.screen
+        sw = surface.get_width()
         for x in range(-self.layer1.get_width(), sw, self.layer1.get_width()):
-            self.screen.blit(self.layer1, (x + self.x1, 0))
+            surface.blit(self.layer1, (x + self.x1, 0))
         for x in range(-self.layer2.get_width(), sw, self.layer2.get_width()):
-            self.screen.blit(self.layer2, (x + self.x2, 0))
+            surface.blit(self.layer2, (x + self.x2, 0))
 
 # ------------------------------
 # Fortress (Strategic Building)
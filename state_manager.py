@@ -5,11 +5,71 @@ Manages game states using a stack-based approach.
 The StateManager allows for pushing new states onto the stack, popping states off,
 and accessing the current active state. It also delegates event processing,
 updates, and drawing to the current state.
+
+State changes can also crossfade: start_transition() keeps a snapshot of the outgoing frame,
+builds the incoming state once it is ready and blends the two snapshots over a few hundred
+milliseconds. The fade is advanced by draw_transition() once per frame of the main loop, so
+events, background loading and presenting carry on while it runs.
 """
 import logging
 
+import pygame
+
 logger = logging.getLogger(__name__)
 
+FADE_DURATION_MS = 500 # Default crossfade length
+
+
+class Transition:
+    """
+    A crossfade in progress between two states.
+
+    Attributes:
+        outgoing:    Copy of the last frame of the outgoing state.
+        incoming:    Snapshot of the first frame of the incoming state, None until it is built.
+        build:       Callable returning the incoming state.
+        ready:       Callable returning True once build() will not block (e.g. its assets are
+                     cached), or None to build right away.
+        replace:     If True the incoming state replaces the whole stack instead of being pushed.
+        duration_ms: Length of the crossfade. Time spent waiting for ready() is not counted.
+        elapsed_ms:  Crossfade time elapsed so far.
+    """
+    def __init__(self, outgoing: pygame.Surface, build, ready=None, replace: bool = False,
+                 duration_ms: float = FADE_DURATION_MS):
+        self.outgoing = outgoing
+        self.incoming = None
+        self.build = build
+        self.ready = ready
+        self.replace = replace
+        self.duration_ms = duration_ms
+        self.elapsed_ms = 0.0
+
+    @property
+    def progress(self) -> float:
+        """
+        Fraction of the crossfade done, from 0.0 (outgoing frame) to 1.0 (incoming frame).
+        """
+        return min(self.elapsed_ms / self.duration_ms, 1.0) if self.duration_ms > 0 else 1.0
+
+    def draw(self, surface: pygame.Surface):
+        """
+        Blends the snapshots onto a surface according to the progress.
+        """
+        surface.blit(_fit(self.outgoing, surface), (0, 0))
+        if self.incoming is not None:
+            self.incoming.set_alpha(round(255 * self.progress)) # Per-surface alpha; no alpha-channel surface needed
+            surface.blit(_fit(self.incoming, surface), (0, 0))
+
+
+def _fit(snapshot: pygame.Surface, surface: pygame.Surface) -> pygame.Surface:
+    """
+    Returns a snapshot scaled to the size of a surface (the display mode may change during a fade).
+    """
+    if snapshot.get_size() == surface.get_size():
+        return snapshot
+    return pygame.transform.scale(snapshot, surface.get_size())
+
+
 class StateManager:
     """
     Manages a stack of game states.
@@ -25,6 +85,7 @@ class StateManager:
             initial_state: The first state to be added to the state stack.
         """
         self.states = [initial_state] # Initialize state stack with the initial state
+        self.transition = None # Transition in progress, if any
         logger.debug(f"State Manager initialized with initial state: {type(initial_state).__name__}")
 
     def push_state(self, state):
@@ -48,12 +109,15 @@ class StateManager:
         Pops the current state off the top of the stack.
 
         If there is more than one state in the stack, the topmost state is removed,
-        and the state below it becomes the current state.
+        and the state below it becomes the current state. If that state defines on_resume(), it is called.
         If only one state is left, this operation does nothing (to ensure there's always a current state).
         """
         if len(self.states) > 1:
             state = self.states.pop()
             logger.debug(f"Popped state: {type(state).__name__}. Current state stack: {[type(s).__name__ for s in self.states]}")
+            on_resume = getattr(self.states[-1], "on_resume", None)
+            if on_resume is not None:
+                on_resume() # Let the resumed state know the screen was drawn over
         else:
             logger.debug("Attempted to pop state with only one state left. Ignoring pop operation to maintain a current state.")
 
@@ -101,4 +165,58 @@ class StateManager:
         if current_state:
             current_state.draw()
         else:
-            logger.warning("No current state to draw.")
\ No newline at end of file
+            logger.warning("No current state to draw.")
+
+    def start_transition(self, outgoing: pygame.Surface, build, ready=None, replace: bool = False,
+                         duration_ms: float = FADE_DURATION_MS):
+        """
+        Starts a crossfade to a new state. Until it ends, the main loop calls draw_transition()
+        instead of updating and drawing the current state.
+
+        Args:
+            outgoing:    Snapshot of the frame being faded out, usually a copy of the screen.
+            build:       Callable returning the incoming state. Called once ready() is True.
+            ready:       Callable telling whether the incoming state can be built without
+                         blocking, or None to build it right away. The outgoing frame stays
+                         on screen while waiting.
+            replace:     If True, clear the state stack before pushing the incoming state.
+            duration_ms: Length of the crossfade in milliseconds.
+        """
+        self.transition = Transition(outgoing, build, ready, replace, duration_ms)
+        logger.debug(f"Transition started from {type(self.current_state()).__name__}")
+
+    def draw_transition(self, surface: pygame.Surface, elapsed_ms: float):
+        """
+        Advances the transition in progress and draws its frame. Call once per frame.
+
+        The incoming state is built and pushed on the first call where it is ready; its first
+        frame is drawn once and kept as a snapshot. When the fade is complete the transition
+        ends and the incoming state takes over (its on_resume(), if defined, is called because
+        the screen was drawn over).
+
+        Args:
+            surface:    The surface to draw on (the screen).
+            elapsed_ms: Time since the previous frame, in milliseconds.
+        """
+        transition = self.transition
+        if transition is None:
+            return
+        if transition.incoming is None:
+            if transition.ready is not None and not transition.ready():
+                transition.draw(surface) # Hold the outgoing frame while assets finish loading
+                return
+            state = transition.build()
+            if transition.replace:
+                self.states.clear()
+            self.push_state(state)
+            state.draw()
+            transition.incoming = state.screen.copy()
+        else:
+            transition.elapsed_ms += elapsed_ms
+        transition.draw(surface)
+        if transition.progress >= 1.0:
+            self.transition = None
+            on_resume = getattr(self.current_state(), "on_resume", None)
+            if on_resume is not None:
+                on_resume() # The state's own frames start over a screen it did not draw
+            logger.debug(f"Transition to {type(self.current_state()).__name__} finished")
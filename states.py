@@ -6,9 +6,14 @@ from config import *  # Imports state constants and the config dictionary
 from sprites import (
     ClaySoldier, EnemyUnit, BossEnemy, AnimatedEnemy, Drone,
     PropagandaPoster, Projectile, BossProjectile, PowerUp, ShieldPowerUp,
-    Explosion, ParallaxBackground, Fortress, Village
+    Explosion, ParallaxBackground, Fortress, Village, draw_interpolated
 )
-from resources import load_image_with_scale, get_asset_path
+from resources import load_image_with_scale, load_sound, get_asset_path, get_font, get_sys_font, render_text, preload_sprite_images
+from spatial_hash import SpatialHash, PairwiseCollisions, GRID_MIN_SPRITES
+from sprite_pool import SpritePool
+from dirty_renderer import DirtyRectRenderer
+import entity_store
+from static_frame import StaticFrame
 
 logger = logging.getLogger(__name__) # Set up logger for this module
 
@@ -27,11 +32,10 @@ class PutinCutsceneState:
             screen: The pygame.Surface to draw on.
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
         self.cutscene_image = load_image_with_scale("putin_caricature.png", (800, 600)) # Load cutscene image
         self.display_duration_ms = 3000  # Duration to display the cutscene in milliseconds
         self.start_time_ms = pygame.time.get_ticks() # Record start time
-        self.font = pygame.font.Font(None, 36) # Font for instructions
+        self.font = get_font(None, 36) # Font for instructions
         logger.debug("PutinCutsceneState initialized.")
 
 
@@ -73,13 +77,10 @@ class PutinCutsceneState:
         self.screen.fill((0, 0, 0)) # Black background
         self.screen.blit(self.cutscene_image, (0, 0)) # Draw cutscene image
 
-        instruction_text_surface = self.font.render("Press SPACE to continue...", True, (255, 255, 255)) # Render instruction text
+        instruction_text_surface = render_text(self.font, "Press SPACE to continue...", True, (255, 255, 255)) # Render instruction text
         instruction_text_rect = instruction_text_surface.get_rect(center=(self.screen.get_width() // 2, 550)) # Position at bottom center
         self.screen.blit(instruction_text_surface, instruction_text_rect) # Draw instruction text
 
-        pygame.display.flip() # Update the display
-        self.clock.tick(60) # Limit frame rate to 60 FPS
-
 
 # ------------------------------
 # DialogueState
@@ -96,8 +97,7 @@ class DialogueState:
             screen: The pygame.Surface to draw on.
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36) # Font for dialogue text
+        self.font = get_font(None, 36) # Font for dialogue text
         self.dialogue_lines = [ # Dialogue script - list of tuples (speaker, text)
             ("Commander Ivan", "Ukrainian defenders, Clayonia is under attack by clumsy Russian invaders!"),
             ("Lieutenant Petro", "Our brave clay soldiers with detailed uniforms and improvised weapons stand strong."),
@@ -158,22 +158,19 @@ class DialogueState:
             if dialogue_text == "SHOW_PUTIN_CUTSCENE": # Skip drawing for cutscene command line
                 dialogue_text = "" # Ensure no text is drawn for this line
 
-            dialogue_surface = self.font.render(f"{speaker_name}: {dialogue_text}", True, (255, 255, 255)) # Render dialogue text
+            dialogue_surface = render_text(self.font, f"{speaker_name}: {dialogue_text}", True, (255, 255, 255)) # Render dialogue text
             dialogue_rect = dialogue_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2)) # Center dialogue
             self.screen.blit(dialogue_surface, dialogue_rect) # Draw dialogue
 
-            instruction_surface = self.font.render("Press SPACE to continue...", True, (255, 255, 255)) # Render instruction
+            instruction_surface = render_text(self.font, "Press SPACE to continue...", True, (255, 255, 255)) # Render instruction
             instruction_rect = instruction_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 50 )) # Position below dialogue
             self.screen.blit(instruction_surface, instruction_rect) # Draw instruction
 
-        pygame.display.flip() # Update display
-        self.clock.tick(60) # Limit FPS
-
 
 # ------------------------------
 # MainMenu
 # ------------------------------
-class MainMenu:
+class MainMenu(StaticFrame):
     """
     State for the main menu screen.
     """
@@ -185,7 +182,7 @@ class MainMenu:
             screen: The pygame.Surface to draw on.
         """
         self.screen = screen
-        self.font = pygame.font.SysFont("arial", 32) # Font for menu text
+        self.font = get_sys_font("arial", 32) # Font for menu text
         self.high_score = load_high_score()  # Show stored high score
         logger.debug("MainMenu initialized.")
 
@@ -216,27 +213,25 @@ class MainMenu:
         """
         pass # No updates needed for main menu
 
-    def draw(self):
+    def render(self, surface: pygame.Surface):
         """
-        Draws the main menu title and instructions on the screen.
+        Draws the main menu title and instructions onto the frame surface.
         """
-        self.screen.fill((0, 0, 0)) # Black background
-        title_surface = self.font.render("Main Menu - Press ENTER to start", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
-        self.screen.blit(title_surface, title_rect)
+        surface.fill((0, 0, 0)) # Black background
+        title_surface = render_text(self.font, "Main Menu - Press ENTER to start", True, (255, 255, 255))
+        title_rect = title_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2))
+        surface.blit(title_surface, title_rect)
 
         hs_text = f"High Score: {self.high_score}"
-        hs_surface = self.font.render(hs_text, True, (255, 255, 0))
-        hs_rect = hs_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 40))
-        self.screen.blit(hs_surface, hs_rect)
-
-        pygame.display.flip() # Update display
+        hs_surface = render_text(self.font, hs_text, True, (255, 255, 0))
+        hs_rect = hs_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() // 2 + 40))
+        surface.blit(hs_surface, hs_rect)
 
 
 # ------------------------------
 # SettingsState
 # ------------------------------
-class SettingsState:
+class SettingsState(StaticFrame):
     """
     State for the settings menu, allowing players to adjust game configurations.
     """
@@ -249,10 +244,9 @@ class SettingsState:
             playing_state: Reference to the PlayingState (for resuming game).
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
         self.playing_state = playing_state # Store reference to PlayingState
-        self.font_large = pygame.font.Font(None, 74) # Large font for title
-        self.font_small = pygame.font.Font(None, 36) # Small font for options and instructions
+        self.font_large = get_font(None, 74) # Large font for title
+        self.font_small = get_font(None, 36) # Small font for options and instructions
         self.setting_options = [ # List of setting options
             "1: Volume Up (+0.1)",
             "2: Volume Down (-0.1)",
@@ -261,10 +255,10 @@ class SettingsState:
             "5: Increase Boss Health (+1)",
             "6: Decrease Boss Health (-1)"
         ]
-        self.title_surface = self.font_large.render("Settings Menu", True, (255, 255, 255)) # Render title
+        self.title_surface = render_text(self.font_large, "Settings Menu", True, (255, 255, 255)) # Render title
         self.title_rect = self.title_surface.get_rect(center=(self.screen.get_width() // 2, 100)) # Title position
         self.rendered_options = self._render_options() # Render setting options
-        self.instructions_surface = self.font_small.render("Press 1-6 to adjust, S to Save & Resume", True, (255, 255, 255)) # Instructions
+        self.instructions_surface = render_text(self.font_small, "Press 1-6 to adjust, S to Save & Resume", True, (255, 255, 255)) # Instructions
         self.instructions_rect = self.instructions_surface.get_rect(center=(self.screen.get_width() // 2, 500)) # Instruction position
         self.next_state = STATE_SETTINGS # Default next state is self (stay in settings)
         logger.debug("SettingsState initialized.")
@@ -280,7 +274,7 @@ class SettingsState:
         rendered_options = []
         y_offset = 180 # Starting Y position for options
         for option_text in self.setting_options:
-            rendered_text = self.font_small.render(option_text, True, (255, 255, 255)) # Render each option
+            rendered_text = render_text(self.font_small, option_text, True, (255, 255, 255)) # Render each option
             text_rect = rendered_text.get_rect(center=(self.screen.get_width() // 2, y_offset)) # Position option
             rendered_options.append((rendered_text, text_rect)) # Add to list
             y_offset += 50 # Increment Y for next option
@@ -303,6 +297,8 @@ class SettingsState:
             if event.type == pygame.QUIT:
                 return STATE_QUIT # Signal quit
             elif event.type == pygame.KEYDOWN:
+                if pygame.K_1 <= event.key <= pygame.K_6:
+                    self.invalidate() # A setting changes; render the menu again on the next draw
                 if event.key == pygame.K_1:
                     config["volume"] = min(1.0, config["volume"] + 0.1) # Increase volume
                     pygame.mixer.music.set_volume(config["volume"]) # Apply volume change
@@ -335,23 +331,21 @@ class SettingsState:
         """
         pass # No updates needed in settings state
 
-    def draw(self):
+    def render(self, surface: pygame.Surface):
         """
-        Draws the settings menu on the screen.
+        Draws the settings menu onto the frame surface.
         """
-        self.screen.fill((20, 20, 20)) # Dark background
-        self.screen.blit(self.title_surface, self.title_rect) # Draw title
+        surface.fill((20, 20, 20)) # Dark background
+        surface.blit(self.title_surface, self.title_rect) # Draw title
         for rendered_option, option_rect in self.rendered_options: # Draw each option
-            self.screen.blit(rendered_option, option_rect)
-        self.screen.blit(self.instructions_surface, self.instructions_rect) # Draw instructions
-        pygame.display.flip() # Update display
-        self.clock.tick(60) # Limit FPS
+            surface.blit(rendered_option, option_rect)
+        surface.blit(self.instructions_surface, self.instructions_rect) # Draw instructions
 
 
 # ------------------------------
 # UpgradeState
 # ------------------------------
-class UpgradeState:
+class UpgradeState(StaticFrame):
     """
     State for the upgrade shop, allowing players to purchase upgrades.
     """
@@ -364,20 +358,19 @@ class UpgradeState:
             playing_state: Reference to the PlayingState to apply upgrades.
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
         self.playing_state = playing_state # Store PlayingState reference
-        self.font_large = pygame.font.Font(None, 74) # Large font for title
-        self.font_small = pygame.font.Font(None, 36) # Small font for options and instructions
+        self.font_large = get_font(None, 74) # Large font for title
+        self.font_small = get_font(None, 36) # Small font for options and instructions
         self.upgrade_options_text = [ # Upgrade options text
             "1: Increase Speed (+1)",
             "2: Increase Projectile Speed (+2)",
             "3: Increase Shield Duration (+100)",
             "4: Extra Life (+1)"
         ]
-        self.title_surface = self.font_large.render("Upgrade Shop", True, (255, 255, 255)) # Render title
+        self.title_surface = render_text(self.font_large, "Upgrade Shop", True, (255, 255, 255)) # Render title
         self.title_rect = self.title_surface.get_rect(center=(self.screen.get_width() // 2, 100)) # Title position
         self.rendered_options = self._render_options() # Render upgrade options
-        self.instructions_surface = self.font_small.render("Press 1-4 to choose upgrade", True, (255, 255, 255)) # Instructions
+        self.instructions_surface = render_text(self.font_small, "Press 1-4 to choose upgrade", True, (255, 255, 255)) # Instructions
         self.instructions_rect = self.instructions_surface.get_rect(center=(self.screen.get_width() // 2, 450)) # Instruction position
         self.next_state = STATE_UPGRADE # Default next state is self (stay in upgrade state)
         logger.debug("UpgradeState initialized.")
@@ -393,7 +386,7 @@ class UpgradeState:
         rendered_options = []
         y_offset = 200 # Starting Y position for options
         for option_text in self.upgrade_options_text:
-            rendered_text = self.font_small.render(option_text, True, (255, 255, 255)) # Render option text
+            rendered_text = render_text(self.font_small, option_text, True, (255, 255, 255)) # Render option text
             text_rect = rendered_text.get_rect(center=(self.screen.get_width() // 2, y_offset)) # Position option
             rendered_options.append((rendered_text, text_rect)) # Add to list
             y_offset += 50 # Increment Y for next option
@@ -443,17 +436,15 @@ class UpgradeState:
         """
         pass # No updates needed in upgrade state
 
-    def draw(self):
+    def render(self, surface: pygame.Surface):
         """
-        Draws the upgrade menu on the screen.
+        Draws the upgrade menu onto the frame surface.
         """
-        self.screen.fill((0, 0, 0)) # Black background
-        self.screen.blit(self.title_surface, self.title_rect) # Draw title
+        surface.fill((0, 0, 0)) # Black background
+        surface.blit(self.title_surface, self.title_rect) # Draw title
         for rendered_option, option_rect in self.rendered_options: # Draw each option
-            self.screen.blit(rendered_option, option_rect)
-        self.screen.blit(self.instructions_surface, self.instructions_rect) # Draw instructions
-        pygame.display.flip() # Update display
-        self.clock.tick(60) # Limit FPS
+            surface.blit(rendered_option, option_rect)
+        surface.blit(self.instructions_surface, self.instructions_rect) # Draw instructions
 
 
 # ------------------------------
@@ -463,38 +454,90 @@ class PlayingState:
     """
     State for the main gameplay of the game.
     """
-    def __init__(self, screen: pygame.Surface):
+    PROFILE_SECTIONS = ( # (label, attribute path) of the sub-steps timed while the profiler is on (see profiler.py)
+        ("update.background", "parallax_background.update"),
+        ("update.soldier", "soldier_group.update"),
+        ("update.enemies", "enemy_group.update"),
+        ("update.projectiles", "projectile_group.update"),
+        ("update.boss_projectiles", "boss_projectile_group.update"),
+        ("update.powerups", "powerup_group.update"),
+        ("update.explosions", "explosion_group.update"),
+        ("update.drones", "drone_group.update"),
+        ("update.spawn_drones", "_spawn_drones_randomly"),
+        ("update.level_up", "_check_level_up"),
+        ("update.boss_actions", "_boss_actions"),
+        ("update.spawn_powerups", "_spawn_powerups_over_time"),
+        ("update.collision_grid", "_prepare_collisions"),
+        ("update.collisions.projectile_enemy", "_handle_projectile_enemy_collisions"),
+        ("update.collisions.boss_projectile", "_handle_boss_projectile_collisions"),
+        ("update.collisions.powerup", "_handle_powerup_collisions"),
+        ("update.collisions.enemy_soldier", "_handle_enemy_soldier_collision"),
+        ("draw.background", "parallax_background.draw"),
+        ("draw.structures", "structure_group.draw"),
+        ("draw.groups", "_draw_sprites"),
+        ("draw.ui", "_draw_ui"),
+        ("draw.overlays", "_draw_overlays"),
+    )
+
+    def __init__(self, screen: pygame.Surface, headless: bool = False, dirty_rects: bool | None = None,
+                 use_entity_store: bool | None = None, seed: int | None = None):
         """
         Initializes the PlayingState, setting up game elements and music.
 
         Args:
-            screen: The pygame.Surface to draw on.
+            screen:      The pygame.Surface to draw on. In headless mode this can be any off-screen Surface.
+            headless:    If True, the audio mixer is never touched (no music, no sound effects), so the
+                         state can be simulated without a display or audio device (see headless_runner.py).
+            dirty_rects: If True, draw with a DirtyRectRenderer that only redraws changed regions (the
+                         parallax background is frozen). Defaults to config["dirty_rect_rendering"].
+            use_entity_store: If True, enemies, drones and projectiles are moved in batch from NumPy arrays
+                         (see entity_store.py). Defaults to config["entity_store"]; ignored without NumPy.
+            seed:        Seed of the state's random number generator, which drives every random spawn. Drawn
+                         from the global random module if None, so random.seed() still makes a game repeatable.
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
+        self.seed = seed if seed is not None else random.getrandbits(64) # Recorded by replay.py to reproduce the game
+        self.rng = random.Random(self.seed) # All gameplay randomness comes from here, never from the global module
+        self.headless = headless
+        preload_sprite_images() # Build shared sprite images now rather than on the first shot/spawn
+        if dirty_rects is None:
+            dirty_rects = config.get("dirty_rect_rendering", False) # Opt-in via config
+        self.dirty_renderer = DirtyRectRenderer() if dirty_rects else None # None = redraw and flip the full screen
+        self.dirty_rects = None # Rects changed by the last draw(), or None if the whole screen changed
+        if use_entity_store is None:
+            use_entity_store = config.get("entity_store", False) # Opt-in via config
+        if use_entity_store and not entity_store.has_numpy():
+            logger.warning("Entity store requested but NumPy is not installed; sprites update one by one.")
+            use_entity_store = False
+        moving_group = entity_store.EntityGroup if use_entity_store else pygame.sprite.Group # Group class for batch-movable sprites
         self.parallax_background = ParallaxBackground(screen) # Initialize parallax background
         self.soldier = ClaySoldier((self.screen.get_width() // 2, self.screen.get_height() // 2)) # Initialize player soldier
         self.soldier_group = pygame.sprite.GroupSingle(self.soldier) # Group for player soldier (using GroupSingle for easier access)
-        self.enemy_group = pygame.sprite.Group() # Group for enemies
+        self.enemy_group = moving_group() # Group for enemies
         self._spawn_initial_enemy() # Spawn the first enemy
-        self.projectile_group = pygame.sprite.Group() # Group for player projectiles
-        self.boss_projectile_group = pygame.sprite.Group() # Group for boss projectiles
+        self.projectile_group = moving_group() # Group for player projectiles
+        self.boss_projectile_group = moving_group() # Group for boss projectiles
+        self.sprite_pool = SpritePool() # Recycles projectiles, explosions, power-ups and drones once they leave their groups
         self.powerup_group = pygame.sprite.Group() # Group for power-ups
         self.explosion_group = pygame.sprite.Group() # Group for explosions (visual effects)
-        self.drone_group = pygame.sprite.Group() # Group for drone enemies
+        self.drone_group = moving_group() # Group for drone enemies
         self.structure_group = self._create_structures() # Create and group level structures
+        self.collision_grid = SpatialHash() # Broadphase for crowded fields, rebuilt every update it is used
+        self.pairwise_collisions = PairwiseCollisions() # Plain pygame checks for small fields
+        self.collisions = self.pairwise_collisions # What the collision handlers query this update, see _prepare_collisions()
         self.score = 0 # Player score
         self.lives = 3 # Player lives
         self.level = 1 # Game level
         self.invulnerable_timer_ms = 0 # Timer for player invulnerability after hit
-        self.font = pygame.font.Font(None, 36) # Font for UI text
+        self.font = get_font(None, 36) # Font for UI text
         self.next_state = STATE_PLAYING # Default next state is self (stay in playing)
         self.is_shield_active = False # Shield power-up active flag
         self.shield_timer_ms = 0 # Timer for shield duration
-        self.shield_duration_ms = 300 * (1000/60) # Shield duration in milliseconds (assuming 60 FPS) - converted from frames to ms
+        self.shield_duration_ms = 300 * (1000/60) # Shield duration in milliseconds (originally 300 frames at 60 FPS)
         self.projectile_speed = 10 # Projectile speed
         self.powerup_spawn_timer_ms = 0 # Timer for power-up spawning
-        self.powerup_spawn_interval_ms = 600 * (1000/60) # Power-up spawn interval in milliseconds (frames to ms)
+        self.powerup_spawn_interval_ms = 600 * (1000/60) # Power-up spawn interval in milliseconds (originally 600 frames at 60 FPS)
+        self.boss_attack_interval_ms = 180 * (1000/60) # Time between boss shots in milliseconds (originally 180 frames at 60 FPS)
         self._load_music_and_sounds() # Load background music and sound effects
         logger.debug("PlayingState initialized.")
 
@@ -520,7 +563,7 @@ class PlayingState:
         """
         enemy_x_pos = 200 # Initial enemy X position
         enemy_y_pos = 150 # Initial enemy Y position
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             initial_enemy = AnimatedEnemy((enemy_x_pos, enemy_y_pos)) # Spawn AnimatedEnemy
         else:
             initial_enemy = EnemyUnit((enemy_x_pos, enemy_y_pos)) # Spawn EnemyUnit
@@ -531,8 +574,13 @@ class PlayingState:
     def _load_music_and_sounds(self):
         """
         Loads background music and sound effects for the PlayingState.
-        Handles potential loading errors gracefully.
+        Handles potential loading errors gracefully. Does nothing in headless mode.
         """
+        self.collision_sound = None # Stays None in headless mode or if loading fails
+        if self.headless:
+            logger.debug("Headless mode: skipping music and sound loading.")
+            return
+
         try:
             pygame.mixer.music.load(get_asset_path("background.mp3")) # Load background music
             pygame.mixer.music.set_volume(config["volume"]) # Set music volume from config
@@ -541,12 +589,9 @@ class PlayingState:
         except Exception as e:
             logger.error(f"Error loading background music: {e}")
 
-        try:
-            self.collision_sound = pygame.mixer.Sound(get_asset_path("collision.wav")) # Load collision sound effect
+        self.collision_sound = load_sound("collision.wav") # Cached (and usually preloaded); None if loading fails
+        if self.collision_sound is not None:
             logger.debug("Collision sound loaded.")
-        except Exception as e:
-            logger.error(f"Error loading collision sound: {e}")
-            self.collision_sound = None # Set to None if loading fails
 
 
     def process_events(self, events: list[pygame.event.Event]) -> str | None:
@@ -581,35 +626,43 @@ class PlayingState:
         Creates and adds a projectile to the projectile group, fired by the player.
         """
         spawn_pos = (self.soldier.rect.centerx, self.soldier.rect.top - 5) # Projectile spawn position (slightly above soldier)
-        projectile = Projectile(spawn_pos, self.projectile_speed) # Create projectile sprite
-        self.projectile_group.add(projectile) # Add projectile to group
+        self.sprite_pool.acquire(Projectile, spawn_pos, self.projectile_speed, groups=(self.projectile_group,)) # Reuse or create projectile sprite
         logger.debug(f"Projectile fired from {spawn_pos}")
 
 
-    def update(self):
-        """
-        Updates game logic in the PlayingState: player, enemies, projectiles, collisions, level progression, power-ups, etc.
+    def update(self, dt: float = SIMULATION_DT, keys=None):
         """
-        keys = pygame.key.get_pressed() # Get currently pressed keys
+        Advances game logic in the PlayingState by one simulation tick: player, enemies, projectiles,
+        collisions, level progression, power-ups, etc.
 
-        self.parallax_background.update() # Update background parallax effect
-        self.soldier_group.update(keys) # Update player soldier based on key presses
-        self.enemy_group.update() # Update enemies
-        self.projectile_group.update() # Update player projectiles
-        self.boss_projectile_group.update() # Update boss projectiles
-        self.powerup_group.update() # Update power-ups
-        self.explosion_group.update() # Update explosions (animation)
-        self.structure_group.update() # Update structures (if any animation)
-        self.drone_group.update() # Update drones
+        Args:
+            dt:   Length of the tick in seconds. The main loop always passes the fixed SIMULATION_DT.
+            keys: Key state indexable by pygame key constants. Defaults to pygame.key.get_pressed();
+                  headless runs pass scripted or random input here instead.
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed() # Get currently pressed keys
+        dt_ms = dt * 1000 # Timers are kept in milliseconds
+
+        self.parallax_background.update(dt) # Update background parallax effect
+        self.soldier_group.update(keys, dt) # Update player soldier based on key presses
+        self.enemy_group.update(dt) # Update enemies
+        self.projectile_group.update(dt) # Update player projectiles
+        self.boss_projectile_group.update(dt) # Update boss projectiles
+        self.powerup_group.update(dt) # Update power-ups
+        self.explosion_group.update(dt) # Update explosions (animation)
+        self.structure_group.update(dt) # Update structures (if any animation)
+        self.drone_group.update(dt) # Update drones
 
         self._spawn_drones_randomly() # Randomly spawn drone enemies
         self._increase_score() # Increment score based on time
         self._check_level_up() # Check if level should increase and handle level up logic
-        self._boss_actions() # Handle boss enemy actions (attacks, spawning)
-        self._spawn_powerups_over_time() # Spawn power-ups at intervals
-        self._update_shield_status() # Update shield active status based on timer
-        self._update_invulnerability_timer() # Update player invulnerability timer
+        self._boss_actions(dt_ms) # Handle boss enemy actions (attacks, spawning)
+        self._spawn_powerups_over_time(dt_ms) # Spawn power-ups at intervals
+        self._update_shield_status(dt_ms) # Update shield active status based on timer
+        self._update_invulnerability_timer(dt_ms) # Update player invulnerability timer
 
+        self._prepare_collisions() # Pick pairwise checks or the grid for this update
         self._handle_projectile_enemy_collisions() # Handle collisions between player projectiles and enemies
         self._handle_boss_projectile_collisions() # Handle collisions between boss projectiles and player
         self._handle_powerup_collisions() # Handle collisions between player and power-ups
@@ -620,16 +673,15 @@ class PlayingState:
         """
         Randomly spawns drone enemies at the top of the screen.
         """
-        if random.random() < 0.01: # 1% chance to spawn a drone per frame
-            drone = Drone((0, random.randint(50, 200))) # Spawn drone at random Y position near top
-            self.drone_group.add(drone) # Add drone to drone group
+        if self.rng.random() < 0.01: # 1% chance to spawn a drone per tick
+            self.sprite_pool.acquire(Drone, (0, self.rng.randint(50, 200)), groups=(self.drone_group,)) # Spawn drone at random Y position near top
 
 
     def _increase_score(self):
         """
         Increments the player's score over time.
         """
-        self.score += 1 # Increment score each frame
+        self.score += 1 # Increment score each tick
 
 
     def _check_level_up(self):
@@ -657,10 +709,10 @@ class PlayingState:
         """
         Spawns a new regular enemy (AnimatedEnemy or EnemyUnit) when the level increases.
         """
-        if random.random() < 0.5:
-            new_enemy = AnimatedEnemy((random.randint(50, 750), random.randint(50, 550))) # Spawn AnimatedEnemy randomly
+        if self.rng.random() < 0.5:
+            new_enemy = AnimatedEnemy((self.rng.randint(50, 750), self.rng.randint(50, 550))) # Spawn AnimatedEnemy randomly
         else:
-            new_enemy = EnemyUnit((random.randint(50, 750), random.randint(50, 550))) # Spawn EnemyUnit randomly
+            new_enemy = EnemyUnit((self.rng.randint(50, 750), self.rng.randint(50, 550))) # Spawn EnemyUnit randomly
         new_enemy.speed = new_enemy.base_speed + (self.level - 1) # Increase new enemy speed based on level
         self.enemy_group.add(new_enemy) # Add new enemy to enemy group
         logger.debug(f"New enemy spawned due to level up. Level: {self.level}")
@@ -672,61 +724,83 @@ class PlayingState:
         """
         boss_exists = any(isinstance(enemy, BossEnemy) for enemy in self.enemy_group) # Check if a BossEnemy already exists
         if not boss_exists:
-            boss = BossEnemy((random.randint(100, 700), random.randint(100, 300))) # Spawn boss at random position
+            boss = BossEnemy((self.rng.randint(100, 700), self.rng.randint(100, 300))) # Spawn boss at random position
             boss.speed = boss.base_speed + (self.level - 1) # Set boss speed based on level
             boss.health = config["boss_health"] # Set boss health from config
             self.enemy_group.add(boss) # Add boss to enemy group
             logger.info("Boss spawned!")
 
 
-    def _boss_actions(self):
+    def _boss_actions(self, dt_ms: float):
         """
         Handles actions specific to BossEnemy units, such as attacking.
+
+        Args:
+            dt_ms: Simulated time elapsed this tick, in milliseconds.
         """
         for enemy in self.enemy_group:
             if isinstance(enemy, BossEnemy): # Check if enemy is a BossEnemy
-                enemy.attack_timer += 1 # Increment boss attack timer
-                if enemy.attack_timer >= 180: # Boss attack interval (every 180 frames)
-                    boss_projectile = BossProjectile(enemy.rect.center) # Create boss projectile
-                    self.boss_projectile_group.add(boss_projectile) # Add to boss projectile group
-                    enemy.attack_timer = 0 # Reset attack timer
+                enemy.attack_timer_ms += dt_ms # Advance boss attack timer
+                if enemy.attack_timer_ms >= self.boss_attack_interval_ms: # Boss attack interval reached
+                    self.sprite_pool.acquire(BossProjectile, enemy.rect.center, groups=(self.boss_projectile_group,)) # Reuse or create boss projectile
+                    enemy.attack_timer_ms = 0 # Reset attack timer
                     logger.debug("Boss fired projectile.")
 
 
-    def _spawn_powerups_over_time(self):
+    def _spawn_powerups_over_time(self, dt_ms: float):
         """
         Spawns power-ups randomly at intervals.
+
+        Args:
+            dt_ms: Simulated time elapsed this tick, in milliseconds.
         """
-        self.powerup_spawn_timer_ms += self.clock.get_time() # Increment power-up spawn timer by elapsed time
+        self.powerup_spawn_timer_ms += dt_ms # Increment power-up spawn timer by elapsed time
         if self.powerup_spawn_timer_ms >= self.powerup_spawn_interval_ms: # Check if spawn interval reached
-            powerup_pos = (random.randint(30, 770), -15) # Spawn power-up at random X near top
-            if random.random() < 0.5:
-                powerup = ShieldPowerUp(powerup_pos) # Spawn ShieldPowerUp (50% chance)
-            else:
-                powerup = PowerUp(powerup_pos) # Spawn regular PowerUp (50% chance)
-            self.powerup_group.add(powerup) # Add power-up to group
+            powerup_pos = (self.rng.randint(30, 770), -15) # Spawn power-up at random X near top
+            powerup_class = ShieldPowerUp if self.rng.random() < 0.5 else PowerUp # Shield or extra life (50% chance each)
+            powerup = self.sprite_pool.acquire(powerup_class, powerup_pos, groups=(self.powerup_group,)) # Reuse or create power-up
             self.powerup_spawn_timer_ms = 0 # Reset power-up timer
             logger.debug(f"Power-up spawned: {type(powerup).__name__} at {powerup_pos}")
 
 
-    def _update_shield_status(self):
+    def _update_shield_status(self, dt_ms: float):
         """
         Updates the shield status based on the shield timer. Deactivates shield when timer runs out.
+
+        Args:
+            dt_ms: Simulated time elapsed this tick, in milliseconds.
         """
         if self.is_shield_active:
-            self.shield_timer_ms -= self.clock.get_time() # Decrement shield timer by elapsed time
+            self.shield_timer_ms -= dt_ms # Decrement shield timer by elapsed time
             if self.shield_timer_ms <= 0:
                 self.is_shield_active = False # Deactivate shield
                 self.shield_timer_ms = 0 # Reset timer
                 logger.debug("Shield deactivated.")
 
 
-    def _update_invulnerability_timer(self):
+    def _update_invulnerability_timer(self, dt_ms: float):
         """
         Updates the player's invulnerability timer. Decrements timer if active.
+
+        Args:
+            dt_ms: Simulated time elapsed this tick, in milliseconds.
         """
         if self.invulnerable_timer_ms > 0:
-            self.invulnerable_timer_ms -= self.clock.get_time() # Decrement invulnerability timer
+            self.invulnerable_timer_ms = max(0, self.invulnerable_timer_ms - dt_ms) # Decrement, stopping at 0 so the "== 0" checks fire
+
+
+    def _prepare_collisions(self):
+        """
+        Chooses how this update's collision handlers find their hits: pygame's pairwise checks for
+        small groups, or the spatial hash, rebuilt at the current positions, once the queried groups
+        hold GRID_MIN_SPRITES sprites or more. Both report the same hits in the same order.
+        """
+        groups = (self.projectile_group, self.enemy_group, self.boss_projectile_group, self.powerup_group)
+        if sum(len(group) for group in groups) < GRID_MIN_SPRITES:
+            self.collisions = self.pairwise_collisions
+            return
+        self.collisions = self.collision_grid
+        self.collision_grid.rebuild(self.enemy_group, self.boss_projectile_group, self.powerup_group) # Index collision targets at their current positions
 
 
     def _handle_projectile_enemy_collisions(self):
@@ -734,14 +808,13 @@ class PlayingState:
         Handles collisions between player projectiles and enemies.
         Reduces enemy health, increases score, spawns explosions, and removes enemies if health is depleted.
         """
-        collisions = pygame.sprite.groupcollide(self.projectile_group, self.enemy_group, True, False) # Detect projectile-enemy collisions
+        collisions = self.collisions.groupcollide(self.projectile_group, self.enemy_group, True, False) # Detect projectile-enemy collisions
         for projectile, enemies in collisions.items():
             for enemy in enemies:
                 if hasattr(enemy, "health"): # Check if enemy has health attribute (BossEnemy, AnimatedEnemy, EnemyUnit)
                     enemy.health -= 1 # Decrease enemy health
                     self.score += 100 # Increase score for hit
-                    explosion = Explosion(enemy.rect.center) # Create explosion at collision point
-                    self.explosion_group.add(explosion) # Add explosion to group
+                    self.sprite_pool.acquire(Explosion, enemy.rect.center, groups=(self.explosion_group,)) # Explosion at collision point
 
                     if enemy.health <= 0: # Check if enemy health is depleted
                         self.score += 500 # Increase score for enemy kill
@@ -749,9 +822,9 @@ class PlayingState:
                         logger.debug(f"{type(enemy).__name__} destroyed. Score +500.")
                 else: # Handle collision for enemies without health (e.g., Drones if they had no health)
                     self.score += 100 # Increase score
-                    explosion = Explosion(enemy.rect.center) # Create explosion
-                    self.explosion_group.add(explosion) # Add explosion
-                    enemy.rect.center = (random.randint(50, 750), random.randint(50, 550)) # Reposition enemy (e.g., Drone respawn)
+                    self.sprite_pool.acquire(Explosion, enemy.rect.center, groups=(self.explosion_group,)) # Create explosion
+                    enemy.rect.center = (self.rng.randint(50, 750), self.rng.randint(50, 550)) # Reposition enemy (e.g., Drone respawn)
+                    self.collisions.update(enemy) # Re-index the moved enemy for the following collision checks
                     logger.debug(f"{type(enemy).__name__} hit (no health). Repositioned.")
 
 
@@ -760,12 +833,12 @@ class PlayingState:
         Handles collisions between boss projectiles and the player soldier.
         Reduces player lives, activates invulnerability, and handles game over if lives reach zero.
         """
-        if pygame.sprite.spritecollideany(self.soldier, self.boss_projectile_group): # Check for soldier-boss projectile collision
+        if self.collisions.spritecollideany(self.soldier, self.boss_projectile_group): # Check for soldier-boss projectile collision
             if self.is_shield_active: # Check if shield is active
                 logger.info("Shield absorbed boss attack!")
                 self.is_shield_active = False # Deactivate shield
                 self.shield_timer_ms = 0 # Reset shield timer
-                pygame.sprite.spritecollide(self.soldier, self.boss_projectile_group, True) # Remove boss projectiles on collision
+                self.collisions.spritecollide(self.soldier, self.boss_projectile_group, True) # Remove boss projectiles on collision
             elif self.invulnerable_timer_ms == 0: # Check if player is not invulnerable
                 self.lives -= 1 # Decrease player lives
                 logger.info(f"Hit by boss projectile! Lives remaining: {self.lives}")
@@ -776,7 +849,7 @@ class PlayingState:
 
                 if self.lives <= 0: # Check for game over
                     logger.info("No lives left! Game Over!")
-                    pygame.mixer.music.stop() # Stop background music
+                    self._stop_music() # Stop background music
                     self.next_state = STATE_GAMEOVER # Transition to game over state
                 else:
                     self.next_state = STATE_PLAYING # Stay in playing state (but player hit)
@@ -789,7 +862,7 @@ class PlayingState:
         Handles collisions between the player soldier and power-ups.
         Activates shield or grants extra life based on power-up type.
         """
-        powerup_hits = pygame.sprite.spritecollide(self.soldier, self.powerup_group, True) # Detect soldier-powerup collisions
+        powerup_hits = self.collisions.spritecollide(self.soldier, self.powerup_group, True) # Detect soldier-powerup collisions
         for powerup in powerup_hits:
             if isinstance(powerup, ShieldPowerUp): # Check if power-up is ShieldPowerUp
                 self.is_shield_active = True # Activate shield
@@ -805,7 +878,7 @@ class PlayingState:
         Handles collisions between regular enemies and the player soldier.
         Reduces player lives, activates invulnerability, and handles game over if lives reach zero.
         """
-        if pygame.sprite.spritecollideany(self.soldier, self.enemy_group): # Check for soldier-enemy collision
+        if self.collisions.spritecollideany(self.soldier, self.enemy_group): # Check for soldier-enemy collision
             if self.is_shield_active: # Check if shield is active
                 logger.info("Shield absorbed enemy damage!")
                 self.is_shield_active = False # Deactivate shield
@@ -820,7 +893,7 @@ class PlayingState:
 
                 if self.lives <= 0: # Check for game over
                     logger.info("No lives left! Game Over!")
-                    pygame.mixer.music.stop() # Stop music
+                    self._stop_music() # Stop music
                     self.next_state = STATE_GAMEOVER # Transition to game over
                 else:
                     self.next_state = STATE_PLAYING # Stay in playing state
@@ -828,53 +901,136 @@ class PlayingState:
             #     self.next_state = STATE_PLAYING # Stay in playing state
 
 
-    def draw(self):
+    def _stop_music(self):
+        """
+        Stops the background music (no-op in headless mode).
+        """
+        if not self.headless:
+            pygame.mixer.music.stop()
+
+
+    def draw(self, alpha: float = 1.0):
         """
         Draws all elements of the PlayingState: background, structures, sprites, UI, and boss health bars.
+        Only draws onto self.screen; presenting the frame is up to the caller.
+
+        With dirty-rect rendering enabled only the changed regions are redrawn and self.dirty_rects
+        holds the rectangles to pass to pygame.display.update(); otherwise it is None and the whole
+        screen has to be flipped.
+
+        Args:
+            alpha: Fraction of a simulation tick elapsed since the last update, used to interpolate
+                   moving sprites between their previous and current positions (1.0 = no interpolation).
         """
+        if self.dirty_renderer is not None:
+            self.dirty_rects = self.dirty_renderer.render(self, alpha) # Static layer is cached, only changes are redrawn
+            return
+
         self.parallax_background.draw() # Draw parallax background
         self.structure_group.draw(self.screen) # Draw level structures
-        self.soldier_group.draw(self.screen) # Draw player soldier
-        self.enemy_group.draw(self.screen) # Draw enemies
-        self.projectile_group.draw(self.screen) # Draw player projectiles
-        self.boss_projectile_group.draw(self.screen) # Draw boss projectiles
-        self.powerup_group.draw(self.screen) # Draw power-ups
-        self.explosion_group.draw(self.screen) # Draw explosions
-        self.drone_group.draw(self.screen) # Draw drones
-
+        self._draw_sprites(alpha) # Draw the sprite groups
         self._draw_ui() # Draw score, level, lives
-        self._draw_shield_indicator() # Draw shield visual indicator if active
-        self._draw_boss_health_bars() # Draw boss health bars
+        self._draw_overlays() # Draw shield indicator and boss health bars
+        self.dirty_rects = None # Whole screen changed
+
+
+    def _draw_sprites(self, alpha: float):
+        """
+        Draws every sprite layer onto the screen, moving sprites interpolated between ticks.
+
+        Args:
+            alpha: Fraction of a simulation tick elapsed since the last update.
+        """
+        for group, interpolate in self._sprite_layers():
+            if interpolate:
+                draw_interpolated(group, self.screen, alpha) # Draw moving sprites between ticks
+            else:
+                group.draw(self.screen) # Draw at the current rect
+
+
+    def on_resume(self):
+        """
+        Called by the StateManager when this state becomes active again after a pushed state was popped.
+        The screen was drawn over in the meantime, so the next frame must be redrawn in full.
+        """
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.invalidate()
+
+
+    def _sprite_layers(self) -> list[tuple[pygame.sprite.AbstractGroup, bool]]:
+        """
+        Returns the sprite groups in draw order, each with a flag telling whether it is drawn interpolated.
+        """
+        return [
+            (self.soldier_group, True), # Player soldier
+            (self.enemy_group, True), # Enemies
+            (self.projectile_group, True), # Player projectiles
+            (self.boss_projectile_group, True), # Boss projectiles
+            (self.powerup_group, True), # Power-ups
+            (self.explosion_group, False), # Explosions (not moving, drawn at their rect)
+            (self.drone_group, True), # Drones
+        ]
+
+
+    def _hud_items(self) -> list[tuple[str, pygame.Surface, pygame.Rect]]:
+        """
+        Renders the score, level, and lives UI elements.
+
+        Returns:
+            A list of (text, surface, rect) tuples, one per UI element, positioned on the screen.
+        """
+        screen_width = self.screen.get_width()
+        items = []
+        for text, anchor in ((f"Score: {self.score}", "topleft"), # Score top-left
+                             (f"Level: {self.level}", "midtop"), # Level centered
+                             (f"Lives: {self.lives}", "topright")): # Lives top-right
+            surface = render_text(self.font, text, True, (0, 0, 0)) # Render UI text
+            position = {"topleft": (10, 10), "midtop": (screen_width // 2, 10), "topright": (screen_width - 10, 10)}[anchor]
+            items.append((text, surface, surface.get_rect(**{anchor: position})))
+        return items
 
 
     def _draw_ui(self):
         """
         Draws the score, level, and lives UI elements on the screen.
         """
-        score_text_surface = self.font.render(f"Score: {self.score}", True, (0, 0, 0)) # Render score text
-        level_text_surface = self.font.render(f"Level: {self.level}", True, (0, 0, 0)) # Render level text
-        lives_text_surface = self.font.render(f"Lives: {self.lives}", True, (0, 0, 0)) # Render lives text
+        for _, surface, rect in self._hud_items():
+            self.screen.blit(surface, rect)
+
+
+    def _draw_overlays(self) -> list[pygame.Rect]:
+        """
+        Draws the shield indicator and boss health bars on top of everything else.
 
-        self.screen.blit(score_text_surface, (10, 10)) # Position score top-left
-        self.screen.blit(level_text_surface, (self.screen.get_width() // 2 - level_text_surface.get_width() // 2, 10)) # Center level
-        self.screen.blit(lives_text_surface, (self.screen.get_width() - lives_text_surface.get_width() - 10, 10)) # Position lives top-right
+        Returns:
+            The screen rectangles that were drawn on.
+        """
+        return self._draw_shield_indicator() + self._draw_boss_health_bars()
 
 
-    def _draw_shield_indicator(self):
+    def _draw_shield_indicator(self) -> list[pygame.Rect]:
         """
         Draws a visual indicator (circle) around the player soldier when the shield is active.
+
+        Returns:
+            The rectangle covered by the indicator, or an empty list if the shield is not active.
         """
         if self.is_shield_active:
             shield_color = (0, 255, 255) # Cyan color for shield
             shield_radius = 35
             shield_border_width = 3
-            pygame.draw.circle(self.screen, shield_color, self.soldier.rect.center, shield_radius, shield_border_width) # Draw shield circle
+            return [pygame.draw.circle(self.screen, shield_color, self.soldier.rect.center, shield_radius, shield_border_width)] # Draw shield circle
+        return []
 
 
-    def _draw_boss_health_bars(self):
+    def _draw_boss_health_bars(self) -> list[pygame.Rect]:
         """
         Draws health bars above BossEnemy sprites.
+
+        Returns:
+            The rectangles covered by the health bars.
         """
+        rects = []
         for enemy in self.enemy_group:
             if isinstance(enemy, BossEnemy): # Check if enemy is BossEnemy
                 bar_width = enemy.rect.width # Health bar width matches enemy width
@@ -884,17 +1040,14 @@ class PlayingState:
                 health_bar_rect = pygame.Rect(enemy.rect.left, enemy.rect.top - 10, health_bar_width, bar_height) # Health bar rect (above enemy)
                 border_rect = pygame.Rect(enemy.rect.left, enemy.rect.top - 10, bar_width, bar_height) # Border rect
                 pygame.draw.rect(self.screen, (0, 255, 0), health_bar_rect) # Draw filled health bar (green)
-                pygame.draw.rect(self.screen, (255, 255, 255), border_rect, 1) # Draw health bar border (white)
-
-
-        pygame.display.flip() # Update display
-        self.clock.tick(60) # Limit FPS
+                rects.append(pygame.draw.rect(self.screen, (255, 255, 255), border_rect, 1)) # Draw health bar border (white)
+        return rects
 
 
 # ------------------------------
 # PauseState
 # ------------------------------
-class PauseState:
+class PauseState(StaticFrame):
     """
     State for pausing the game.
     """
@@ -907,13 +1060,12 @@ class PauseState:
             playing_state: Reference to the PlayingState to return to.
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
         self.playing_state = playing_state # Store PlayingState reference
-        self.font_large = pygame.font.Font(None, 74) # Large font for "Paused"
-        self.font_small = pygame.font.Font(None, 36) # Small font for instructions
-        self.pause_text_surface = self.font_large.render("Paused", True, (255, 255, 255)) # Render "Paused" text
+        self.font_large = get_font(None, 74) # Large font for "Paused"
+        self.font_small = get_font(None, 36) # Small font for instructions
+        self.pause_text_surface = render_text(self.font_large, "Paused", True, (255, 255, 255)) # Render "Paused" text
         self.pause_rect = self.pause_text_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 - 50)) # Position "Paused"
-        self.instruction_surface = self.font_small.render("Press P to Resume", True, (255, 255, 255)) # Render instruction
+        self.instruction_surface = render_text(self.font_small, "Press P to Resume", True, (255, 255, 255)) # Render instruction
         self.instruction_rect = self.instruction_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 50)) # Position instruction
         logger.debug("PauseState initialized.")
 
@@ -945,21 +1097,19 @@ class PauseState:
         """
         pass # No updates needed in pause state
 
-    def draw(self):
+    def render(self, surface: pygame.Surface):
         """
         Draws the pause screen with "Paused" text and instructions.
         """
-        self.screen.fill((0, 0, 0)) # Black background
-        self.screen.blit(self.pause_text_surface, self.pause_rect) # Draw "Paused" text
-        self.screen.blit(self.instruction_surface, self.instruction_rect) # Draw instructions
-        pygame.display.flip() # Update display
-        self.clock.tick(60) # Limit FPS
+        surface.fill((0, 0, 0)) # Black background
+        surface.blit(self.pause_text_surface, self.pause_rect) # Draw "Paused" text
+        surface.blit(self.instruction_surface, self.instruction_rect) # Draw instructions
 
 
 # ------------------------------
 # GameOverState
 # ------------------------------
-class GameOverState:
+class GameOverState(StaticFrame):
     """
     State for the game over screen, displaying the final score and high score.
     """
@@ -972,13 +1122,12 @@ class GameOverState:
             final_score: The player's final score in the game.
         """
         self.screen = screen
-        self.clock = pygame.time.Clock()
         self.final_score = final_score # Store final score
-        self.font_large = pygame.font.Font(None, 74) # Large font for "Game Over"
-        self.font_small = pygame.font.Font(None, 36) # Small font for score and instructions
-        self.gameover_text_surface = self.font_large.render("Game Over", True, (255, 255, 255)) # Render "Game Over"
+        self.font_large = get_font(None, 74) # Large font for "Game Over"
+        self.font_small = get_font(None, 36) # Small font for score and instructions
+        self.gameover_text_surface = render_text(self.font_large, "Game Over", True, (255, 255, 255)) # Render "Game Over"
         self.gameover_rect = self.gameover_text_surface.get_rect(center=(self.screen.get_width() // 2, 150)) # Position "Game Over"
-        self.score_surface = self.font_small.render(f"Final Score: {final_score}", True, (255, 255, 255)) # Render score
+        self.score_surface = render_text(self.font_small, f"Final Score: {final_score}", True, (255, 255, 255)) # Render score
         self.score_rect = self.score_surface.get_rect(center=(self.screen.get_width() // 2, 250)) # Position score
 
         high_score = load_high_score() # Load high score from file
@@ -986,9 +1135,9 @@ class GameOverState:
             save_high_score(final_score) # Save new high score if current score is higher
             high_score = final_score # Update high_score to the new value
 
-        self.high_score_surface = self.font_small.render(f"High Score: {high_score}", True, (255, 255, 255)) # Render high score
+        self.high_score_surface = render_text(self.font_small, f"High Score: {high_score}", True, (255, 255, 255)) # Render high score
         self.high_score_rect = self.high_score_surface.get_rect(center=(self.screen.get_width() // 2, 320)) # Position high score
-        self.instruction_surface = self.font_small.render("Press R to Restart or M for Menu", True, (255, 255, 255)) # Instructions
+        self.instruction_surface = render_text(self.font_small, "Press R to Restart or M for Menu", True, (255, 255, 255)) # Instructions
         self.instruction_rect = self.instruction_surface.get_rect(center=(self.screen.get_width() // 2, 400)) # Instruction position
         logger.debug(f"GameOverState initialized. Final Score: {final_score}, High Score: {high_score}")
 
@@ -1023,14 +1172,12 @@ class GameOverState:
         """
         pass # No updates needed in game over state
 
-    def draw(self):
+    def render(self, surface: pygame.Surface):
         """
         Draws the game over screen with "Game Over" text, final score, high score, and instructions.
         """
-        self.screen.fill((0, 0, 0)) # Black background
-        self.screen.blit(self.gameover_text_surface, self.gameover_rect) # Draw "Game Over"
-        self.screen.blit(self.score_surface, self.score_rect) # Draw final score
-        self.screen.blit(self.high_score_surface, self.high_score_rect) # Draw high score
-        self.screen.blit(self.instruction_surface, self.instruction_rect) # Draw instructions
-        pygame.display.flip() # Update display
-        self.clock.tick(60) # Limit FPS
\ No newline at end of file
+        surface.fill((0, 0, 0)) # Black background
+        surface.blit(self.gameover_text_surface, self.gameover_rect) # Draw "Game Over"
+        surface.blit(self.score_surface, self.score_rect) # Draw final score
+        surface.blit(self.high_score_surface, self.high_score_rect) # Draw high score
+        surface.blit(self.instruction_surface, self.instruction_rect) # Draw instructions
\ No newline at end of file
@@ -0,0 +1,48 @@
+# static_frame.py
+"""
+Frame caching for states whose picture only changes on input (menus, pause and game over screens).
+
+A state mixing in StaticFrame implements render(surface) instead of draw() and calls
+invalidate() whenever something it renders changes, e.g. the selected option. draw() then
+renders into a cached frame surface only when that frame is stale and otherwise just blits it.
+
+The class attribute static_frame tells the main loop that the screen cannot change without an
+event: once such a state's frame is presented, the loop sleeps in pygame.event.wait() instead
+of redrawing the same picture at full frame rate.
+"""
+import abc
+
+import pygame
+
+
+class StaticFrame(abc.ABC):
+    """
+    Mixin for states that render a cached frame. The state must have a `screen` attribute.
+    """
+    static_frame = True # The main loop may idle while this state is shown
+    _frame = None # Cached frame surface, None when stale
+
+    @abc.abstractmethod
+    def render(self, surface: pygame.Surface):
+        """
+        Draws the complete frame onto a surface the size of the screen.
+        """
+
+    def invalidate(self):
+        """
+        Marks the cached frame stale, so the next draw() renders it again.
+        """
+        self._frame = None
+
+    def draw(self):
+        """
+        Blits the cached frame to the screen, rendering it first if it is stale.
+        """
+        frame = self._frame
+        if frame is None or frame.get_size() != self.screen.get_size(): # Stale, or the display mode changed
+            frame = pygame.Surface(self.screen.get_size())
+            if pygame.display.get_surface() is not None:
+                frame = frame.convert() # Display format blits fastest
+            self.render(frame)
+            self._frame = frame
+        self.screen.blit(frame, (0, 0))
@@ -1,15 +1,85 @@
 # ui_helpers.py
+"""
+Drawing helpers shared by the menu, journal and dialogue screens.
+
+Gradient panels are built once per (size, colors, direction) and kept in a small LRU cache, so
+screens that redraw the same panel every frame only pay for a blit. A new gradient is computed
+as a one pixel wide strip with asset_effects.vertical_gradient() and scaled up.
+"""
+from collections import OrderedDict
+
 import pygame
 
+from asset_effects import vertical_gradient
+
+GRADIENT_CACHE_SIZE = 16 # Maximum number of gradient surfaces kept
+VERTICAL = "vertical" # Top to bottom
+HORIZONTAL = "horizontal" # Left to right
+_gradient_cache = OrderedDict() # (size, color_start, color_end, direction) -> Surface, least recently used first
+_gradient_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _build_gradient(size, color_start, color_end, direction):
+    """
+    Creates a gradient surface. Only a one pixel wide strip is computed (by the same code as the
+    generated assets' gradients); scaling it up repeats it across the surface.
+    """
+    width, height = size
+    if direction == VERTICAL:
+        strip = vertical_gradient((1, height), color_start, color_end)
+    else:
+        strip = pygame.transform.rotate(vertical_gradient((1, width), color_start, color_end), 90) # First row ends up on the left
+    if pygame.display.get_surface() is not None:
+        strip = strip.convert() # Display format blits fastest; the scaled surface inherits it
+    return pygame.transform.scale(strip, size) # Nearest neighbour: every row (column) is one strip pixel
+
+
+def gradient_surface(size, color_start, color_end, direction=VERTICAL):
+    """
+    Returns a surface filled with a linear gradient, from the cache when it was built before.
+
+    The surface is shared by every caller asking for the same gradient: blit it, and draw
+    borders or text on the target instead of on the gradient itself.
+
+    Args:
+        size:        (width, height) of the surface.
+        color_start: RGB color of the first row (or column).
+        color_end:   RGB color the gradient runs towards at the bottom (or right).
+        direction:   VERTICAL or HORIZONTAL.
+
+    Returns:
+        The gradient surface.
+    """
+    if direction not in (VERTICAL, HORIZONTAL):
+        raise ValueError(f"Unknown gradient direction {direction!r}")
+    key = (tuple(size), tuple(color_start[:3]), tuple(color_end[:3]), direction)
+    surface = _gradient_cache.get(key)
+    if surface is not None:
+        _gradient_cache.move_to_end(key) # Mark as most recently used
+        _gradient_cache_stats["hits"] += 1
+        return surface
+    _gradient_cache_stats["misses"] += 1
+    surface = _gradient_cache[key] = _build_gradient(key[0], key[1], key[2], direction)
+    if len(_gradient_cache) > GRADIENT_CACHE_SIZE:
+        _gradient_cache.popitem(last=False)
+        _gradient_cache_stats["evictions"] += 1
+    return surface
+
+
+def gradient_cache_stats():
+    """
+    Returns a copy of the gradient cache counters ("hits", "misses", "evictions") and its "size".
+    """
+    return {**_gradient_cache_stats, "size": len(_gradient_cache)}
+
+
+def clear_gradient_cache():
+    """
+    Drops every cached gradient.
+    """
+    _gradient_cache.clear()
+
+
 def draw_vertical_gradient(surface, color_top, color_bottom):
     """Draws a vertical gradient over the entire surface."""
-    height = surface.get_height()
-    width = surface.get_width()
-    for y in range(height):
-        ratio = y / height
-        color = (
-            int(color_top[0] * (1 - ratio) + color_bottom[0] * ratio),
-            int(color_top[1] * (1 - ratio) + color_bottom[1] * ratio),
-            int(color_top[2] * (1 - ratio) + color_bottom[2] * ratio)
-        )
-        pygame.draw.line(surface, color, (0, y), (width, y))
+    surface.blit(gradient_surface(surface.get_size(), color_top, color_bottom), (0, 0))